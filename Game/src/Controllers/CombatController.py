@@ -52,14 +52,15 @@ class CombatController(BaseController):
     def handle_input(self, event):
         try:
             if event.type == pygame.KEYDOWN:
-                Logger.debug("CombatController.handle_input", "Key pressed", key=pygame.key.name(event.key), is_player_turn=self.combat.isPlayerTurn(), action_delay=self.action_delay)
+                if Logger.is_enabled(Logger.TRACE, "CombatController.handle_input"):
+                    Logger.trace("CombatController.handle_input", "Key pressed", key=pygame.key.name(event.key), is_player_turn=self.combat.isPlayerTurn(), action_delay=self.action_delay)
                 
                 if not self.combat.isPlayerTurn():
-                    Logger.debug("CombatController.handle_input", "Not player turn, ignoring input")
+                    Logger.trace("CombatController.handle_input", "Not player turn, ignoring input")
                     return
                 
                 if self.action_delay > 0:
-                    Logger.debug("CombatController.handle_input", "Action delay active, ignoring input", delay=self.action_delay)
+                    Logger.trace("CombatController.handle_input", "Action delay active, ignoring input", delay=self.action_delay)
                     return
                 
                 if event.key == pygame.K_a:
@@ -1,7 +1,13 @@
 
 
+import os
 from enum import Enum
 from Utils.Logger import Logger
+from Utils.AssetManager import AssetManager
+from Utils.AssetPreloader import AssetPreloader
+from Utils.SpriteAtlas import SpriteAtlas
+from Models.MapModel import MapModel
+from Songs import SevenNationArmy, AnotherOneBitesTheDust, TheFinalCountdown
 
 
 class GameStage(Enum):
@@ -97,20 +103,83 @@ class GameSequenceController:
     
 
     
-    def get_next_view(self):
+    STAGE_CONFIG = {
+        1: {"view_type": "RhythmPageView", "song": "seven_nation_army", "background": "Game/Assets/barconcert.png"},
+        2: {"view_type": "MapPageView", "map_act": 1, "map_file": "Game/Assets/maps/map.tmx"},
+        3: {"view_type": "Act1View", "boss": "Gros Bill"},
+        4: {"view_type": "MapPageView", "map_act": 2, "map_file": "Game/Assets/maps/map.tmx"},
+        5: {"view_type": "Act2View", "boss": "Chef de la Sécurité"},
+        6: {"view_type": "RhythmPageView", "song": "another_one", "background": "Game/Assets/woodstock.png"},
+        7: {"view_type": "MapPageView", "map_act": 3, "map_file": "Game/Assets/maps/map.tmx"},
+        8: {"view_type": "RhythmCombatView", "song": "final_countdown", "boss": "Manager Corrompu"}
+    }
+
+    FAIL_SOUNDS = [f"Game/Assets/Sounds/fail{i}.ogg" for i in range(1, 6)]
+
+    def get_next_view(self, stage=None):
        
 
-        stage_config = {
-            1: {"view_type": "RhythmPageView"},
-            2: {"view_type": "MapPageView", "map_act": 1},
-            3: {"view_type": "Act1View"},
-            4: {"view_type": "MapPageView", "map_act": 2},
-            5: {"view_type": "Act2View"},
-            6: {"view_type": "RhythmPageView"},
-            7: {"view_type": "MapPageView", "map_act": 3},
-            8: {"view_type": "RhythmCombatView"}
+        if stage is None:
+            stage = self.current_stage
+        return dict(self.STAGE_CONFIG.get(stage, {"view_type": "Unknown"}))
+
+    def _get_guitar_stem(self, song_name):
+
+        # Only the guitar stem is decoded up front: the backing stem is
+        # streamed by StreamedStem when the scene starts. The path is a
+        # module constant, so no note chart is built for it.
+        songs = {
+            "seven_nation_army": SevenNationArmy,
+            "another_one": AnotherOneBitesTheDust,
+            "final_countdown": TheFinalCountdown,
         }
-        return stage_config.get(self.current_stage, {"view_type": "Unknown"})
+        return songs[song_name].GUITAR_STEM
+
+    def preload_stage(self, stage, screen_size):
+        
+        # Queues the heavy part of the stage's view constructor (songs, map,
+        # background, character sheets) on the AssetPreloader worker. The
+        # worker only reads and decodes: anything that needs the display
+        # (convert, the map's tilesets) is finished by the view on the main
+        # thread when it takes the result.
+        try:
+            config = self.get_next_view(stage)
+            if config["view_type"] == "Unknown":
+                return False
+
+            AssetPreloader.clear()
+
+            if "song" in config:
+                AssetManager.prewarm_sounds([self._get_guitar_stem(config["song"])] + self.FAIL_SOUNDS)
+
+            if "map_file" in config:
+                AssetPreloader.submit(("map", config["map_file"]), MapModel.loadParsed, config["map_file"])
+                AssetPreloader.submit(("atlas", "map"), SpriteAtlas.preload, (64, 64))
+            else:
+                AssetPreloader.submit(("atlas", "stage"), SpriteAtlas.preload, (200, 200))
+
+            background = config.get("background")
+            if "boss" in config:
+                boss_config = AssetManager.shared().get_boss_by_name(config["boss"]) or {}
+                mode = "rhythm_combat" if config["view_type"] == "RhythmCombatView" else "combat"
+                background = boss_config.get("backgrounds", {}).get(mode, background)
+            if background:
+                size = (int(screen_size[0]), int(screen_size[1]))
+                key = ("surface", os.path.normpath(background), size, "convert")
+                AssetPreloader.submit(key, AssetManager.decode_surface, background, size, "convert")
+
+            Logger.debug("GameSequenceController.preload_stage", "Stage assets queued",
+                       stage=stage, view_type=config["view_type"])
+            return True
+        except Exception as e:
+            Logger.error("GameSequenceController.preload_stage", e)
+            return False
+
+    def preload_next_stage(self, screen_size):
+        
+        if self.is_last_stage():
+            return False
+        return self.preload_stage(self.current_stage + 1, screen_size)
     
     def is_last_stage(self):
         
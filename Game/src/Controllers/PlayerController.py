@@ -130,7 +130,7 @@ class PlayerController(BaseController):
                 if not collided_x:
                     resolved_x = new_x
                 else:
-                    Logger.debug("PlayerController.handle_events", "Collision on X axis prevented movement")
+                    Logger.trace("PlayerController.handle_events", "Collision on X axis prevented movement")
             except Exception as e:
                 Logger.error("PlayerController.collision_x", e)
 
@@ -141,19 +141,20 @@ class PlayerController(BaseController):
                 if not collided_y:
                     resolved_y = new_y
                 else:
-                    Logger.debug("PlayerController.handle_events", "Collision on Y axis prevented movement")
+                    Logger.trace("PlayerController.handle_events", "Collision on Y axis prevented movement")
             except Exception as e:
                 Logger.error("PlayerController.collision_y", e)
 
             try:
                 self.player.setX(resolved_x)
                 self.player.setY(resolved_y)
-                Logger.debug(
-                    "PlayerController.handle_events",
-                    "Player moved",
-                    x=self.player.getX(),
-                    y=self.player.getY(),
-                )
+                if Logger.is_enabled(Logger.TRACE, "PlayerController.handle_events"):
+                    Logger.trace(
+                        "PlayerController.handle_events",
+                        "Player moved",
+                        x=self.player.getX(),
+                        y=self.player.getY(),
+                    )
             except Exception as e:
                 Logger.error("PlayerController.handle_events", e)
         except Exception as e:
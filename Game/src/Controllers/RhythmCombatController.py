@@ -2,6 +2,11 @@ import pygame
 import random
 import math
 from Songs.TheFinalCountdown import load_final_countdown
+from Models.NoteChartModel import NoteChartModel
+from Utils.AssetManager import AssetManager
+from Utils.SongClock import SongClock
+from Utils.StreamedStem import StreamedStem
+from Utils.LatencyCalibration import LatencyCalibration
 
 class RhythmCombatController:
    
@@ -20,31 +25,39 @@ class RhythmCombatController:
         
         self.current_song = song_loader
         self.rhythm.notes = self.current_song.get_notes()
+        self.chart = NoteChartModel(self.rhythm.notes, self.rhythm.lanes)
+        self.rhythm.chart = self.chart
         
         for note in self.rhythm.notes:
-            note["y"] = -1000
+            note.y = NoteChartModel.OFFSCREEN_Y
         
         pygame.mixer.init()
         
 
-        self.track_guitar = pygame.mixer.Sound(self.current_song.audio_guitar)
-        self.track_backing = pygame.mixer.Sound(self.current_song.audio_backing)
+        # The backing stem streams; the guitar needs its own channel for the
+        # miss mute, so it is still decoded, on the preloader worker while
+        # the countdown runs (start_music finds it in the sound bank).
+        self.track_backing = StreamedStem(self.current_song.audio_backing)
+        self.track_guitar = None
         
 
         self.guitar_channel = pygame.mixer.Channel(1)
-        self.track_guitar.set_volume(1.0)
-        self.track_backing.set_volume(1.0)
 
+        # Banked Sounds are shared with other scenes, so volumes are set on
+        # the channel each clip plays on, never on the Sound itself.
+        self.fail_volume = 0.6
         self.fail_sounds = []
         self.hit_sounds = []
         
         try:
             for i in range(1, 6):
-                fail = pygame.mixer.Sound(f"Game/Assets/Sounds/fail{i}.ogg")
-                fail.set_volume(0.6)
+                fail = self._load_sound(f"Game/Assets/Sounds/fail{i}.ogg")
                 self.fail_sounds.append(fail)
         except FileNotFoundError:
             pass
+
+        # Queued after the clips above: SDL_mixer decodes one Sound at a time.
+        AssetManager.prewarm_sounds([self.current_song.audio_guitar])
         
        
         self.note_speed = 0.5
@@ -56,7 +69,11 @@ class RhythmCombatController:
         self.current_countdown_val = 5
         self.is_paused = False  
 
-        self.start_time = 0
+        # Judgments run on the song as heard (audio offset); notes are
+        # drawn ahead by the display lag so they cross the line on the beat.
+        self.song_clock = SongClock(position_source=self.track_backing.get_pos,
+                                    offset_ms=LatencyCalibration.audio_offset_ms)
+        self.visual_offset_ms = LatencyCalibration.visual_offset_ms
         self.is_playing = False
         self.game_over = False
         self.victory = False  
@@ -73,7 +90,7 @@ class RhythmCombatController:
             pygame.K_n: "LANE4"
         }
         
-        self.total_notes = len([n for n in self.rhythm.notes if n.get("active", True)])
+        self.total_notes = len([n for n in self.rhythm.notes if n.active])
         self.notes_hit = 0
         self.notes_missed = 0
         
@@ -85,17 +102,24 @@ class RhythmCombatController:
 
 
 
+    def _load_sound(self, path):
+        return AssetManager.load_sound(path)
+
     def play_random_fail(self):
         if self.fail_sounds:
             sound = random.choice(self.fail_sounds)
-            sound.play()
+            channel = sound.play()
+            if channel is not None:
+                channel.set_volume(self.fail_volume)
     
 
     def play_random_hit(self):
 
         if self.hit_sounds:
             sound = random.choice(self.hit_sounds)
-            sound.play()
+            channel = sound.play()
+            if channel is not None:
+                channel.set_volume(1.0)
 
 
 
@@ -103,7 +127,8 @@ class RhythmCombatController:
         try:
             self.guitar_channel.stop()
             self.track_backing.stop()
-            self.track_guitar.stop()
+            if self.track_guitar:
+                self.track_guitar.stop()
 
             for sound in self.fail_sounds:
                 sound.stop()
@@ -141,9 +166,13 @@ class RhythmCombatController:
     def start_music(self):
 
 
-        self.start_time = pygame.time.get_ticks()
+        if self.track_guitar is None:
+            self.track_guitar = self._load_sound(self.current_song.audio_guitar)
+        # A fail clip may have left its volume on this channel while it was free.
+        self.guitar_channel.set_volume(1.0)
         self.track_backing.play()
         self.guitar_channel.play(self.track_guitar)
+        self.song_clock.start()
         self.is_playing = True
         print("Musique lancée - LE COMBAT COMMENCE !")
 
@@ -176,26 +205,27 @@ class RhythmCombatController:
         if not self.is_playing:
             self.start_music()
 
-        current_time = pygame.time.get_ticks() - self.start_time
+        current_time = self.song_clock.now()
+        draw_time = current_time + self.visual_offset_ms
 
         if self.rhythm.feedback_timer > 0:
             self.rhythm.feedback_timer -= 1
         else:
             self.rhythm.feedback = ""
 
-        notes_remaining = False
-        for note in self.rhythm.notes:
-            if note["active"]:
-                notes_remaining = True
-                time_diff = note["time"] - current_time
-                note["y"] = self.rhythm.hit_line_y - (time_diff * self.note_speed)
+        start, end = self.chart.update_window(draw_time, self.rhythm.hit_line_y, self.note_speed)
+        for note in self.rhythm.notes[start:end]:
+            if note.active:
+                time_diff = note.time - draw_time
+                note.y = self.rhythm.hit_line_y - (time_diff * self.note_speed)
 
 
-                if note["y"] > self.rhythm.hit_line_y + 100:
-                    note["active"] = False
+                # Missed 100 px past the line on the judge's clock, not the drawn one.
+                if (current_time - note.time) * self.note_speed > 100:
+                    note.active = False
                     self.trigger_miss()
         
-        if not notes_remaining and self.is_playing:
+        if not self.chart.has_active_notes() and self.is_playing:
             self.end_combat()
 
 
@@ -252,12 +282,15 @@ class RhythmCombatController:
         if event.type == pygame.KEYDOWN:
             if event.key in self.key_map:
                 lane = self.key_map[event.key]
-                self.check_hit(lane)
+                self.check_hit(lane, getattr(event, "timestamp_ns", None))
 
 
-    def check_hit(self, lane):
+    def check_hit(self, lane, timestamp_ns=None):
 
-        current_time = pygame.time.get_ticks() - self.start_time
+        if timestamp_ns is None:
+            current_time = self.song_clock.now()
+        else:
+            current_time = self.song_clock.position_at(timestamp_ns)
         
         perfect_window = 50
         excellent_window = 100
@@ -266,21 +299,11 @@ class RhythmCombatController:
         miss_window = 250
         
         hit_found = False
-        best_note = None
-        best_distance = float('inf')
-
-
-        for note in self.rhythm.notes:
-            if note["active"] and note["lane"] == lane:
-                time_diff = abs(note["time"] - current_time)
-                
-                if time_diff < best_distance and time_diff < miss_window:
-                    best_distance = time_diff
-                    best_note = note
+        best_note, best_distance = self.chart.find_closest(lane, current_time, miss_window)
         
         if best_note:
             hit_found = True
-            best_note["active"] = False
+            best_note.active = False
             self.notes_hit += 1
             self.rhythm.total_hits = self.notes_hit
             
@@ -312,7 +335,7 @@ class RhythmCombatController:
                 
             else:
                 base_damage = 2  
-                feedback = "LATE!" if (best_note["time"] - current_time) < 0 else "EARLY!"
+                feedback = "LATE!" if (best_note.time - current_time) < 0 else "EARLY!"
             
             
             
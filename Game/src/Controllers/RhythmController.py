@@ -2,6 +2,11 @@ import pygame
 import random
 import math
 from Songs.SevenNationArmy import load_seven_nation_army
+from Models.NoteChartModel import NoteChartModel
+from Utils.AssetManager import AssetManager
+from Utils.SongClock import SongClock
+from Utils.StreamedStem import StreamedStem
+from Utils.LatencyCalibration import LatencyCalibration
 
 
 
@@ -20,27 +25,35 @@ class RhythmController:
       
         self.current_song = song_data
         self.rhythm.notes = self.current_song.get_notes()
+        self.chart = NoteChartModel(self.rhythm.notes, self.rhythm.lanes)
+        self.rhythm.chart = self.chart
         
         pygame.mixer.init()
         
     
-        self.track_guitar = pygame.mixer.Sound(self.current_song.audio_guitar)
-        self.track_backing = pygame.mixer.Sound(self.current_song.audio_backing)
+        # The backing stem streams; the guitar needs its own channel for the
+        # miss mute, so it is still decoded, on the preloader worker while
+        # the countdown runs (startMusic finds it in the sound bank).
+        self.track_backing = StreamedStem(self.current_song.audio_backing)
+        self.track_guitar = None
         
  
         self.guitar_channel = pygame.mixer.Channel(1)
-        self.track_guitar.set_volume(1.0)
-        self.track_backing.set_volume(1.0)
 
       
+        # Banked Sounds are shared with other scenes, so volumes are set on
+        # the channel each clip plays on, never on the Sound itself.
+        self.fail_volume = 0.6
         self.fail_sounds = []
         try:
             for i in range(1, 6):
-                sound = pygame.mixer.Sound(f"Game/Assets/Sounds/fail{i}.ogg")
-                sound.set_volume(0.6)
+                sound = self._load_sound(f"Game/Assets/Sounds/fail{i}.ogg")
                 self.fail_sounds.append(sound)
         except FileNotFoundError:
-            pass 
+            pass
+
+        # Queued after the clips above: SDL_mixer decodes one Sound at a time.
+        AssetManager.prewarm_sounds([self.current_song.audio_guitar])
 
         self.note_speed = 0.5 
         
@@ -49,7 +62,11 @@ class RhythmController:
         self.countdown_start_tick = pygame.time.get_ticks()
         self.current_countdown_val = 5
 
-        self.start_time = 0
+        # Judgments run on the song as heard (audio offset); notes are
+        # drawn ahead by the display lag so they cross the line on the beat.
+        self.song_clock = SongClock(position_source=self.track_backing.get_pos,
+                                    offset_ms=LatencyCalibration.audio_offset_ms)
+        self.visual_offset_ms = LatencyCalibration.visual_offset_ms
         self.is_playing = False
         self.is_paused = False  
         self.game_over = False
@@ -60,7 +77,6 @@ class RhythmController:
         self.continue_pressed = False  
         
         self.is_paused = False
-        self.pause_time = 0  
         self.pause_music_position = 0  
         
         self.last_hit_time = -1000 
@@ -75,14 +91,19 @@ class RhythmController:
         }
         
         for note in self.rhythm.notes:
-            note["y"] = self.rhythm.hit_line_y
+            note.y = NoteChartModel.OFFSCREEN_Y
+
 
 
+    def _load_sound(self, path):
+        return AssetManager.load_sound(path)
 
     def playRandomFail(self):
         if self.fail_sounds:
             sound = random.choice(self.fail_sounds)
-            sound.play()
+            channel = sound.play()
+            if channel is not None:
+                channel.set_volume(self.fail_volume)
 
 
     def stop_all_audio(self):
@@ -90,7 +111,8 @@ class RhythmController:
         try:
             self.guitar_channel.stop()
             self.track_backing.stop()
-            self.track_guitar.stop()
+            if self.track_guitar:
+                self.track_guitar.stop()
            
             for sound in self.fail_sounds:
                 sound.stop()
@@ -122,9 +144,13 @@ class RhythmController:
             print(f"Erreur en reprenant les audios: {e}")
 
     def startMusic(self):
-        self.start_time = pygame.time.get_ticks()
+        if self.track_guitar is None:
+            self.track_guitar = self._load_sound(self.current_song.audio_guitar)
+        # A fail clip may have left its volume on this channel while it was free.
+        self.guitar_channel.set_volume(1.0)
         self.track_backing.play()
         self.guitar_channel.play(self.track_guitar)
+        self.song_clock.start()
         self.is_playing = True
 
 
@@ -149,8 +175,8 @@ class RhythmController:
                 self.waiting_to_start = False
                 
                 pygame.mixer.unpause()
-                pause_duration = pygame.time.get_ticks() - self.pause_time
-                self.start_time += pause_duration  
+                self.track_backing.unpause()
+                self.song_clock.resume()
                 print("Reprise!")
             return
 
@@ -162,12 +188,13 @@ class RhythmController:
 
             self.current_countdown_val = math.ceil(remaining / 1000)
             
-            fake_time = -remaining
+            fake_time = -remaining - self.song_clock.offset_ms + self.visual_offset_ms
             
-            for note in self.rhythm.notes:
-                if note["active"]:
-                    time_diff = note["time"] - fake_time
-                    note["y"] = self.rhythm.hit_line_y - (time_diff * self.note_speed)
+            start, end = self.chart.update_window(fake_time, self.rhythm.hit_line_y, self.note_speed)
+            for note in self.rhythm.notes[start:end]:
+                if note.active:
+                    time_diff = note.time - fake_time
+                    note.y = self.rhythm.hit_line_y - (time_diff * self.note_speed)
             
             if remaining <= 0:
                 self.waiting_to_start = False
@@ -178,21 +205,24 @@ class RhythmController:
         if not self.is_playing:
             self.startMusic()
 
-        current_time = pygame.time.get_ticks() - self.start_time
+        current_time = self.song_clock.now()
+        draw_time = current_time + self.visual_offset_ms
 
         if self.rhythm.feedback_timer > 0:
             self.rhythm.feedback_timer -= 1
         else:
             self.rhythm.feedback = ""
 
-        for note in self.rhythm.notes:
-            if note["active"]:
-                time_diff = note["time"] - current_time
-                note["y"] = self.rhythm.hit_line_y - (time_diff * self.note_speed)
+        start, end = self.chart.update_window(draw_time, self.rhythm.hit_line_y, self.note_speed)
+        for note in self.rhythm.notes[start:end]:
+            if note.active:
+                time_diff = note.time - draw_time
+                note.y = self.rhythm.hit_line_y - (time_diff * self.note_speed)
 
                 
-                if note["y"] > self.rhythm.hit_line_y + 100:
-                    note["active"] = False
+                # Missed 100 px past the line on the judge's clock, not the drawn one.
+                if (current_time - note.time) * self.note_speed > 100:
+                    note.active = False
                     self.triggerMiss()
         
         
@@ -260,15 +290,20 @@ class RhythmController:
         if event.type == pygame.KEYDOWN:
             if event.key in self.key_map:
                 lane = self.key_map[event.key]
-                self.checkHit(lane)
+                self.checkHit(lane, getattr(event, "timestamp_ns", None))
 
    
     def handle_input(self, event):
         """Legacy alias keeping existing calls working."""
         return self.handleInput(event)
 
-    def checkHit(self, lane):
-        current_time = pygame.time.get_ticks() - self.start_time
+    def checkHit(self, lane, timestamp_ns=None):
+        # Judge against the moment the key was taken off the event queue
+        # (see InputStamper), not the frame that handles it.
+        if timestamp_ns is None:
+            current_time = self.song_clock.now()
+        else:
+            current_time = self.song_clock.position_at(timestamp_ns)
         
        
         
@@ -279,23 +314,12 @@ class RhythmController:
         miss_window = 250        
         
         hit_found = False
-        best_note = None
-        best_distance = float('inf')
-
-        
-        for note in self.rhythm.notes:
-            if note["active"] and note["lane"] == lane:
-                time_diff = abs(note["time"] - current_time)
-                
-             
-                if time_diff < best_distance and time_diff < miss_window:
-                    best_distance = time_diff
-                    best_note = note
+        best_note, best_distance = self.chart.find_closest(lane, current_time, miss_window)
         
         if best_note:
             
             hit_found = True
-            best_note["active"] = False
+            best_note.active = False
             
             self.guitar_channel.set_volume(1.0)
             self.last_hit_time = pygame.time.get_ticks()
@@ -337,7 +361,7 @@ class RhythmController:
                 
                 points = max(5, int(40 - best_distance * 0.1))
                 hype_gain = 0
-                feedback = "LATE! 💩" if (best_note["time"] - current_time) < 0 else "EARLY! 💩"
+                feedback = "LATE! 💩" if (best_note.time - current_time) < 0 else "EARLY! 💩"
                 particle_color = (150, 150, 150)  
             
             
@@ -384,9 +408,10 @@ class RhythmController:
         else:
            
             self.is_paused = True
-            self.pause_time = pygame.time.get_ticks()
             
             pygame.mixer.pause()
+            self.track_backing.pause()
+            self.song_clock.pause()
             print("⏸️ PAUSE")
 
     def resume_pause(self):
@@ -399,17 +424,18 @@ class RhythmController:
         self.current_countdown_val = 5
         
         pygame.mixer.pause()
+        self.track_backing.pause()
         print("⏱️ Décompte avant reprise: 5s")
 
     def checkSongFinished(self):
         
         if self.is_playing and not self.song_finished:
-            current_time = pygame.time.get_ticks() - self.start_time
+            current_time = self.song_clock.now()
             
             
             if self.rhythm.notes:
                 
-                last_note_end = max(note["time"] + note["duration"] for note in self.rhythm.notes)
+                last_note_end = self.chart.end_time
                 
                 song_duration = last_note_end + 500  
             else:
@@ -420,6 +446,7 @@ class RhythmController:
                 self.song_finished = True
                 self.finish_time = pygame.time.get_ticks()
                 pygame.mixer.stop()
+                self.track_backing.stop()
                 print("🎵 Chanson terminée!")
     
 
@@ -499,9 +526,9 @@ class RhythmController:
         return self.triggerMiss()
     
 
-    def check_hit(self, lane):
+    def check_hit(self, lane, timestamp_ns=None):
 
-        return self.checkHit(lane)
+        return self.checkHit(lane, timestamp_ns)
     
     def register_hit(self, points, text, hype_gain):
 
@@ -1,35 +1,49 @@
 
 
 import pygame
+from array import array
 from Utils.Logger import Logger
+from Utils.MapCache import MapCache
+from Models.TileLayerModel import TileLayerModel
 
 
+class _Tile:
+    def __init__(self, image):
+        self.image = image
+
 
 class MapModel:
     
     
    
-    def __init__(self, map_file, tile_kinds, tile_size):
-        
+    def __init__(self, map_file, tile_kinds, tile_size, parsed=None):
         
+        # parsed: result of loadParsed(map_file), e.g. from the stage
+        # preloader; the tilesets are still loaded and converted here.
         try:
             self.tile_kinds = tile_kinds
             self.tile_size = tile_size
+            self.revision = 0
             Logger.debug("MapModel.__init__", "Loading map", map_file=map_file, tile_size=tile_size)
             
     
-            try:
-                with open(map_file, "r") as file:
-                    data = file.read()
-                Logger.debug("MapModel.__init__", "Map file read successfully", map_file=map_file)
-            except FileNotFoundError as e:
-                Logger.error("MapModel.__init__", e)
-                self.tiles = []
-                raise
-            except Exception as e:
-                Logger.error("MapModel.__init__", e)
-                self.tiles = []
-                raise
+            cached = parsed
+            if cached is None and str(map_file).lower().endswith('.tmx'):
+                cached = MapCache.load(map_file)
+
+            if cached is None:
+                try:
+                    with open(map_file, "r") as file:
+                        data = file.read()
+                    Logger.debug("MapModel.__init__", "Map file read successfully", map_file=map_file)
+                except FileNotFoundError as e:
+                    Logger.error("MapModel.__init__", e)
+                    self.tiles = []
+                    raise
+                except Exception as e:
+                    Logger.error("MapModel.__init__", e)
+                    self.tiles = []
+                    raise
             
            
            
@@ -43,89 +57,39 @@ class MapModel:
                     tmx_path = map_file
                     tmx_dir = os.path.dirname(tmx_path)
 
-                    root = ET.fromstring(data)
+                    if cached is not None:
+                        parsed = cached
+                    else:
+                        parsed = self._parseTmx(data)
+                        MapCache.save(map_file, parsed)
                   
-                    width = int(root.attrib.get('width', 0))
-                    height = int(root.attrib.get('height', 0))
-                    tilewidth = int(root.attrib.get('tilewidth', 32))
-                    tileheight = int(root.attrib.get('tileheight', 32))
+                    width = parsed['width']
+                    height = parsed['height']
+                    tilewidth = parsed['tilewidth']
+                    tileheight = parsed['tileheight']
                     self.tile_size = tilewidth
 
                    
                    
                     layers = []
                     layers_by_name = {}
-                    flip_layers = [] 
-                    FLIP_H = 0x80000000  
-                    FLIP_V = 0x40000000  
-                    FLIP_D = 0x20000000  
                     
-                    for layer in root.findall('layer'):
-                        layer_name = layer.attrib.get('name', '')
-                        data_elem = layer.find('data')
-                        if data_elem is None or data_elem.text is None:
-                            matrix = [[0]*width for _ in range(height)]
-                            flips = [[0]*width for _ in range(height)]  
-                            layers.append((layer_name, matrix))
-                            flip_layers.append((layer_name, flips))
-                            layers_by_name[layer_name] = matrix
-                            continue
-                        csv = data_elem.text.strip()
-                        nums = [int(n) for n in csv.replace('\n', ',').split(',') if n.strip()]
-                      
-                      
-                        matrix = []
-                        flips = []
-                        for r in range(height):
-                            row = []
-                            flip_row = []
-                            for c in range(width):
-                                idx = r * width + c
-                                if idx < len(nums):
-                                    gid = nums[idx]
-                                   
-                                   
-                                    flip_flags = 0
-                                    if gid & FLIP_H:
-                                        flip_flags |= 1 
-                                    if gid & FLIP_V:
-                                        flip_flags |= 2  
-                                    if gid & FLIP_D:
-                                        flip_flags |= 4  
-                                  
-                                  
-                                    gid = gid & ~(FLIP_H | FLIP_V | FLIP_D)
-                                    row.append(gid)
-                                    flip_row.append(flip_flags)
-                                else:
-                                    row.append(0)
-                                    flip_row.append(0)
-                            matrix.append(row)
-                            flips.append(flip_row)
-                        layers.append((layer_name, matrix))
-                        flip_layers.append((layer_name, flips))
-                        layers_by_name[layer_name] = matrix
+                    for layer_name, nums in parsed['layers']:
+                        layer = TileLayerModel(width, height, nums)
+                        layers.append((layer_name, layer))
+                        layers_by_name[layer_name] = layer
 
                   
                   
-                    self.flip_layers = {name: flips for name, flips in flip_layers}
+                    self.flip_layers = {name: layer.getFlipLayer() for name, layer in layers}
 
                    
-                    merged = [[0 for _ in range(width)] for _ in range(height)]
-                    merged_flips = [[0 for _ in range(width)] for _ in range(height)]
-                    for i, (_name, layer) in enumerate(layers):
-                        
-                        flip_layer = flip_layers[i][1] if i < len(flip_layers) else None
-                        for y in range(height):
-                            for x in range(width):
-                                gid = layer[y][x]
-                                if gid:
-                                    merged[y][x] = gid
-                                    if flip_layer:
-                                        merged_flips[y][x] = flip_layer[y][x]
+                    merged = TileLayerModel(width, height)
+                    for _name, layer in layers:
+                        merged = layer.mergedOver(merged)
 
                     self.tiles = merged
-                    self.tile_flips = merged_flips 
+                    self.tile_flips = merged.getFlipLayer()
                    
                     self.layers = layers_by_name
                     
@@ -137,39 +101,17 @@ class MapModel:
 
                   
                   
-                    self.object_layers = {}
-                    for objgroup in root.findall('objectgroup'):
-                        layer_name = objgroup.attrib.get('name', '')
-                        objs = []
-                        for obj in objgroup.findall('object'):
-                            try:
-                                ox = int(float(obj.attrib.get('x', 0)))
-                                oy = int(float(obj.attrib.get('y', 0)))
-                                ow = int(float(obj.attrib.get('width', 0)))
-                                oh = int(float(obj.attrib.get('height', 0)))
-                                gid = obj.attrib.get('gid')
-                                objname = obj.attrib.get('name', '')
-                                otype = obj.attrib.get('type', '')
-                                props = {}
-                                props_elem = obj.find('properties')
-                                if props_elem is not None:
-                                    for prop in props_elem.findall('property'):
-                                        props[prop.attrib.get('name')] = prop.attrib.get('value', prop.attrib.get('type'))
-                                objs.append({'x': ox, 'y': oy, 'width': ow, 'height': oh, 'gid': gid, 'name': objname, 'type': otype, 'properties': props})
-                            except Exception:
-                                continue
-                        self.object_layers[layer_name] = objs
+                    self.object_layers = parsed['object_layers']
 
                    
                     self.tile_kinds = {} 
                     self.tilesets = []  
-                    tileset_elems = root.findall('tileset')  
                     
 
 
-                    for tileset_elem in tileset_elems:
-                        source = tileset_elem.attrib.get('source')
-                        firstgid = int(tileset_elem.attrib.get('firstgid', 1))
+                    for tileset_ref in parsed['tilesets']:
+                        source = tileset_ref.get('source')
+                        firstgid = int(tileset_ref.get('firstgid', 1))
                         tsx_path = os.path.join(tmx_dir, source) if source else None
                         if not tsx_path or not os.path.exists(tsx_path):
                             
@@ -299,9 +241,6 @@ class MapModel:
                                     color = ((gid * 37) % 256, (gid * 61) % 256, (gid * 97) % 256)
                                     tile_surf.fill(color)
                                
-                                class _Tile:
-                                    def __init__(self, image):
-                                        self.image = image
                                 self.tile_kinds[gid] = _Tile(tile_surf)
                             except Exception:
                                 continue
@@ -315,11 +254,8 @@ class MapModel:
                         })
 
                     try:
-                        used_gids = set()
-                        for row in self.tiles:
-                            for v in row:
-                                if isinstance(v, int) and v > 0:
-                                    used_gids.add(v)
+                        used_gids = set(self.tiles.getGids())
+                        used_gids.discard(0)
                         missing = [g for g in sorted(used_gids) if g not in self.tile_kinds]
                         if missing:
                             Logger.debug('MapModel.__init__', 'Missing GIDs found - creating placeholders', missing_count=len(missing), missing_sample=missing[:20])
@@ -328,10 +264,7 @@ class MapModel:
                                 tile_surf = pygame.Surface((tilewidth, tileheight))
                                 color = ((gid * 37) % 256, (gid * 61) % 256, (gid * 97) % 256)
                                 tile_surf.fill(color)
-                                class _Tile2:
-                                    def __init__(self, image):
-                                        self.image = image
-                                self.tile_kinds[gid] = _Tile2(tile_surf)
+                                self.tile_kinds[gid] = _Tile(tile_surf)
                             except Exception:
                                 continue
                     except Exception as e:
@@ -344,7 +277,7 @@ class MapModel:
                     self.tile_kinds = {}
                    
                    
-                    self.tile_flips = []
+                    rows = []
                     for line in data.split("\n"):
                         if line.strip(): 
                             row = []
@@ -355,7 +288,9 @@ class MapModel:
                                     Logger.debug("MapModel.__init__", "Invalid tile number, skipping", tile=tile_number)
                                     continue
                             if row: 
-                                self.tiles.append(row)
+                                rows.append(row)
+                    self.tiles = TileLayerModel.fromRows(rows)
+                    self.tile_flips = self.tiles.getFlipLayer()
                     Logger.debug("MapModel.__init__", "Map parsed successfully", 
                                rows=len(self.tiles), 
                                cols=len(self.tiles[0]) if self.tiles else 0)
@@ -371,6 +306,76 @@ class MapModel:
    
    
     
+    @staticmethod
+    def loadParsed(map_file):
+        # File half of the constructor for a TMX map: compiled cache, or parse
+        # and compile. No pygame calls, so it is safe on a worker thread.
+        parsed = MapCache.load(map_file)
+        if parsed is None:
+            with open(map_file, "r") as file:
+                parsed = MapModel._parseTmx(file.read())
+            MapCache.save(map_file, parsed)
+        return parsed
+
+    @staticmethod
+    def _parseTmx(data):
+        import xml.etree.ElementTree as ET
+
+        root = ET.fromstring(data)
+
+        width = int(root.attrib.get('width', 0))
+        height = int(root.attrib.get('height', 0))
+
+        layers = []
+        for layer in root.findall('layer'):
+            layer_name = layer.attrib.get('name', '')
+            data_elem = layer.find('data')
+            if data_elem is None or data_elem.text is None:
+                layers.append((layer_name, array('I', bytes(4 * width * height))))
+                continue
+            csv = data_elem.text.strip()
+            layers.append((layer_name, array('I', (int(n) for n in csv.replace('\n', ',').split(',') if n.strip()))))
+
+        object_layers = {}
+        for objgroup in root.findall('objectgroup'):
+            layer_name = objgroup.attrib.get('name', '')
+            objs = []
+            for obj in objgroup.findall('object'):
+                try:
+                    ox = int(float(obj.attrib.get('x', 0)))
+                    oy = int(float(obj.attrib.get('y', 0)))
+                    ow = int(float(obj.attrib.get('width', 0)))
+                    oh = int(float(obj.attrib.get('height', 0)))
+                    gid = obj.attrib.get('gid')
+                    objname = obj.attrib.get('name', '')
+                    otype = obj.attrib.get('type', '')
+                    props = {}
+                    props_elem = obj.find('properties')
+                    if props_elem is not None:
+                        for prop in props_elem.findall('property'):
+                            props[prop.attrib.get('name')] = prop.attrib.get('value', prop.attrib.get('type'))
+                    objs.append({'x': ox, 'y': oy, 'width': ow, 'height': oh, 'gid': gid, 'name': objname, 'type': otype, 'properties': props})
+                except Exception:
+                    continue
+            object_layers[layer_name] = objs
+
+        tilesets = []
+        for tileset_elem in root.findall('tileset'):
+            tilesets.append({
+                'firstgid': int(tileset_elem.attrib.get('firstgid', 1)),
+                'source': tileset_elem.attrib.get('source'),
+            })
+
+        return {
+            'width': width,
+            'height': height,
+            'tilewidth': int(root.attrib.get('tilewidth', 32)),
+            'tileheight': int(root.attrib.get('tileheight', 32)),
+            'layers': layers,
+            'object_layers': object_layers,
+            'tilesets': tilesets,
+        }
+
     def getTileKinds(self):
       
       
@@ -406,6 +411,7 @@ class MapModel:
       
         try:
             self.tile_size = max(1, int(tile_size))
+            self.revision = getattr(self, 'revision', 0) + 1
             Logger.debug("MapModel.setTileSize", "Tile size set", tile_size=self.tile_size)
         except Exception as e:
             Logger.error("MapModel.setTileSize", e)
@@ -414,8 +420,9 @@ class MapModel:
 
 
         try:
-            
-            return [row.copy() for row in self.tiles] if hasattr(self, 'tiles') and self.tiles else []
+            # A copy: edits must go through setTiles so the revision moves
+            # and MapView re-bakes its chunks.
+            return self.tiles.copy() if hasattr(self, 'tiles') and self.tiles else []
         except Exception as e:
             Logger.error("MapModel.getTiles", e)
             return []
@@ -423,12 +430,19 @@ class MapModel:
     def setTiles(self, tiles):
        
         try:
-            if isinstance(tiles, list):
+            if isinstance(tiles, TileLayerModel):
+                self.tiles = tiles
+                self.tile_flips = tiles.getFlipLayer()
+                self.revision = getattr(self, 'revision', 0) + 1
+                Logger.debug("MapModel.setTiles", "Tiles set", rows=len(self.tiles))
+            elif isinstance(tiles, list):
               
-                self.tiles = [row.copy() if isinstance(row, list) else row for row in tiles]
+                self.tiles = TileLayerModel.fromRows(tiles)
+                self.tile_flips = self.tiles.getFlipLayer()
+                self.revision = getattr(self, 'revision', 0) + 1
                 Logger.debug("MapModel.setTiles", "Tiles set", rows=len(self.tiles))
             else:
-                Logger.error("MapModel.setTiles", ValueError("Tiles must be a list"))
+                Logger.error("MapModel.setTiles", ValueError("Tiles must be a list or a TileLayerModel"))
         except Exception as e:
             Logger.error("MapModel.setTiles", e)
 
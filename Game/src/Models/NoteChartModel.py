@@ -0,0 +1,89 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class NoteChartModel:
+
+    OFFSCREEN_Y = -1000
+
+    def __init__(self, notes, lanes):
+
+        # notes must already be sorted by time (SongModel.get_notes)
+        self.notes = notes
+        self.lanes = list(lanes)
+        self.times = array("i", (note.time for note in notes))
+
+        self.lane_notes = {lane: [] for lane in self.lanes}
+        for note in notes:
+            self.lane_notes.setdefault(note.lane, []).append(note)
+        self.lane_times = {
+            lane: array("i", (note.time for note in lane_notes))
+            for lane, lane_notes in self.lane_notes.items()
+        }
+
+        self.end_time = max((note.time + note.duration for note in notes), default=0)
+
+        self.reset()
+
+    def reset(self):
+
+        self.window_start = 0
+        self.window_end = 0
+        self.lane_cursors = {lane: 0 for lane in self.lane_notes}
+
+    def _advance_start(self):
+        notes = self.notes
+        start = self.window_start
+        while start < len(notes) and not notes[start].active:
+            start += 1
+        self.window_start = start
+        return start
+
+    def has_active_notes(self):
+        return self._advance_start() < len(self.notes)
+
+    def update_window(self, current_time, hit_line_y, note_speed):
+
+        # A note is on screen while its head is above the bottom edge and
+        # below the top edge: time - now <= hit_line_y / speed.
+        lookahead = (hit_line_y + 40) / note_speed if note_speed > 0 else 0
+        start = self._advance_start()
+        end = bisect_right(self.times, current_time + lookahead, lo=start)
+
+        # Time can move backwards (countdown after a pause); park the notes
+        # that left the window so the views do not draw stale positions.
+        for note in self.notes[end:self.window_end]:
+            note.y = self.OFFSCREEN_Y
+
+        self.window_end = end
+        return start, end
+
+    def visible_notes(self):
+        return self.notes[self.window_start:self.window_end]
+
+    def find_closest(self, lane, current_time, window):
+        lane_notes = self.lane_notes.get(lane)
+        if not lane_notes:
+            return None, float('inf')
+
+        times = self.lane_times[lane]
+
+        cursor = self.lane_cursors[lane]
+        while cursor < len(lane_notes) and not lane_notes[cursor].active:
+            cursor += 1
+        self.lane_cursors[lane] = cursor
+
+        lo = max(cursor, bisect_right(times, current_time - window))
+        hi = bisect_left(times, current_time + window, lo=lo)
+
+        best_note = None
+        best_distance = float('inf')
+        for index in range(lo, hi):
+            note = lane_notes[index]
+            if note.active:
+                time_diff = abs(times[index] - current_time)
+                if time_diff < best_distance:
+                    best_distance = time_diff
+                    best_note = note
+
+        return best_note, best_distance
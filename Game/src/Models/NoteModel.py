@@ -0,0 +1,18 @@
+class NoteModel:
+
+    LANES = ("LANE1", "LANE2", "LANE3", "LANE4")
+
+    # One small fixed-layout object per note instead of a five-key dict.
+    __slots__ = ("time", "lane", "lane_index", "duration", "active", "hit", "y")
+
+    def __init__(self, time, lane, duration):
+        self.time = time
+        self.lane = lane
+        self.lane_index = NoteModel.LANES.index(lane)
+        self.duration = duration
+        self.active = True
+        self.hit = False
+        self.y = None
+
+    def __repr__(self):
+        return f"NoteModel(time={self.time}, lane={self.lane}, duration={self.duration}, active={self.active})"
@@ -25,6 +25,12 @@ class RhythmModel:
         
        
         self.notes = []
+        self.chart = None
+
+    def get_visible_notes(self):
+        if self.chart is not None:
+            return self.chart.visible_notes()
+        return self.notes
 
     def get_crowd_status(self):
      
@@ -48,4 +54,6 @@ class RhythmModel:
         self.feedback = ""
       
         for note in self.notes:
-            note["active"] = True
\ No newline at end of file
+            note.active = True
+        if self.chart is not None:
+            self.chart.reset()
\ No newline at end of file
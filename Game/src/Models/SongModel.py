@@ -1,3 +1,6 @@
+from Models.NoteModel import NoteModel
+
+
 class SongModel:
 
 
@@ -26,13 +29,7 @@ class SongModel:
         duration_ms = int(beat_duration * ms_per_beat)
         
        
-        new_note = {
-            "time": start_ms,       
-            "lane": lane,          
-            "duration": duration_ms,
-            "active": True,         
-            "hit": False            
-        }
+        new_note = NoteModel(start_ms, lane, duration_ms)
         
       
         self.notes.append(new_note)
@@ -43,5 +40,5 @@ class SongModel:
       
       
        
-        self.notes.sort(key=lambda x: x["time"])
+        self.notes.sort(key=lambda x: x.time)
         return self.notes
\ No newline at end of file
@@ -0,0 +1,161 @@
+import sys
+from array import array
+from Utils.Logger import Logger
+
+
+class TileLayerModel:
+
+    FLIP_H = 0x80000000
+    FLIP_V = 0x40000000
+    FLIP_D = 0x20000000
+    GID_MASK = 0x1FFFFFFF
+
+    # Per-byte lookup tables applied to the most significant byte of every
+    # cell, so masking and flip decoding run through bytes.translate.
+    _HIGH_BYTE = 3 if sys.byteorder == "little" else 0
+    _MASK_TABLE = bytes(b & 0x1F for b in range(256))
+    _FLIP_TABLE = bytes(
+        ((b >> 7) & 1) | (((b >> 6) & 1) << 1) | (((b >> 5) & 1) << 2)
+        for b in range(256)
+    )
+    _NONZERO_TABLE = bytes([0] + [0xFF] * 255)
+
+    def __init__(self, width, height, data=None, typecode="I"):
+        try:
+            self.width = max(0, int(width))
+            self.height = max(0, int(height))
+            size = self.width * self.height
+
+            if data is None:
+                data = array(typecode, bytes(array(typecode).itemsize * size))
+            elif not isinstance(data, array):
+                data = array(typecode, data)
+
+            if len(data) < size:
+                data.extend(array(data.typecode, bytes(data.itemsize * (size - len(data)))))
+            elif len(data) > size:
+                data = data[:size]
+
+            self.data = data
+            self._view = memoryview(self.data).toreadonly()
+        except Exception as e:
+            Logger.error("TileLayerModel.__init__", e)
+            raise
+
+    @staticmethod
+    def decodeFlipFlags(raw):
+        return TileLayerModel._FLIP_TABLE[(raw >> 24) & 0xFF]
+
+    @staticmethod
+    def fromRows(rows, typecode="I"):
+        height = len(rows)
+        width = max((len(row) for row in rows), default=0)
+        data = array(typecode)
+        for row in rows:
+            data.extend(row)
+            if len(row) < width:
+                data.extend(array(typecode, bytes(data.itemsize * (width - len(row)))))
+        return TileLayerModel(width, height, data, typecode)
+
+    def __len__(self):
+        return self.height
+
+    def __getitem__(self, y):
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError("tile layer row out of range")
+        start = y * self.width
+        return self._view[start:start + self.width]
+
+    def __iter__(self):
+        for y in range(self.height):
+            start = y * self.width
+            yield self._view[start:start + self.width]
+
+    def getWidth(self):
+        return self.width
+
+    def getHeight(self):
+        return self.height
+
+    def getNbytes(self):
+        return self.data.itemsize * len(self.data)
+
+    def getGid(self, x, y):
+        try:
+            return self.data[y * self.width + x] & self.GID_MASK
+        except Exception as e:
+            Logger.error("TileLayerModel.getGid", e)
+            return 0
+
+    def getFlipFlags(self, x, y):
+        try:
+            return self.decodeFlipFlags(self.data[y * self.width + x])
+        except Exception as e:
+            Logger.error("TileLayerModel.getFlipFlags", e)
+            return 0
+
+    def getGids(self):
+        try:
+            if self.data.typecode != "I":
+                return array("I", self.data)
+            raw = bytearray(self.data.tobytes())
+            high = self._HIGH_BYTE
+            raw[high::4] = raw[high::4].translate(self._MASK_TABLE)
+            gids = array("I")
+            gids.frombytes(raw)
+            return gids
+        except Exception as e:
+            Logger.error("TileLayerModel.getGids", e)
+            return array("I")
+
+    def getFlipLayer(self):
+        try:
+            if self.data.typecode != "I":
+                return TileLayerModel(self.width, self.height, None, "B")
+            raw = self.data.tobytes()
+            flips = array("B", raw[self._HIGH_BYTE::4].translate(self._FLIP_TABLE))
+            return TileLayerModel(self.width, self.height, flips, "B")
+        except Exception as e:
+            Logger.error("TileLayerModel.getFlipLayer", e)
+            return TileLayerModel(self.width, self.height, None, "B")
+
+    def copy(self):
+        return TileLayerModel(self.width, self.height, array(self.data.typecode, self.data), self.data.typecode)
+
+    def mergedOver(self, lower):
+        try:
+            if self.data.typecode != "I" or lower.data.typecode != "I" or len(self.data) != len(lower.data):
+                mask = self.GID_MASK
+                merged = array(
+                    "I",
+                    [upper if upper & mask else below for upper, below in zip(self.data, lower.data)],
+                )
+                return TileLayerModel(self.width, self.height, merged)
+
+            # Select per cell without a Python loop: build a byte mask that is
+            # 0xFF over every cell whose GID is set, then blend the layers as
+            # big integers (lower ^ ((lower ^ upper) & mask)).
+            count = len(self.data)
+            nbytes = count * self.data.itemsize
+            gids = self.getGids().tobytes()
+            present = 0
+            for lane in range(self.data.itemsize):
+                present |= int.from_bytes(gids[lane::self.data.itemsize].translate(self._NONZERO_TABLE), "little")
+            cell_mask = present.to_bytes(count, "little")
+
+            wide_mask = bytearray(nbytes)
+            for lane in range(self.data.itemsize):
+                wide_mask[lane::self.data.itemsize] = cell_mask
+
+            upper = int.from_bytes(self.data.tobytes(), "little")
+            below = int.from_bytes(lower.data.tobytes(), "little")
+            blended = below ^ ((below ^ upper) & int.from_bytes(wide_mask, "little"))
+
+            merged = array("I")
+            merged.frombytes(blended.to_bytes(nbytes, "little"))
+            return TileLayerModel(self.width, self.height, merged)
+        except Exception as e:
+            Logger.error("TileLayerModel.mergedOver", e)
+            return lower
@@ -1,13 +1,17 @@
 from Models.SongModel import SongModel
 
+# Stem paths, readable without building the chart.
+GUITAR_STEM = "Game/Assets/Sounds/pg2.ogg"
+BACKING_STEM = "Game/Assets/Sounds/pr2.ogg"
+
 def load_another_one():
     # 110 BPM - Queen
     song = SongModel(
         "Another One Bites the Dust",
         "Queen",
         110, 
-        "Game/Assets/Sounds/pg2.ogg",
-        "Game/Assets/Sounds/pr2.ogg"
+        GUITAR_STEM,
+        BACKING_STEM
     )
 
     # --- NOTES DU MORCEAU ---
@@ -1,13 +1,17 @@
 from Models.SongModel import SongModel
 
+# Stem paths, readable without building the chart.
+GUITAR_STEM = "Game/Assets/Sounds/SNA-GUI.ogg"
+BACKING_STEM = "Game/Assets/Sounds/SNA-RES.ogg"
+
 def load_seven_nation_army():
     # 120 BPM
     song = SongModel(
         "Seven Nation Army",
         "The White Stripes",
         120, 
-        "Game/Assets/Sounds/SNA-GUI.ogg", 
-        "Game/Assets/Sounds/SNA-RES.ogg"
+        GUITAR_STEM,
+        BACKING_STEM
     )
 
     # Boucle de 4 mesures (0, 4, 8...)
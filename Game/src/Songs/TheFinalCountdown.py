@@ -1,13 +1,17 @@
 from Models.SongModel import SongModel
 
+# Stem paths, readable without building the chart.
+GUITAR_STEM = "Game/Assets/Sounds/pg3.ogg"
+BACKING_STEM = "Game/Assets/Sounds/pr3.ogg"
+
 def load_final_countdown():
     # 118 BPM - Europe
     song = SongModel(
         "The Final Countdown",
         "Europe",
         118, 
-        "Game/Assets/Sounds/pg3.ogg",
-        "Game/Assets/Sounds/pr3.ogg"
+        GUITAR_STEM,
+        BACKING_STEM
     )
 
     # --- NOTES DU MORCEAU ---
@@ -1,9 +1,17 @@
 
 
+import copy
 import json
 import os
+import time
+import threading
+import pygame
+from collections import OrderedDict
+from concurrent.futures import Future
 from pathlib import Path
 from Utils.Logger import Logger
+from Utils.SurfaceCache import SurfaceCache
+from Utils.AssetPreloader import AssetPreloader
 
 
 class AssetManager:
@@ -21,6 +29,30 @@ class AssetManager:
     
    
     GAME_MODES = ["map", "dialogue", "combat", "rhythm", "rhythm_combat"]
+
+    CONFIG_CHECK_INTERVAL = 1.0
+
+    _config_cache = {}
+    _boss_index = None
+    _shared = None
+    _ensured_dirs = set()
+
+    SURFACE_CACHE_BUDGET = 128 * 1024 * 1024
+
+    _surface_cache = OrderedDict()
+    _surface_lock = threading.Lock()
+    _surface_cache_bytes = 0
+    surface_cache_hits = 0
+    surface_cache_misses = 0
+
+    SOUND_BANK_BUDGET = 96 * 1024 * 1024
+
+    _sound_bank = OrderedDict()
+    _sound_lock = threading.Lock()
+    _sound_loading = {}
+    _sound_bank_bytes = 0
+    sound_bank_hits = 0
+    sound_bank_misses = 0
     
    
    
@@ -35,8 +67,10 @@ class AssetManager:
             
            
            
-            os.makedirs(self.config_dir, exist_ok=True)
-            os.makedirs(self.progression_dir, exist_ok=True)
+            for directory in (self.config_dir, self.progression_dir):
+                if directory not in AssetManager._ensured_dirs:
+                    os.makedirs(directory, exist_ok=True)
+                    AssetManager._ensured_dirs.add(directory)
             
             
             self.bosses_config_path = os.path.join(self.config_dir, self.BOSSES_CONFIG_FILE)
@@ -54,26 +88,63 @@ class AssetManager:
   
     
 
-    def load_bosses_config(self):
-       
-       
+    @staticmethod
+    def shared():
+        if AssetManager._shared is None:
+            AssetManager._shared = AssetManager()
+        return AssetManager._shared
+
+    @staticmethod
+    def _load_json_cached(path):
+        # Returns (data, from_cache). The file is re-stat'ed at most once per
+        # CONFIG_CHECK_INTERVAL and re-parsed only when mtime or size changed.
+        # data is the cached object itself: public methods hand out copies.
+        now = time.monotonic()
+        cached = AssetManager._config_cache.get(path)
+        if cached is not None and now - cached["checked"] < AssetManager.CONFIG_CHECK_INTERVAL:
+            return cached["data"], True
+
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if cached is not None and cached["stamp"] == stamp:
+            cached["checked"] = now
+            return cached["data"], True
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        AssetManager._config_cache[path] = {"stamp": stamp, "checked": now, "data": data}
+        return data, False
+
+    @staticmethod
+    def invalidate_config_cache(path=None):
+        if path is None:
+            AssetManager._config_cache.clear()
+        else:
+            AssetManager._config_cache.pop(path, None)
+        AssetManager._boss_index = None
+
+    def _cached_bosses_config(self):
         try:
-            if not os.path.exists(self.bosses_config_path):
-                Logger.warn("AssetManager.load_bosses_config", 
-                           f"Boss config file not found: {self.bosses_config_path}")
-                return {}
-            
-            with open(self.bosses_config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config, from_cache = AssetManager._load_json_cached(self.bosses_config_path)
+            if not from_cache:
                 Logger.debug("AssetManager.load_bosses_config", 
                            f"Loaded boss config with {len(config.get('bosses', []))} bosses")
-                return config
+            return config
+        except FileNotFoundError:
+            Logger.warn("AssetManager.load_bosses_config", 
+                       f"Boss config file not found: {self.bosses_config_path}")
+            return {}
         except json.JSONDecodeError as e:
             Logger.error("AssetManager.load_bosses_config", f"Invalid JSON: {e}")
             return {}
         except Exception as e:
             Logger.error("AssetManager.load_bosses_config", e)
             return {}
+
+    def load_bosses_config(self):
+       
+       
+        return copy.deepcopy(self._cached_bosses_config())
     
 
 
@@ -85,6 +156,7 @@ class AssetManager:
                 json.dump(config, f, indent=4, ensure_ascii=False)
                 Logger.debug("AssetManager.save_bosses_config", 
                            f"Saved boss config to {self.bosses_config_path}")
+            AssetManager.invalidate_config_cache(self.bosses_config_path)
         except Exception as e:
             Logger.error("AssetManager.save_bosses_config", e)
             raise
@@ -92,15 +164,25 @@ class AssetManager:
 
 
 
+    def _get_boss_index(self):
+        config = self._cached_bosses_config()
+        index = AssetManager._boss_index
+        if index is None or index["config"] is not config:
+            by_name = {}
+            by_act = {}
+            for boss in config.get("bosses", []):
+                by_name.setdefault(boss.get("name"), boss)
+                by_act.setdefault(boss.get("act"), boss)
+            index = {"config": config, "by_name": by_name, "by_act": by_act}
+            AssetManager._boss_index = index
+        return index
+
     def get_boss_by_name(self, boss_name):
        
         try:
-            config = self.load_bosses_config()
-            bosses = config.get("bosses", [])
-            
-            for boss in bosses:
-                if boss.get("name") == boss_name:
-                    return boss
+            boss = self._get_boss_index()["by_name"].get(boss_name)
+            if boss is not None:
+                return copy.deepcopy(boss)
             
             Logger.warn("AssetManager.get_boss_by_name", f"Boss not found: {boss_name}")
             return None
@@ -115,12 +197,9 @@ class AssetManager:
        
        
         try:
-            config = self.load_bosses_config()
-            bosses = config.get("bosses", [])
-            
-            for boss in bosses:
-                if boss.get("act") == act_num:
-                    return boss
+            boss = self._get_boss_index()["by_act"].get(act_num)
+            if boss is not None:
+                return copy.deepcopy(boss)
             
             Logger.warn("AssetManager.get_boss_by_act", f"Boss not found for act: {act_num}")
             return None
@@ -134,18 +213,16 @@ class AssetManager:
        
        
         try:
-            if not os.path.exists(self.player_config_path):
-                Logger.warn("AssetManager.load_player_config", 
-                           f"Player config file not found: {self.player_config_path}")
-                return {}
-            
-            with open(self.player_config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-               
-                player_data = config.get('player', {})
+            config, from_cache = AssetManager._load_json_cached(self.player_config_path)
+            player_data = config.get('player', {})
+            if not from_cache:
                 Logger.debug("AssetManager.load_player_config", 
                            f"Loaded player config with {len(player_data.get('actions', {}))} actions")
-                return player_data
+            return copy.deepcopy(player_data)
+        except FileNotFoundError:
+            Logger.warn("AssetManager.load_player_config", 
+                       f"Player config file not found: {self.player_config_path}")
+            return {}
         except json.JSONDecodeError as e:
             Logger.error("AssetManager.load_player_config", f"Invalid JSON: {e}")
             return {}
@@ -161,6 +238,7 @@ class AssetManager:
                 json.dump(config, f, indent=4, ensure_ascii=False)
                 Logger.debug("AssetManager.save_player_config", 
                            f"Saved player config to {self.player_config_path}")
+            AssetManager.invalidate_config_cache(self.player_config_path)
         except Exception as e:
             Logger.error("AssetManager.save_player_config", e)
             raise
@@ -250,3 +328,201 @@ class AssetManager:
             Logger.error("AssetManager.asset_exists", e)
             return False
 
+
+
+    @staticmethod
+    def _surface_bytes(surface):
+        width, height = surface.get_size()
+        return width * height * surface.get_bytesize()
+
+    @staticmethod
+    def _store_surface(key, surface):
+        AssetManager._surface_cache[key] = surface
+        AssetManager._surface_cache_bytes += AssetManager._surface_bytes(surface)
+
+        while (
+            AssetManager._surface_cache_bytes > AssetManager.SURFACE_CACHE_BUDGET
+            and len(AssetManager._surface_cache) > 1
+        ):
+            old_key, old_surface = AssetManager._surface_cache.popitem(last=False)
+            AssetManager._surface_cache_bytes -= AssetManager._surface_bytes(old_surface)
+            Logger.trace("AssetManager.load_surface", "Surface evicted", path=old_key[0], size=old_key[1])
+
+    @staticmethod
+    def load_surface(path, size=None, convert=None):
+        # convert: None keeps the decoded format, "convert" or "alpha" match
+        # the display. Cached surfaces are shared: blit them, never draw on them.
+        # Call from the main thread; the stage preloader uses decode_surface().
+        key = (
+            os.path.normpath(str(path)),
+            (int(size[0]), int(size[1])) if size else None,
+            convert,
+        )
+
+        with AssetManager._surface_lock:
+            surface = AssetManager._surface_cache.get(key)
+            if surface is not None:
+                AssetManager._surface_cache.move_to_end(key)
+                AssetManager.surface_cache_hits += 1
+                return surface
+            AssetManager.surface_cache_misses += 1
+
+        # Decode, scale and convert without the lock, so a worker decoding one
+        # image never stalls the main thread looking up another.
+        preloaded = AssetPreloader.take(("surface",) + key) if key[1] is not None else None
+        if preloaded is not None:
+            # decode_surface() ran on the preloader worker; only the display
+            # conversion is left, and it has to happen on this thread.
+            surface, from_disk = preloaded
+            surface = AssetManager._convert(surface, convert)
+            if not from_disk:
+                SurfaceCache.save(path, key[1], convert, surface)
+        elif key[1] is not None:
+            # Scaled variants persist across runs, so a cold start or a
+            # resize back to a known size skips the PNG decode and scale.
+            surface = SurfaceCache.load(path, key[1], convert)
+            if surface is None:
+                source = AssetManager.load_surface(path, None, convert)
+                surface = pygame.transform.scale(source, key[1])
+                SurfaceCache.save(path, key[1], convert, surface)
+        else:
+            surface = AssetManager._convert(pygame.image.load(path), convert)
+            Logger.debug("AssetManager.load_surface", "Image decoded", path=key[0], convert=convert)
+
+        with AssetManager._surface_lock:
+            # Another thread may have loaded the same key meanwhile; keep the
+            # first one so every caller shares a single surface.
+            cached = AssetManager._surface_cache.get(key)
+            if cached is not None:
+                AssetManager._surface_cache.move_to_end(key)
+                return cached
+            AssetManager._store_surface(key, surface)
+            return surface
+
+    @staticmethod
+    def _convert(surface, convert):
+        if convert == "alpha":
+            return surface.convert_alpha()
+        if convert == "convert":
+            return surface.convert()
+        return surface
+
+    @staticmethod
+    def decode_surface(path, size, convert=None):
+        # Worker half of load_surface(path, size, convert) for the stage
+        # preloader: disk cache read, or decode and scale, but no conversion,
+        # since that touches the display. load_surface() takes the result
+        # and converts it on the main thread. Returns (surface, from_disk).
+        size = (int(size[0]), int(size[1]))
+        surface = SurfaceCache.load(path, size, convert, display=False)
+        if surface is not None:
+            return surface, True
+        surface = pygame.transform.scale(pygame.image.load(path), size)
+        Logger.debug("AssetManager.decode_surface", "Image decoded for preload", path=path, size=size)
+        return surface, False
+
+    @staticmethod
+    def clear_surface_cache():
+        with AssetManager._surface_lock:
+            AssetManager._surface_cache.clear()
+            AssetManager._surface_cache_bytes = 0
+
+    @staticmethod
+    def surface_cache_stats():
+        return {
+            "entries": len(AssetManager._surface_cache),
+            "bytes": AssetManager._surface_cache_bytes,
+            "budget": AssetManager.SURFACE_CACHE_BUDGET,
+            "hits": AssetManager.surface_cache_hits,
+            "misses": AssetManager.surface_cache_misses,
+        }
+
+    @staticmethod
+    def _sound_bytes(sound):
+        # Decoded size from the mixer format; get_raw() would copy the PCM.
+        frequency, size, channels = pygame.mixer.get_init()
+        return int(sound.get_length() * frequency) * channels * (abs(size) // 8)
+
+    @staticmethod
+    def load_sound(path):
+        # Decode once per session; retries and later stages reuse the Sound.
+        # Sounds are shared: set per-play volume on the Channel that play()
+        # returns, never with Sound.set_volume().
+        # The stage preloader fills the bank from a worker thread.
+        key = os.path.normpath(str(path))
+
+        with AssetManager._sound_lock:
+            sound = AssetManager._sound_bank.get(key)
+            if sound is not None:
+                AssetManager._sound_bank.move_to_end(key)
+                AssetManager.sound_bank_hits += 1
+                return sound
+
+            # One decode per clip: a second caller waits on the first
+            # caller's future instead of decoding the same file again.
+            pending = AssetManager._sound_loading.get(key)
+            if pending is None:
+                AssetManager.sound_bank_misses += 1
+                loading = Future()
+                AssetManager._sound_loading[key] = loading
+
+        if pending is not None:
+            return pending.result()
+
+        # Decode without the lock, so bank hits for other clips (the fail
+        # clips in a controller's __init__) never wait on a long stem.
+        try:
+            sound = pygame.mixer.Sound(path)
+        except BaseException as e:
+            with AssetManager._sound_lock:
+                del AssetManager._sound_loading[key]
+            loading.set_exception(e)
+            raise
+        Logger.debug("AssetManager.load_sound", "Sound decoded", path=key)
+
+        with AssetManager._sound_lock:
+            del AssetManager._sound_loading[key]
+            AssetManager._sound_bank[key] = sound
+            AssetManager._sound_bank_bytes += AssetManager._sound_bytes(sound)
+
+            # An evicted Sound stays valid for whoever still holds it; the
+            # bank only stops keeping it alive.
+            while (
+                AssetManager._sound_bank_bytes > AssetManager.SOUND_BANK_BUDGET
+                and len(AssetManager._sound_bank) > 1
+            ):
+                old_key, old_sound = AssetManager._sound_bank.popitem(last=False)
+                AssetManager._sound_bank_bytes -= AssetManager._sound_bytes(old_sound)
+                Logger.trace("AssetManager.load_sound", "Sound evicted", path=old_key)
+
+        loading.set_result(sound)
+        return sound
+
+    @staticmethod
+    def _warm_sound(path):
+        # Preloader task: the Sound lives in the bank, not in the future.
+        AssetManager.load_sound(path)
+        return True
+
+    @staticmethod
+    def prewarm_sounds(paths):
+        # Queues the decodes on the AssetPreloader worker; load_sound() then
+        # hits the bank, or waits for the clip being decoded.
+        for path in paths:
+            AssetPreloader.warm(("sound", os.path.normpath(str(path))), AssetManager._warm_sound, path)
+
+    @staticmethod
+    def clear_sound_bank():
+        with AssetManager._sound_lock:
+            AssetManager._sound_bank.clear()
+            AssetManager._sound_bank_bytes = 0
+
+    @staticmethod
+    def sound_bank_stats():
+        return {
+            "entries": len(AssetManager._sound_bank),
+            "bytes": AssetManager._sound_bank_bytes,
+            "budget": AssetManager.SOUND_BANK_BUDGET,
+            "hits": AssetManager.sound_bank_hits,
+            "misses": AssetManager.sound_bank_misses,
+        }
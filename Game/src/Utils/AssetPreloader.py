@@ -0,0 +1,86 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from Utils.Logger import Logger
+
+
+class AssetPreloader:
+
+    _executor = None
+    _futures = {}
+    # Futures are added and dropped from the worker's done callbacks too.
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _get_executor():
+        if AssetPreloader._executor is None:
+            # One worker: decoding is mostly I/O and C code that releases the
+            # GIL, and a single queue keeps the load order predictable.
+            AssetPreloader._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AssetPreloader")
+        return AssetPreloader._executor
+
+    @staticmethod
+    def _run(key, loader, args):
+        try:
+            result = loader(*args)
+            Logger.trace("AssetPreloader._run", "Asset preloaded", key=key)
+            return result
+        except Exception as e:
+            Logger.error("AssetPreloader._run", e)
+            return None
+
+    @staticmethod
+    def submit(key, loader, *args):
+        # Queues loader(*args) on the worker thread; the result is handed
+        # over once by take(key).
+        with AssetPreloader._lock:
+            if key in AssetPreloader._futures:
+                return
+            AssetPreloader._futures[key] = AssetPreloader._get_executor().submit(AssetPreloader._run, key, loader, args)
+
+    @staticmethod
+    def warm(key, loader, *args):
+        # submit() for loaders that fill a cache of their own and are never
+        # taken: the key is only held while the task is queued or running,
+        # so warming it again after the cache dropped the asset runs again.
+        with AssetPreloader._lock:
+            if key in AssetPreloader._futures:
+                return
+            future = AssetPreloader._get_executor().submit(AssetPreloader._run, key, loader, args)
+            AssetPreloader._futures[key] = future
+        future.add_done_callback(lambda done: AssetPreloader._forget(key, done))
+
+    @staticmethod
+    def _forget(key, future):
+        with AssetPreloader._lock:
+            if AssetPreloader._futures.get(key) is future:
+                del AssetPreloader._futures[key]
+
+    @staticmethod
+    def is_pending(key):
+        with AssetPreloader._lock:
+            future = AssetPreloader._futures.get(key)
+        return future is not None and not future.done()
+
+    @staticmethod
+    def take(key):
+        # Preloaded result for key, or None if it was never submitted or
+        # failed. Waits if the worker is on it right now; a task that has
+        # not started yet is cancelled so the caller just loads it inline.
+        with AssetPreloader._lock:
+            future = AssetPreloader._futures.pop(key, None)
+        if future is None or future.cancel():
+            return None
+        result = future.result()
+        if result is not None:
+            Logger.debug("AssetPreloader.take", "Using preloaded asset", key=key)
+        return result
+
+    @staticmethod
+    def clear():
+        # Drops everything that was preloaded but never taken. Cancelling
+        # runs done callbacks, so it happens outside the lock.
+        with AssetPreloader._lock:
+            futures = list(AssetPreloader._futures.values())
+            AssetPreloader._futures.clear()
+        for future in futures:
+            future.cancel()
@@ -0,0 +1,55 @@
+import pygame
+from Utils.Logger import Logger
+
+
+class FontRegistry:
+
+    _fonts = {}
+    _quit_registered = False
+
+    @staticmethod
+    def _register_quit():
+        if not FontRegistry._quit_registered:
+            # Font objects die with pygame.quit(); forget them so a later
+            # pygame.init() gets fresh ones.
+            pygame.register_quit(FontRegistry.clear)
+            FontRegistry._quit_registered = True
+
+    @staticmethod
+    def preload():
+        try:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            # Builds pygame's system font table once, up front.
+            names = pygame.font.get_fonts()
+            Logger.debug("FontRegistry.preload", "System font table loaded", fonts=len(names))
+        except Exception as e:
+            Logger.error("FontRegistry.preload", e)
+
+    @staticmethod
+    def get_sys_font(name, size, bold=False, italic=False):
+        key = ("sys", name, int(size), bool(bold), bool(italic))
+        font = FontRegistry._fonts.get(key)
+        if font is None:
+            FontRegistry._register_quit()
+            # SysFont keeps its synthetic bold/italic fallback for fonts
+            # without a matching style file.
+            font = pygame.font.SysFont(name, int(size), bold=bold, italic=italic)
+            FontRegistry._fonts[key] = font
+            Logger.trace("FontRegistry.get_sys_font", "Font created", name=name, size=size, bold=bold, italic=italic)
+        return font
+
+    @staticmethod
+    def get_font(path, size):
+        key = ("file", path, int(size))
+        font = FontRegistry._fonts.get(key)
+        if font is None:
+            FontRegistry._register_quit()
+            font = pygame.font.Font(path, int(size))
+            FontRegistry._fonts[key] = font
+            Logger.trace("FontRegistry.get_font", "Font created", path=path, size=size)
+        return font
+
+    @staticmethod
+    def clear():
+        FontRegistry._fonts.clear()
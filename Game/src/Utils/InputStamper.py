@@ -0,0 +1,62 @@
+import time
+import pygame
+
+
+class InputStamper:
+
+    # pygame events carry no timestamp, so the frame wait polls the queue
+    # for key events at this interval and stamps them when taken off it.
+    POLL_INTERVAL = 0.001
+    STAMPED_TYPES = (pygame.KEYDOWN, pygame.KEYUP)
+
+    _buffer = []
+    _frame_deadline_ns = 0
+
+    @staticmethod
+    def _stamp(events):
+        now_ns = time.perf_counter_ns()
+        for event in events:
+            if event.type in InputStamper.STAMPED_TYPES and not hasattr(event, "timestamp_ns"):
+                event.timestamp_ns = now_ns
+        return events
+
+    @staticmethod
+    def get_events():
+        # Drop-in for pygame.event.get(): key events gathered during the
+        # last frame wait first, then everything still queued.
+        events = InputStamper._buffer
+        InputStamper._buffer = []
+        events.extend(InputStamper._stamp(pygame.event.get()))
+        return events
+
+    @staticmethod
+    def wait_frame(clock, fps):
+        # Replaces clock.tick(fps): sleeps until the next frame while
+        # taking key events off the queue every POLL_INTERVAL. Other events
+        # stay queued for get_events().
+        frame_ns = int(1_000_000_000 / fps)
+        now_ns = time.perf_counter_ns()
+        if InputStamper._frame_deadline_ns == 0:
+            deadline = now_ns + frame_ns
+        else:
+            # Late frames do not bank time, like Clock.tick.
+            deadline = max(InputStamper._frame_deadline_ns + frame_ns, now_ns)
+
+        while True:
+            InputStamper._buffer.extend(InputStamper._stamp(pygame.event.get(InputStamper.STAMPED_TYPES)))
+            remaining = (deadline - time.perf_counter_ns()) / 1_000_000_000
+            if remaining <= 0:
+                break
+            time.sleep(min(InputStamper.POLL_INTERVAL, remaining))
+
+        InputStamper._frame_deadline_ns = deadline
+        return clock.tick()
+
+    @staticmethod
+    def reset():
+        # Called when a stamped loop starts: drops key events left over from
+        # the previous loop and restarts frame pacing. Those presses belong
+        # to the last loop, and re-posting them would carry their old
+        # timestamp_ns into the new one.
+        InputStamper._buffer = []
+        InputStamper._frame_deadline_ns = 0
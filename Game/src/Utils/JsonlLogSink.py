@@ -0,0 +1,131 @@
+import os
+import gzip
+import shutil
+import threading
+from datetime import datetime
+
+
+class JsonlLogSink:
+
+    def __init__(self, log_dir, base_name="game", max_bytes=5 * 1024 * 1024, max_total_bytes=50 * 1024 * 1024):
+        self.log_dir = log_dir
+        self.base_name = base_name
+        self.max_bytes = max(1024, int(max_bytes))
+        self.max_total_bytes = max(self.max_bytes, int(max_total_bytes))
+        self.path = os.path.join(log_dir, f"{base_name}.jsonl")
+
+        self._handle = None
+        self._size = 0
+        self._roll_counter = 0
+        self._cap_lock = threading.Lock()
+        self._compressing = set()
+        self._compressors = []
+        self._recovered = False
+
+    def _open(self):
+        os.makedirs(self.log_dir, exist_ok=True)
+        self._handle = open(self.path, "ab")
+        self._size = self._handle.tell()
+
+        if not self._recovered:
+            self._recovered = True
+            for name in os.listdir(self.log_dir):
+                if name.startswith(self.base_name + "-") and name.endswith(".jsonl"):
+                    self._compress_async(os.path.join(self.log_dir, name))
+
+    def write_lines(self, lines):
+        if not lines:
+            return
+        if self._handle is None:
+            self._open()
+
+        for line in lines:
+            data = line.encode("utf-8") + b"\n"
+            self._handle.write(data)
+            self._size += len(data)
+            if self._size >= self.max_bytes:
+                self._rotate()
+
+    def flush(self):
+        if self._handle is not None:
+            self._handle.flush()
+
+    def close(self, wait=True):
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            finally:
+                self._handle = None
+        if wait:
+            for thread in list(self._compressors):
+                thread.join(timeout=5.0)
+
+    def _rotate(self):
+        self._handle.close()
+        self._handle = None
+
+        self._roll_counter += 1
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        rolled = os.path.join(self.log_dir, f"{self.base_name}-{stamp}-{self._roll_counter:04d}.jsonl")
+        os.replace(self.path, rolled)
+
+        self._compress_async(rolled)
+        self._open()
+
+    def _compress_async(self, path):
+        with self._cap_lock:
+            if path in self._compressing:
+                return
+            self._compressing.add(path)
+
+        self._compressors = [t for t in self._compressors if t.is_alive()]
+        thread = threading.Thread(
+            target=self._compress,
+            args=(path,),
+            name="JsonlLogCompressor",
+            daemon=True,
+        )
+        self._compressors.append(thread)
+        thread.start()
+
+    def _compress(self, path):
+        try:
+            tmp_path = path + ".gz.tmp"
+            with open(path, "rb") as source, gzip.open(tmp_path, "wb") as target:
+                shutil.copyfileobj(source, target)
+            os.replace(tmp_path, path + ".gz")
+            os.remove(path)
+        except Exception:
+            pass
+        finally:
+            with self._cap_lock:
+                self._compressing.discard(path)
+            self._enforce_cap()
+
+    def _enforce_cap(self):
+        with self._cap_lock:
+            try:
+                rolled = []
+                total = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+                for name in os.listdir(self.log_dir):
+                    if not name.startswith(self.base_name + "-"):
+                        continue
+                    if not (name.endswith(".jsonl.gz") or name.endswith(".jsonl")):
+                        continue
+                    full = os.path.join(self.log_dir, name)
+                    # A file still being compressed is neither counted nor
+                    # deleted; its .gz is counted when the compressor calls
+                    # back in here.
+                    if full in self._compressing:
+                        continue
+                    size = os.path.getsize(full)
+                    total += size
+                    rolled.append((name, full, size))
+
+                rolled.sort()
+                while total > self.max_total_bytes and rolled:
+                    _name, full, size = rolled.pop(0)
+                    os.remove(full)
+                    total -= size
+            except Exception:
+                pass
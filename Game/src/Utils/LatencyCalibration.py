@@ -0,0 +1,92 @@
+import math
+import array
+import pygame
+from Utils.Logger import Logger
+
+
+class LatencyCalibration:
+
+    PROGRESSION_KEY = "latency"
+    MAX_OFFSET_MS = 300.0
+    MIN_TAPS = 6
+
+    # Offsets of the logged-in user, read by the rhythm controllers.
+    # audio_offset_ms: how late a sound is heard after it is played.
+    # visual_offset_ms: how late a frame is seen after it is flipped.
+    audio_offset_ms = 0.0
+    visual_offset_ms = 0.0
+
+    @staticmethod
+    def _clamp(value):
+        limit = LatencyCalibration.MAX_OFFSET_MS
+        return max(-limit, min(limit, float(value)))
+
+    @staticmethod
+    def set_offsets(audio_offset_ms, visual_offset_ms):
+        LatencyCalibration.audio_offset_ms = LatencyCalibration._clamp(audio_offset_ms)
+        LatencyCalibration.visual_offset_ms = LatencyCalibration._clamp(visual_offset_ms)
+
+    @staticmethod
+    def load(progression):
+        # Reads the offsets saved in a user's progression data; users who
+        # never calibrated play with zero offsets.
+        latency = (progression or {}).get(LatencyCalibration.PROGRESSION_KEY) or {}
+        try:
+            LatencyCalibration.set_offsets(latency.get("audio_offset_ms", 0.0),
+                                           latency.get("visual_offset_ms", 0.0))
+        except (TypeError, ValueError) as e:
+            Logger.warn("LatencyCalibration.load", "Invalid latency offsets, using zero", error=str(e))
+            LatencyCalibration.set_offsets(0.0, 0.0)
+        Logger.debug("LatencyCalibration.load", "Latency offsets loaded",
+                     audio_offset_ms=LatencyCalibration.audio_offset_ms,
+                     visual_offset_ms=LatencyCalibration.visual_offset_ms)
+
+    @staticmethod
+    def store(progression):
+        progression[LatencyCalibration.PROGRESSION_KEY] = {
+            "audio_offset_ms": round(LatencyCalibration.audio_offset_ms, 1),
+            "visual_offset_ms": round(LatencyCalibration.visual_offset_ms, 1),
+        }
+        return progression
+
+    @staticmethod
+    def estimate(beat_times_ns, tap_times_ns, interval_ms):
+        # Median delay in ms between each tap and the beat nearest to it.
+        # Taps further than half a beat from any beat are ignored; returns
+        # None when too few taps are left to trust.
+        if not beat_times_ns:
+            return None
+        half_beat_ns = interval_ms * 1_000_000 / 2
+        delays = []
+        for tap in tap_times_ns:
+            beat = min(beat_times_ns, key=lambda b: abs(tap - b))
+            if abs(tap - beat) < half_beat_ns:
+                delays.append((tap - beat) / 1_000_000)
+
+        if len(delays) < LatencyCalibration.MIN_TAPS:
+            return None
+        delays.sort()
+        middle = len(delays) // 2
+        if len(delays) % 2:
+            return delays[middle]
+        return (delays[middle - 1] + delays[middle]) / 2
+
+    @staticmethod
+    def make_click(frequency=1000, duration_ms=30, volume=0.8):
+        # Short decaying sine burst in the mixer's own format, so the
+        # metronome needs no asset and plays without conversion.
+        init = pygame.mixer.get_init()
+        if init is None:
+            return None
+        rate, size, channels = init
+        if size != -16:
+            Logger.warn("LatencyCalibration.make_click", "Unsupported mixer sample size", size=size)
+            return None
+
+        count = int(rate * duration_ms / 1000)
+        samples = array.array("h")
+        for i in range(count):
+            envelope = 1.0 - i / count
+            value = int(32767 * volume * envelope * math.sin(2 * math.pi * frequency * i / rate))
+            samples.extend([value] * channels)
+        return pygame.mixer.Sound(buffer=samples.tobytes())
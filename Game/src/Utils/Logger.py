@@ -1,6 +1,12 @@
 import os
+import json
+import time
+import queue
+import atexit
+import threading
 from datetime import datetime
 import traceback
+from Utils.JsonlLogSink import JsonlLogSink
 
 
 class Logger:
@@ -12,57 +18,119 @@ class Logger:
     )
 
     LOG_DIR = os.path.join(BASE_DIR, "logs")
-    
-    @staticmethod
-    def error(function_name, exception):
-        
-       
-        os.makedirs(Logger.LOG_DIR, exist_ok=True)
 
-      
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        file_path = os.path.join(Logger.LOG_DIR, f"log_{date_str}.txt")
+    TRACE = 5
+    DEBUG = 10
+    INFO = 20
+    WARN = 30
+    ERROR = 40
 
-       
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        error_type = type(exception).__name__
-        error_message = str(exception)
-        stack_trace = traceback.format_exc()
+    LEVEL_NAMES = {
+        TRACE: "TRACE",
+        DEBUG: "DEBUG",
+        INFO: "INFO",
+        WARN: "WARN",
+        ERROR: "ERROR",
+    }
 
-        log_entry = (
-            f"\n{'='*60}\n"
-            f"Date        : {timestamp}\n"
-            f"Fonction    : {function_name}\n"
-            f"Erreur      : {error_type}\n"
-            f"Message     : {error_message}\n"
-            f"Traceback   :\n{stack_trace}"
-        )
+    LEVEL = DEBUG
+    ENV_VAR = "GAME_LOG_LEVEL"
 
-       
-        with open(file_path, "a", encoding="utf-8") as file:
-            file.write(log_entry)
-    
+    _prefix_levels = {}
+    _resolved_levels = {}
 
+    TEXT_ENABLED = True
+    JSONL_ENV_VAR = "GAME_LOG_JSONL"
+    JSONL_MAX_BYTES = 5 * 1024 * 1024
+    JSONL_MAX_TOTAL_BYTES = 50 * 1024 * 1024
 
+    _jsonl_sink = None
+    _sink_lock = threading.Lock()
 
-   
-    def debug(function_name, message, **values):
-       
-       
-        if not Logger.ENABLED:
-            return
+    FLUSH_INTERVAL = 0.5
+    BATCH_SIZE = 512
+
+    _queue = queue.SimpleQueue()
+    _writer = None
+    _writer_lock = threading.Lock()
+    _files = {}
+    _atexit_registered = False
+    _STOP = object()
+
+    @staticmethod
+    def _start_writer():
+        if Logger._writer is not None:
+            return True
+        with Logger._writer_lock:
+            if Logger._writer is not None:
+                return True
+            try:
+                writer = threading.Thread(
+                    target=Logger._run_writer,
+                    name="LoggerWriter",
+                    daemon=True,
+                )
+                writer.start()
+                Logger._writer = writer
+                if not Logger._atexit_registered:
+                    atexit.register(Logger.shutdown)
+                    Logger._atexit_registered = True
+                return True
+            except Exception:
+                return False
+
+    @staticmethod
+    def _enqueue(record):
+        if Logger._start_writer():
+            Logger._queue.put(record)
+        else:
+            Logger._write_batch([record])
+
+    @staticmethod
+    def _get_file(prefix, date_str):
+        current = Logger._files.get(prefix)
+        if current is not None and current[0] == date_str:
+            return current[1]
+
+        if current is not None:
+            try:
+                current[1].close()
+            except Exception:
+                pass
 
         os.makedirs(Logger.LOG_DIR, exist_ok=True)
+        file_path = os.path.join(Logger.LOG_DIR, f"{prefix}_{date_str}.txt")
+        handle = open(file_path, "a", encoding="utf-8")
+        Logger._files[prefix] = (date_str, handle)
+        return handle
+
+    @staticmethod
+    def _format_record(record):
+        kind, created = record[0], record[1]
+        moment = datetime.fromtimestamp(created)
+        date_str = moment.strftime("%Y-%m-%d")
 
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        file_path = os.path.join(Logger.LOG_DIR, f"debug_{date_str}.txt")
+        timestamp = moment.strftime("%Y-%m-%d %H:%M:%S")
 
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if kind == "error":
+            _kind, _created, function_name, error_type, error_message, stack_trace = record
+            log_entry = (
+                f"\n{'='*60}\n"
+                f"Date        : {timestamp}\n"
+                f"Fonction    : {function_name}\n"
+                f"Erreur      : {error_type}\n"
+                f"Message     : {error_message}\n"
+                f"Traceback   :\n{stack_trace}"
+            )
+            return "log", date_str, log_entry
+
+        _kind, _created, level, function_name, message, values = record
 
         values_str = ", ".join(f"{k}={v}" for k, v in values.items())
 
         log_entry = (
             f"[{timestamp}] "
+            f"{Logger.LEVEL_NAMES.get(level, level)} "
             f"{function_name} | "
             f"{message}"
         )
@@ -71,9 +139,309 @@ class Logger:
             log_entry += f" | {values_str}"
 
         log_entry += "\n"
+        return "debug", date_str, log_entry
+
+    @staticmethod
+    def _render_message(message, args):
+        if args:
+            try:
+                return message % args
+            except Exception:
+                return f"{message} {args}"
+        return message
+
+    # Values of these types cannot change after the call, so they are queued
+    # as they are and stay typed in the JSONL output.
+    _PLAIN_TYPES = (str, int, float, bool, type(None))
+
+    @staticmethod
+    def _snapshot_values(values):
+        # The writer thread formats records later; anything mutable is turned
+        # into its string now so the log shows the value at the time of the call.
+        plain = Logger._PLAIN_TYPES
+        return {k: v if isinstance(v, plain) else str(v) for k, v in values.items()}
+
+    @staticmethod
+    def _json_record(record):
+        kind, created = record[0], record[1]
+        entry = {"ts": datetime.fromtimestamp(created).isoformat(timespec="milliseconds")}
+
+        if kind == "error":
+            _kind, _created, function_name, error_type, error_message, stack_trace = record
+            entry.update({
+                "level": "ERROR",
+                "function": function_name,
+                "error_type": error_type,
+                "message": error_message,
+                "traceback": stack_trace,
+            })
+        else:
+            _kind, _created, level, function_name, message, values = record
+            entry.update({
+                "level": Logger.LEVEL_NAMES.get(level, level),
+                "function": function_name,
+                "message": message,
+                "fields": values,
+            })
+
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+    @staticmethod
+    def _write_batch(records):
+        with Logger._sink_lock:
+            touched = set()
+            json_lines = []
+            sink = Logger._jsonl_sink
+            for record in records:
+                if Logger.TEXT_ENABLED:
+                    try:
+                        prefix, date_str, entry = Logger._format_record(record)
+                        Logger._get_file(prefix, date_str).write(entry)
+                        touched.add(prefix)
+                    except Exception:
+                        pass
+                if sink is not None:
+                    try:
+                        json_lines.append(Logger._json_record(record))
+                    except Exception:
+                        pass
+
+            for prefix in touched:
+                try:
+                    Logger._files[prefix][1].flush()
+                except Exception:
+                    pass
+
+            if sink is not None and json_lines:
+                try:
+                    sink.write_lines(json_lines)
+                    sink.flush()
+                except Exception:
+                    pass
+
+    @staticmethod
+    def enable_jsonl(max_bytes=None, max_total_bytes=None, text=True):
+        with Logger._sink_lock:
+            if Logger._jsonl_sink is not None:
+                Logger._jsonl_sink.close(wait=False)
+            Logger._jsonl_sink = JsonlLogSink(
+                Logger.LOG_DIR,
+                max_bytes=max_bytes or Logger.JSONL_MAX_BYTES,
+                max_total_bytes=max_total_bytes or Logger.JSONL_MAX_TOTAL_BYTES,
+            )
+            Logger.TEXT_ENABLED = bool(text)
+
+    @staticmethod
+    def disable_jsonl():
+        with Logger._sink_lock:
+            if Logger._jsonl_sink is not None:
+                Logger._jsonl_sink.close()
+            Logger._jsonl_sink = None
+            Logger.TEXT_ENABLED = True
+
+    @staticmethod
+    def _run_writer():
+        running = True
+        while running:
+            try:
+                record = Logger._queue.get(timeout=Logger.FLUSH_INTERVAL)
+            except queue.Empty:
+                continue
+
+            batch = []
+            waiters = []
+            while True:
+                if record is Logger._STOP:
+                    running = False
+                elif isinstance(record, threading.Event):
+                    waiters.append(record)
+                else:
+                    batch.append(record)
+
+                if len(batch) >= Logger.BATCH_SIZE:
+                    break
+                try:
+                    record = Logger._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                Logger._write_batch(batch)
+            for waiter in waiters:
+                waiter.set()
+
+    @staticmethod
+    def flush(timeout=2.0):
+        if Logger._writer is None or not Logger._writer.is_alive():
+            return
+        done = threading.Event()
+        Logger._queue.put(done)
+        done.wait(timeout)
+
+    @staticmethod
+    def shutdown():
+        writer = Logger._writer
+        if writer is not None and writer.is_alive():
+            Logger._queue.put(Logger._STOP)
+            writer.join(timeout=2.0)
+
+        leftovers = []
+        while True:
+            try:
+                record = Logger._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(record, threading.Event):
+                record.set()
+            elif record is not Logger._STOP:
+                leftovers.append(record)
+        if leftovers:
+            Logger._write_batch(leftovers)
+
+        for _date_str, handle in list(Logger._files.values()):
+            try:
+                handle.close()
+            except Exception:
+                pass
+        Logger._files.clear()
+
+        if Logger._jsonl_sink is not None:
+            try:
+                Logger._jsonl_sink.close()
+            except Exception:
+                pass
+        Logger._writer = None
+
+    @staticmethod
+    def _parse_level(level):
+        if isinstance(level, int):
+            return level
+        name = str(level).strip().upper()
+        if name == "WARNING":
+            name = "WARN"
+        for value, level_name in Logger.LEVEL_NAMES.items():
+            if level_name == name:
+                return value
+        return int(name)
+
+    @staticmethod
+    def set_level(level, prefix=None):
+        level = Logger._parse_level(level)
+        if prefix is None or prefix in ("", "*"):
+            Logger.LEVEL = level
+        else:
+            Logger._prefix_levels[prefix] = level
+        Logger._resolved_levels = {}
+
+    @staticmethod
+    def configure(spec):
+       
+        # e.g. "WARN,MapView.*=DEBUG,RhythmView.draw=TRACE"
+        if not spec:
+            return
+        for part in str(spec).split(","):
+            part = part.strip()
+            if not part:
+                continue
+            try:
+                if "=" in part:
+                    prefix, level = part.split("=", 1)
+                    Logger.set_level(level, prefix.strip())
+                else:
+                    Logger.set_level(part)
+            except ValueError:
+                continue
+
+    @staticmethod
+    def _prefix_matches(prefix, name):
+        if prefix.endswith(".*"):
+            base = prefix[:-2]
+            return name == base or name.startswith(base + ".")
+        return name == prefix or name.startswith(prefix + ".")
+
+    @staticmethod
+    def _threshold(name):
+        threshold = Logger._resolved_levels.get(name)
+        if threshold is not None:
+            return threshold
+
+        threshold = Logger.LEVEL
+        best = -1
+        for prefix, level in Logger._prefix_levels.items():
+            if len(prefix) > best and Logger._prefix_matches(prefix, name):
+                threshold = level
+                best = len(prefix)
+
+        Logger._resolved_levels[name] = threshold
+        return threshold
+
+    @staticmethod
+    def is_enabled(level, name=""):
+        if level < Logger.ERROR and not Logger.ENABLED:
+            return False
+        threshold = Logger._resolved_levels.get(name)
+        if threshold is None:
+            threshold = Logger._threshold(name)
+        return level >= threshold
+
+    @staticmethod
+    def _log(level, function_name, message, args, values):
+        if level < Logger.ERROR and not Logger.ENABLED:
+            return
+        threshold = Logger._resolved_levels.get(function_name)
+        if threshold is None:
+            threshold = Logger._threshold(function_name)
+        if level < threshold:
+            return
+
+        if callable(message):
+            message = message()
+
+        message = Logger._render_message(message, args)
+        if values:
+            values = Logger._snapshot_values(values)
+
+        Logger._enqueue(("debug", time.time(), level, function_name, message, values))
+
+    @staticmethod
+    def error(function_name, exception):
+
+        if not Logger.is_enabled(Logger.ERROR, function_name):
+            return
+
+
+        error_type = type(exception).__name__
+        error_message = str(exception)
+        stack_trace = traceback.format_exc()
+
+
+        Logger._enqueue(("error", time.time(), function_name, error_type, error_message, stack_trace))
+
+
+
+
+
+    @staticmethod
+    def trace(function_name, message, *args, **values):
+        Logger._log(Logger.TRACE, function_name, message, args, values)
+
+    @staticmethod
+    def debug(function_name, message, *args, **values):
+        Logger._log(Logger.DEBUG, function_name, message, args, values)
+
+    @staticmethod
+    def info(function_name, message, *args, **values):
+        Logger._log(Logger.INFO, function_name, message, args, values)
+
+    @staticmethod
+    def warn(function_name, message, *args, **values):
+        Logger._log(Logger.WARN, function_name, message, args, values)
+
+
+Logger.configure(os.environ.get(Logger.ENV_VAR, ""))
+
+if os.environ.get(Logger.JSONL_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "only"):
+    Logger.enable_jsonl(text=os.environ[Logger.JSONL_ENV_VAR].strip().lower() != "only")
 
-        with open(file_path, "a", encoding="utf-8") as file:
-            file.write(log_entry)
 
 
-    
\ No newline at end of file
@@ -0,0 +1,147 @@
+import os
+import sys
+import json
+import struct
+import hashlib
+from array import array
+from Utils.Logger import Logger
+
+
+class MapCache:
+    MAGIC = b"SSHMAP01"
+    VERSION = 1
+    SUFFIX = ".cache"
+    HEADER_STRUCT = struct.Struct("<I")
+
+    @staticmethod
+    def cache_path(map_file):
+        return str(map_file) + MapCache.SUFFIX
+
+    @staticmethod
+    def _hash_file(map_file):
+        with open(map_file, "rb") as file:
+            return hashlib.sha1(file.read()).hexdigest()
+
+    @staticmethod
+    def load(map_file):
+        try:
+            cache_file = MapCache.cache_path(map_file)
+            if not os.path.exists(cache_file):
+                return None
+
+            stat = os.stat(map_file)
+            restamp = False
+
+            with open(cache_file, "rb") as file:
+                prefix = file.read(len(MapCache.MAGIC) + MapCache.HEADER_STRUCT.size)
+                if prefix[:len(MapCache.MAGIC)] != MapCache.MAGIC:
+                    Logger.debug("MapCache.load", "Cache magic mismatch, ignoring", cache=cache_file)
+                    return None
+
+                (header_len,) = MapCache.HEADER_STRUCT.unpack_from(prefix, len(MapCache.MAGIC))
+                header = json.loads(file.read(header_len).decode("utf-8"))
+
+                if (
+                    header.get("version") != MapCache.VERSION
+                    or header.get("byteorder") != sys.byteorder
+                    or header.get("itemsize") != array("I").itemsize
+                ):
+                    Logger.debug("MapCache.load", "Cache format mismatch, ignoring", cache=cache_file)
+                    return None
+
+                if header.get("mtime_ns") != stat.st_mtime_ns or header.get("size") != stat.st_size:
+                    if header.get("sha1") != MapCache._hash_file(map_file):
+                        Logger.debug("MapCache.load", "Cache is stale", cache=cache_file)
+                        return None
+                    # Touched but unchanged (checkout, copy): store the new
+                    # stamp so later launches skip the hash.
+                    restamp = True
+
+                # Each layer is read straight into its array's buffer: one
+                # copy from the file, no intermediate bytes object.
+                layers = []
+                for layer in header["layers"]:
+                    gids = array("I", bytes(layer["count"] * header["itemsize"]))
+                    file.seek(layer["offset"])
+                    if file.readinto(gids) != len(gids) * gids.itemsize:
+                        Logger.debug("MapCache.load", "Cache is truncated", cache=cache_file)
+                        return None
+                    layers.append((layer["name"], gids))
+
+            parsed = {
+                "width": header["width"],
+                "height": header["height"],
+                "tilewidth": header["tilewidth"],
+                "tileheight": header["tileheight"],
+                "layers": layers,
+                "object_layers": header["object_layers"],
+                "tilesets": header["tilesets"],
+            }
+            if restamp:
+                MapCache.save(map_file, parsed)
+
+            Logger.debug("MapCache.load", "Map loaded from compiled cache", cache=cache_file, layers=len(layers))
+            return parsed
+        except Exception as e:
+            Logger.error("MapCache.load", e)
+            return None
+
+    @staticmethod
+    def save(map_file, parsed):
+        try:
+            cache_file = MapCache.cache_path(map_file)
+            stat = os.stat(map_file)
+            itemsize = array("I").itemsize
+
+            layer_entries = []
+            payload = []
+            for name, gids in parsed["layers"]:
+                packed = gids if isinstance(gids, array) else array("I", gids)
+                layer_entries.append({"name": name, "count": len(packed)})
+                payload.append(packed.tobytes())
+
+            header = {
+                "version": MapCache.VERSION,
+                "byteorder": sys.byteorder,
+                "itemsize": itemsize,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha1": MapCache._hash_file(map_file),
+                "width": parsed["width"],
+                "height": parsed["height"],
+                "tilewidth": parsed["tilewidth"],
+                "tileheight": parsed["tileheight"],
+                "object_layers": parsed["object_layers"],
+                "tilesets": parsed["tilesets"],
+                "layers": layer_entries,
+            }
+
+            # Offsets depend on the header length, so grow the header until they settle.
+            data_start = 0
+            while True:
+                offset = data_start
+                for entry, chunk in zip(layer_entries, payload):
+                    entry["offset"] = offset
+                    offset += len(chunk)
+                header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+                prefix_len = len(MapCache.MAGIC) + MapCache.HEADER_STRUCT.size + len(header_bytes)
+                aligned_start = (prefix_len + itemsize - 1) // itemsize * itemsize
+                if aligned_start <= data_start:
+                    break
+                data_start = aligned_start
+
+            tmp_file = cache_file + ".tmp"
+            with open(tmp_file, "wb") as file:
+                file.write(MapCache.MAGIC)
+                file.write(MapCache.HEADER_STRUCT.pack(len(header_bytes)))
+                file.write(header_bytes)
+                file.write(b"\0" * (data_start - prefix_len))
+                for chunk in payload:
+                    file.write(chunk)
+            os.replace(tmp_file, cache_file)
+
+            Logger.debug("MapCache.save", "Compiled map cache written", cache=cache_file, layers=len(layer_entries))
+            return True
+        except Exception as e:
+            Logger.error("MapCache.save", e)
+            return False
@@ -0,0 +1,79 @@
+import pygame
+from collections import OrderedDict
+from Utils.Logger import Logger
+
+
+class NoteSpriteAtlas:
+
+    HEAD_RADIUS = 26
+    TAIL_WIDTH = 14
+    TAIL_ALPHA = 150
+
+    # A sheet is kept per (lane colors, longest tail), and the tail length
+    # follows the window height, so resizing keeps adding keys.
+    MAX_ENTRIES = 8
+
+    _atlases = OrderedDict()
+
+    @staticmethod
+    def get(lane_colors, max_tail):
+        key = (tuple(tuple(color) for color in lane_colors), int(max_tail))
+        atlas = NoteSpriteAtlas._atlases.get(key)
+        if atlas is not None:
+            NoteSpriteAtlas._atlases.move_to_end(key)
+            return atlas
+
+        atlas = NoteSpriteAtlas(key[0], key[1])
+        NoteSpriteAtlas._atlases[key] = atlas
+        if len(NoteSpriteAtlas._atlases) > NoteSpriteAtlas.MAX_ENTRIES:
+            NoteSpriteAtlas._atlases.popitem(last=False)
+        return atlas
+
+    @staticmethod
+    def clear():
+        NoteSpriteAtlas._atlases.clear()
+
+    def __init__(self, lane_colors, max_tail):
+        try:
+            self.lane_colors = lane_colors
+            self.max_tail = max(1, max_tail)
+            self.cell = self.HEAD_RADIUS * 2
+
+            # One column per lane: the note head on top, a full-height tail strip below it.
+            self.sheet = pygame.Surface(
+                (self.cell * len(lane_colors), self.cell + self.max_tail),
+                pygame.SRCALPHA,
+            )
+            try:
+                self.sheet = self.sheet.convert_alpha()
+            except pygame.error:
+                pass
+            self.sheet.fill((0, 0, 0, 0))
+
+            self.head_rects = []
+            self.tail_left = []
+            center = self.HEAD_RADIUS
+            for i, color in enumerate(lane_colors):
+                left = i * self.cell
+                pygame.draw.circle(self.sheet, (255, 255, 255), (left + center, center), 26)
+                pygame.draw.circle(self.sheet, color, (left + center, center), 22)
+                pygame.draw.circle(self.sheet, (0, 0, 0), (left + center, center), 10)
+                self.head_rects.append(pygame.Rect(left, 0, self.cell, self.cell))
+
+                tail_rect = pygame.Rect(left, self.cell, self.TAIL_WIDTH, self.max_tail)
+                self.sheet.fill((*color, self.TAIL_ALPHA), tail_rect)
+                self.tail_left.append(left)
+
+            Logger.debug("NoteSpriteAtlas.__init__", "Note atlas built",
+                         lanes=len(lane_colors), size=self.sheet.get_size())
+        except Exception as e:
+            Logger.error("NoteSpriteAtlas.__init__", e)
+            raise
+
+    def head(self, lane_index, x, y):
+        return (self.sheet, (x - self.HEAD_RADIUS, y - self.HEAD_RADIUS), self.head_rects[lane_index])
+
+    def tail(self, lane_index, x, y, length):
+        length = max(0, min(int(length), self.max_tail))
+        area = (self.tail_left[lane_index], self.cell, self.TAIL_WIDTH, length)
+        return (self.sheet, (x - self.TAIL_WIDTH // 2, y - length), area)
@@ -0,0 +1,111 @@
+import pygame
+from array import array
+from collections import OrderedDict
+from Utils.Logger import Logger
+
+
+class ParticleSystem:
+
+    CAPACITY = 512
+    GRAVITY = 0.3
+    LIFE = 25
+    ALPHA = 200
+
+    _BURST = [
+        (pygame.math.Vector2(1, 0).rotate(i * 30).x * 4, pygame.math.Vector2(1, 0).rotate(i * 30).y * 4)
+        for i in range(12)
+    ]
+
+    # One sprite per (color, radius); colors come from the callers, so the
+    # cache is bounded like TextCache rather than trusted to stay small.
+    MAX_SPRITES = 256
+
+    _sprites = OrderedDict()
+
+    def __init__(self, capacity=None):
+        self.capacity = int(capacity or self.CAPACITY)
+
+        # Parallel arrays; live particles are packed in [0, count).
+        self.x = array("d", bytes(8 * self.capacity))
+        self.y = array("d", bytes(8 * self.capacity))
+        self.vx = array("d", bytes(8 * self.capacity))
+        self.vy = array("d", bytes(8 * self.capacity))
+        self.life = array("i", bytes(array("i").itemsize * self.capacity))
+        self.color = [None] * self.capacity
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, x, y, color):
+        color = tuple(color)
+        for vx, vy in self._BURST:
+            i = self.count
+            if i >= self.capacity:
+                Logger.trace("ParticleSystem.emit", "Particle pool full, dropping burst", capacity=self.capacity)
+                return
+            self.x[i] = x
+            self.y[i] = y
+            self.vx[i] = vx
+            self.vy[i] = vy
+            self.life[i] = self.LIFE
+            self.color[i] = color
+            self.count = i + 1
+
+    def update(self):
+        xs, ys, vxs, vys, lifes, colors = self.x, self.y, self.vx, self.vy, self.life, self.color
+        gravity = self.GRAVITY
+        count = self.count
+        i = 0
+        while i < count:
+            life = lifes[i] - 1
+            if life <= 0:
+                # Swap-remove: move the last live particle into this slot.
+                count -= 1
+                xs[i] = xs[count]
+                ys[i] = ys[count]
+                vxs[i] = vxs[count]
+                vys[i] = vys[count]
+                lifes[i] = lifes[count]
+                colors[i] = colors[count]
+                continue
+            xs[i] += vxs[i]
+            ys[i] += vys[i]
+            vys[i] += gravity
+            lifes[i] = life
+            i += 1
+        self.count = count
+
+    @staticmethod
+    def _sprite(color, size):
+        key = (color, size)
+        sprite = ParticleSystem._sprites.get(key)
+        if sprite is not None:
+            ParticleSystem._sprites.move_to_end(key)
+            return sprite
+
+        sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*color, ParticleSystem.ALPHA), (size, size), size)
+        ParticleSystem._sprites[key] = sprite
+        if len(ParticleSystem._sprites) > ParticleSystem.MAX_SPRITES:
+            ParticleSystem._sprites.popitem(last=False)
+        return sprite
+
+    @staticmethod
+    def clear_sprites():
+        ParticleSystem._sprites.clear()
+
+    def draw(self, screen):
+        if not self.count:
+            return
+        sprite = self._sprite
+        xs, ys, lifes, colors = self.x, self.y, self.life, self.color
+        blits = []
+        for i in range(self.count):
+            size = int(lifes[i] / 3)
+            if size > 0:
+                blits.append((sprite(colors[i], size), (xs[i] - size, ys[i] - size)))
+        screen.blits(blits, doreturn=False)
@@ -0,0 +1,77 @@
+import time
+
+
+class SongClock:
+
+    # A position source disagreeing by more than this is trusted outright;
+    # smaller errors are slewed out so the notes do not jitter.
+    RESYNC_MS = 40.0
+    SLEW = 0.1
+
+    def __init__(self, position_source=None, offset_ms=0.0):
+        # position_source: optional callable returning the mixer's played
+        # position in ms (negative when unknown). It only advances once per
+        # audio callback, so the clock interpolates between its steps.
+        self.position_source = position_source
+        self.offset_ms = float(offset_ms)
+        self._anchor_ns = 0
+        self._paused_at_ns = None
+        self._running = False
+        self._last_reported = None
+
+    def start(self, position_ms=0.0):
+        self._anchor_ns = time.perf_counter_ns() - int(position_ms * 1_000_000)
+        self._paused_at_ns = None
+        self._running = True
+        self._last_reported = None
+
+    def stop(self):
+        self._running = False
+        self._paused_at_ns = None
+
+    def pause(self):
+        if self._running and self._paused_at_ns is None:
+            self._paused_at_ns = time.perf_counter_ns()
+
+    def resume(self):
+        if self._paused_at_ns is not None:
+            self._anchor_ns += time.perf_counter_ns() - self._paused_at_ns
+            self._paused_at_ns = None
+            self._last_reported = None
+
+    def is_running(self):
+        return self._running
+
+    def is_paused(self):
+        return self._paused_at_ns is not None
+
+    def set_offset(self, offset_ms):
+        self.offset_ms = float(offset_ms)
+
+    def _sync(self, now_ns):
+        reported = self.position_source()
+        if reported is None or reported < 0 or reported == self._last_reported:
+            return
+        # The source just stepped: that is the freshest point we get, so
+        # compare it with the interpolated clock only then.
+        self._last_reported = reported
+        error_ms = reported - (now_ns - self._anchor_ns) / 1_000_000
+        if abs(error_ms) > self.RESYNC_MS:
+            self._anchor_ns -= int(error_ms * 1_000_000)
+        else:
+            self._anchor_ns -= int(error_ms * self.SLEW * 1_000_000)
+
+    def position_at(self, now_ns):
+        # Song position in ms at perf_counter_ns() value now_ns, with the
+        # output offset applied.
+        if not self._running:
+            return 0.0
+        if self._paused_at_ns is not None:
+            now_ns = self._paused_at_ns
+        return (now_ns - self._anchor_ns) / 1_000_000 - self.offset_ms
+
+    def now(self):
+        now_ns = time.perf_counter_ns()
+        if self._running and self._paused_at_ns is None and self.position_source is not None:
+            self._sync(now_ns)
+        return self.position_at(now_ns)
@@ -0,0 +1,300 @@
+import os
+import json
+import threading
+import pygame
+from Utils.Logger import Logger
+
+
+class SpriteAtlas:
+
+    VERSION = 1
+    ATLAS_DIR = "Game/Assets/atlas"
+    INDEX_FILE = "index.json"
+    SHEET_SIZE = 2048
+    PADDING = 1
+
+    PLAYER_CONFIG = "Game/Assets/player_config.json"
+    BOSSES_CONFIG = "Game/Assets/bosses_config.json"
+
+    # Buttons are scaled to the window at runtime, so they are packed at
+    # their native size and scaled once by ButtonView.
+    UI_SPRITES = (
+        "Game/Assets/buttonPlay.png",
+        "Game/Assets/buttonQuit.png",
+        "Game/Assets/buttonMainMenu.png",
+    )
+    NATIVE_GROUP = "native"
+
+    _index = None
+    _checked = False
+    _lock = threading.RLock()
+    _sheets = {}
+    # Sheets decoded by preload() on the worker, waiting for _sheet() to
+    # convert them on the main thread.
+    _decoded = {}
+    _sprites = {}
+
+    @staticmethod
+    def group_name(size):
+        if size is None:
+            return SpriteAtlas.NATIVE_GROUP
+        return f"{int(size[0])}x{int(size[1])}"
+
+    @staticmethod
+    def _action_paths(actions):
+        for paths in (actions or {}).values():
+            if isinstance(paths, list):
+                yield from paths
+            elif paths:
+                yield paths
+
+    @staticmethod
+    def collect():
+        # {group: set(path)}: one group per sprite size used by a game mode in
+        # player_config.json / bosses_config.json. Modes sharing a size
+        # (combat, rhythm, rhythm_combat) share the same sheets.
+        groups = {SpriteAtlas.NATIVE_GROUP: set(SpriteAtlas.UI_SPRITES)}
+
+        characters = []
+        with open(SpriteAtlas.PLAYER_CONFIG, "r", encoding="utf-8") as f:
+            player = json.load(f).get("player", {})
+        characters.append((player, player.get("default_image_path")))
+        with open(SpriteAtlas.BOSSES_CONFIG, "r", encoding="utf-8") as f:
+            for boss in json.load(f).get("bosses", []):
+                characters.append((boss, boss.get("image_path")))
+
+        for character, base_path in characters:
+            paths = set(SpriteAtlas._action_paths(character.get("actions")))
+            if base_path:
+                paths.add(base_path)
+            for mode_size in character.get("sizes", {}).values():
+                size = (mode_size.get("width", 200), mode_size.get("height", 200))
+                groups.setdefault(SpriteAtlas.group_name(size), set()).update(paths)
+
+        return groups
+
+    @staticmethod
+    def _source_stamps(paths):
+        stamps = {}
+        for path in sorted(paths):
+            try:
+                stat = os.stat(path)
+                stamps[path] = [stat.st_mtime_ns, stat.st_size]
+            except OSError:
+                stamps[path] = None
+        return stamps
+
+    @staticmethod
+    def _copy_into(sheet, surface, position):
+        if surface.get_flags() & pygame.SRCALPHA:
+            # The sheet starts fully transparent; MAX copies RGBA unchanged
+            # where a normal blit would premultiply edge pixels.
+            sheet.blit(surface, position, special_flags=pygame.BLEND_RGBA_MAX)
+        else:
+            sheet.blit(surface, position)
+
+    @staticmethod
+    def _pack(surfaces):
+        # Shelf packing, tallest first; opens a new sheet when one is full.
+        limit = SpriteAtlas.SHEET_SIZE
+        pad = SpriteAtlas.PADDING
+        order = sorted(surfaces, key=lambda path: (-surfaces[path].get_height(), path))
+
+        sheets = []
+        placed = {}
+        x = y = shelf_height = 0
+        for path in order:
+            w, h = surfaces[path].get_size()
+            if w > limit or h > limit:
+                Logger.warn("SpriteAtlas._pack", "Sprite larger than a sheet, skipped", path=path, size=(w, h))
+                continue
+            if x + w > limit:
+                x, y, shelf_height = 0, y + shelf_height + pad, 0
+            if not sheets or y + h > limit:
+                sheets.append(0)
+                x = y = shelf_height = 0
+            sheet_index = len(sheets) - 1
+            placed[path] = [sheet_index, x, y, w, h]
+            sheets[sheet_index] = max(sheets[sheet_index], y + h)
+            x += w + pad
+            shelf_height = max(shelf_height, h)
+
+        return placed, sheets
+
+    @staticmethod
+    def build():
+        try:
+            os.makedirs(SpriteAtlas.ATLAS_DIR, exist_ok=True)
+            groups = SpriteAtlas.collect()
+            all_paths = set().union(*groups.values())
+
+            index = {
+                "version": SpriteAtlas.VERSION,
+                "sheet_size": SpriteAtlas.SHEET_SIZE,
+                "sources": SpriteAtlas._source_stamps(all_paths | {SpriteAtlas.PLAYER_CONFIG, SpriteAtlas.BOSSES_CONFIG}),
+                "groups": {},
+            }
+
+            decoded = {}
+            for group, paths in sorted(groups.items()):
+                size = None
+                if group != SpriteAtlas.NATIVE_GROUP:
+                    size = tuple(int(v) for v in group.split("x"))
+
+                surfaces = {}
+                for path in paths:
+                    if path not in decoded:
+                        try:
+                            decoded[path] = pygame.image.load(path)
+                        except (pygame.error, FileNotFoundError) as e:
+                            Logger.warn("SpriteAtlas.build", "Sprite not packed", path=path, error=str(e))
+                            decoded[path] = None
+                    if decoded[path] is not None:
+                        surfaces[path] = pygame.transform.scale(decoded[path], size) if size else decoded[path]
+
+                placed, heights = SpriteAtlas._pack(surfaces)
+                sheet_files = []
+                for sheet_index, height in enumerate(heights):
+                    width = max(rect[1] + rect[3] for rect in placed.values() if rect[0] == sheet_index)
+                    sheet = pygame.Surface((width, height), pygame.SRCALPHA, 32)
+                    sheet.fill((0, 0, 0, 0))
+                    for path, rect in placed.items():
+                        if rect[0] == sheet_index:
+                            SpriteAtlas._copy_into(sheet, surfaces[path], (rect[1], rect[2]))
+                    file_name = f"{group}_{sheet_index}.png"
+                    pygame.image.save(sheet, os.path.join(SpriteAtlas.ATLAS_DIR, file_name))
+                    sheet_files.append(file_name)
+
+                index["groups"][group] = {"sheets": sheet_files, "rects": placed}
+                Logger.debug("SpriteAtlas.build", "Atlas group packed", group=group,
+                             sprites=len(placed), sheets=len(sheet_files))
+
+            with open(os.path.join(SpriteAtlas.ATLAS_DIR, SpriteAtlas.INDEX_FILE), "w", encoding="utf-8") as f:
+                json.dump(index, f, indent=2, sort_keys=True)
+
+            SpriteAtlas._index = index
+            SpriteAtlas._sheets.clear()
+            SpriteAtlas._decoded.clear()
+            SpriteAtlas._sprites.clear()
+            return index
+        except Exception as e:
+            Logger.error("SpriteAtlas.build", e)
+            return None
+
+    @staticmethod
+    def _is_current(index):
+        if not index:
+            return False
+        if index.get("version") != SpriteAtlas.VERSION or index.get("sheet_size") != SpriteAtlas.SHEET_SIZE:
+            return False
+        sources = index.get("sources", {})
+        if sources != SpriteAtlas._source_stamps(sources):
+            return False
+        for group in index.get("groups", {}).values():
+            for file_name in group.get("sheets", []):
+                if not os.path.exists(os.path.join(SpriteAtlas.ATLAS_DIR, file_name)):
+                    return False
+        return True
+
+    @staticmethod
+    def ensure():
+        # Loads the index once per process, rebuilding it on first run or
+        # when a sprite or config file changed.
+        with SpriteAtlas._lock:
+            if not SpriteAtlas._checked:
+                SpriteAtlas._load_or_build()
+                SpriteAtlas._checked = True
+            return SpriteAtlas._index
+
+    @staticmethod
+    def _load_or_build():
+
+        index = None
+        index_path = os.path.join(SpriteAtlas.ATLAS_DIR, SpriteAtlas.INDEX_FILE)
+        try:
+            if os.path.exists(index_path):
+                with open(index_path, "r", encoding="utf-8") as f:
+                    index = json.load(f)
+        except (OSError, ValueError) as e:
+            Logger.warn("SpriteAtlas.ensure", "Unreadable atlas index, rebuilding", error=str(e))
+            index = None
+
+        if SpriteAtlas._is_current(index):
+            SpriteAtlas._index = index
+        else:
+            Logger.info("SpriteAtlas.ensure", "Building sprite atlas", directory=SpriteAtlas.ATLAS_DIR)
+            SpriteAtlas.build()
+
+    @staticmethod
+    def _sheet(file_name):
+        sheet = SpriteAtlas._sheets.get(file_name)
+        if sheet is None:
+            sheet = SpriteAtlas._decoded.pop(file_name, None)
+            if sheet is None:
+                sheet = pygame.image.load(os.path.join(SpriteAtlas.ATLAS_DIR, file_name))
+            try:
+                sheet = sheet.convert_alpha()
+            except pygame.error:
+                pass
+            SpriteAtlas._sheets[file_name] = sheet
+            Logger.debug("SpriteAtlas._sheet", "Atlas sheet loaded", sheet=file_name, size=sheet.get_size())
+        return sheet
+
+    @staticmethod
+    def preload(size=None):
+        # Decodes every sheet of one size group ahead of the views asking for
+        # it. Runs on the preloader worker, so it stops short of
+        # convert_alpha(): _sheet() finishes the sheet on the main thread.
+        try:
+            index = SpriteAtlas.ensure()
+            entry = index["groups"].get(SpriteAtlas.group_name(size)) if index else None
+            for file_name in (entry or {}).get("sheets", []):
+                with SpriteAtlas._lock:
+                    if file_name in SpriteAtlas._sheets or file_name in SpriteAtlas._decoded:
+                        continue
+                decoded = pygame.image.load(os.path.join(SpriteAtlas.ATLAS_DIR, file_name))
+                with SpriteAtlas._lock:
+                    SpriteAtlas._decoded[file_name] = decoded
+        except Exception as e:
+            Logger.error("SpriteAtlas.preload", e)
+
+    @staticmethod
+    def get(path, size=None):
+        # Returns a sub-surface of an atlas sheet, or None when (path, size)
+        # was not packed. Sub-surfaces share pixels with the sheet: never
+        # draw on them.
+        group = SpriteAtlas.group_name(size)
+        key = (group, path)
+        sprite = SpriteAtlas._sprites.get(key)
+        if sprite is not None:
+            return sprite
+
+        try:
+            index = SpriteAtlas.ensure()
+            if not index:
+                return None
+            entry = index["groups"].get(group)
+            if not entry or path not in entry["rects"]:
+                return None
+            sheet_index, x, y, w, h = entry["rects"][path]
+            with SpriteAtlas._lock:
+                sheet = SpriteAtlas._sheet(entry["sheets"][sheet_index])
+            sprite = sheet.subsurface((x, y, w, h))
+            SpriteAtlas._sprites[key] = sprite
+            return sprite
+        except Exception as e:
+            Logger.error("SpriteAtlas.get", e)
+            return None
+
+    @staticmethod
+    def clear():
+        SpriteAtlas._sheets.clear()
+        SpriteAtlas._decoded.clear()
+        SpriteAtlas._sprites.clear()
+        SpriteAtlas._index = None
+        SpriteAtlas._checked = False
+
+
+if __name__ == "__main__":
+    # Offline build: PYTHONPATH=Game/src python -m Utils.SpriteAtlas
+    SpriteAtlas.build()
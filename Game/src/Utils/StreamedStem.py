@@ -0,0 +1,50 @@
+import pygame
+from Utils.Logger import Logger
+
+
+class StreamedStem:
+
+    # Plays a stem through pygame.mixer.music: SDL_mixer decodes it a buffer
+    # at a time in the audio thread, so only the compressed file is held
+    # instead of the whole track as PCM, and opening it is instant. There is
+    # one music stream, so a song streams one stem (the backing); the
+    # others stay Sounds on their own channels. Both are mixed by the same
+    # audio callback, so once started together they cannot drift apart.
+
+    def __init__(self, path, volume=1.0):
+        self.path = path
+        self.volume = volume
+        self.paused = False
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.set_volume(volume)
+        Logger.debug("StreamedStem.__init__", "Stem opened for streaming", path=path)
+
+    def play(self):
+        # Same call order as Channel.play: the stream starts on the next
+        # audio callback, together with the channels started right after.
+        pygame.mixer.music.play()
+        self.paused = False
+
+    def stop(self):
+        pygame.mixer.music.stop()
+        self.paused = False
+
+    def pause(self):
+        pygame.mixer.music.pause()
+        self.paused = True
+
+    def unpause(self):
+        pygame.mixer.music.unpause()
+        self.paused = False
+
+    def set_volume(self, volume):
+        self.volume = volume
+        pygame.mixer.music.set_volume(volume)
+
+    def get_volume(self):
+        return self.volume
+
+    def get_pos(self):
+        # Milliseconds of the stem played so far, pauses excluded; -1 when
+        # stopped. Used as the SongClock position source.
+        return pygame.mixer.music.get_pos()
@@ -0,0 +1,197 @@
+import os
+import json
+import mmap
+import struct
+import hashlib
+import threading
+import pygame
+from Utils.Logger import Logger
+
+
+class SurfaceCache:
+    MAGIC = b"SSHSURF1"
+    VERSION = 1
+    SUFFIX = ".surf"
+    CACHE_DIR = "Game/Assets/surface_cache"
+    DISK_BUDGET = 256 * 1024 * 1024
+    HEADER_STRUCT = struct.Struct("<I")
+
+    @staticmethod
+    def cache_path(path, size, convert):
+        name = f"{os.path.normpath(str(path))}|{int(size[0])}x{int(size[1])}|{convert}"
+        return os.path.join(SurfaceCache.CACHE_DIR, hashlib.sha1(name.encode("utf-8")).hexdigest() + SurfaceCache.SUFFIX)
+
+    @staticmethod
+    def _hash_file(path):
+        with open(path, "rb") as file:
+            return hashlib.sha1(file.read()).hexdigest()
+
+    @staticmethod
+    def load(path, size, convert, display=True):
+        # Scaled, converted pixels as written by save(), or None when there is
+        # no entry or the source image changed since. display=False reads the
+        # entry without converting it, for worker threads: converting uses
+        # the display and is left to the main thread.
+        try:
+            cache_file = SurfaceCache.cache_path(path, size, convert)
+            if not os.path.exists(cache_file):
+                return None
+
+            stat = os.stat(path)
+            restamp = False
+
+            with open(cache_file, "rb") as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+            if mapped[:len(SurfaceCache.MAGIC)] != SurfaceCache.MAGIC:
+                Logger.debug("SurfaceCache.load", "Cache magic mismatch, ignoring", cache=cache_file)
+                mapped.close()
+                return None
+
+            header_start = len(SurfaceCache.MAGIC) + SurfaceCache.HEADER_STRUCT.size
+            (header_len,) = SurfaceCache.HEADER_STRUCT.unpack_from(mapped, len(SurfaceCache.MAGIC))
+            header = json.loads(mapped[header_start:header_start + header_len].decode("utf-8"))
+
+            if header.get("version") != SurfaceCache.VERSION:
+                mapped.close()
+                return None
+
+            if header.get("mtime_ns") != stat.st_mtime_ns or header.get("size") != stat.st_size:
+                if header.get("sha1") != SurfaceCache._hash_file(path):
+                    Logger.debug("SurfaceCache.load", "Cache is stale", cache=cache_file)
+                    mapped.close()
+                    return None
+                # Touched but unchanged (checkout, copy): store the new
+                # stamp so later loads skip the hash, like MapCache.
+                restamp = True
+
+            width, height = header["width"], header["height"]
+            pixel_format = header["format"]
+            start = header["offset"]
+            end = start + width * height * len(pixel_format)
+            if len(mapped) < end:
+                mapped.close()
+                return None
+
+            view = memoryview(mapped)[start:end]
+            surface = pygame.image.frombuffer(view, (width, height), pixel_format)
+
+            # Both paths copy the pixels out so the mapping is closed before
+            # returning; an open map would keep the file locked on Windows,
+            # where save() and prune() could no longer replace or delete it.
+            if display and convert == "alpha":
+                loaded = surface.convert_alpha()
+            elif display and convert == "convert":
+                loaded = surface.convert()
+            else:
+                loaded = surface.copy()
+            pixels = bytes(view) if restamp else None
+            del surface
+            view.release()
+            mapped.close()
+            surface = loaded
+
+            if header.get("colorkey") is not None:
+                surface.set_colorkey(header["colorkey"])
+
+            if restamp:
+                header["mtime_ns"] = stat.st_mtime_ns
+                header["size"] = stat.st_size
+                SurfaceCache._write(cache_file, header, pixels)
+            else:
+                try:
+                    os.utime(cache_file)
+                except OSError:
+                    pass
+
+            Logger.trace("SurfaceCache.load", "Surface loaded from disk cache", path=path, size=(width, height), convert=convert)
+            return surface
+        except Exception as e:
+            Logger.error("SurfaceCache.load", e)
+            return None
+
+    @staticmethod
+    def save(path, size, convert, surface):
+        try:
+            os.makedirs(SurfaceCache.CACHE_DIR, exist_ok=True)
+            cache_file = SurfaceCache.cache_path(path, size, convert)
+            stat = os.stat(path)
+
+            pixel_format = "RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGB"
+            pixels = pygame.image.tobytes(surface, pixel_format)
+            colorkey = surface.get_colorkey()
+
+            header = {
+                "version": SurfaceCache.VERSION,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha1": SurfaceCache._hash_file(path),
+                "width": surface.get_width(),
+                "height": surface.get_height(),
+                "format": pixel_format,
+                "colorkey": list(colorkey) if colorkey is not None else None,
+                "offset": 0,
+            }
+            SurfaceCache._write(cache_file, header, pixels)
+
+            Logger.debug("SurfaceCache.save", "Scaled surface cached on disk", path=path, size=size, convert=convert)
+            SurfaceCache.prune()
+            return True
+        except Exception as e:
+            Logger.error("SurfaceCache.save", e)
+            return False
+
+    @staticmethod
+    def _write(cache_file, header, pixels):
+        # The pixel offset is part of the header, so grow it until it settles.
+        data_start = 0
+        while True:
+            header["offset"] = data_start
+            header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+            prefix_len = len(SurfaceCache.MAGIC) + SurfaceCache.HEADER_STRUCT.size + len(header_bytes)
+            aligned_start = (prefix_len + 3) // 4 * 4
+            if aligned_start <= data_start:
+                break
+            data_start = aligned_start
+
+        # Two threads may save the same entry; each writes its own file.
+        tmp_file = f"{cache_file}.{threading.get_ident()}.tmp"
+        with open(tmp_file, "wb") as file:
+            file.write(SurfaceCache.MAGIC)
+            file.write(SurfaceCache.HEADER_STRUCT.pack(len(header_bytes)))
+            file.write(header_bytes)
+            file.write(b"\0" * (data_start - prefix_len))
+            file.write(pixels)
+        os.replace(tmp_file, cache_file)
+
+    @staticmethod
+    def prune(budget=None):
+        # Drops the least recently used entries (load() touches the file)
+        # until the directory fits in the budget.
+        budget = SurfaceCache.DISK_BUDGET if budget is None else budget
+        try:
+            entries = []
+            total = 0
+            for entry in os.scandir(SurfaceCache.CACHE_DIR):
+                if entry.is_file() and entry.name.endswith(SurfaceCache.SUFFIX):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+
+            entries.sort()
+            for _mtime, size, cache_file in entries:
+                if total <= budget:
+                    break
+                try:
+                    os.remove(cache_file)
+                    total -= size
+                except OSError:
+                    pass
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            Logger.error("SurfaceCache.prune", e)
+
+    @staticmethod
+    def clear():
+        SurfaceCache.prune(0)
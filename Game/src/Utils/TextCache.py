@@ -0,0 +1,52 @@
+from collections import OrderedDict
+from Utils.Logger import Logger
+
+
+class TextCache:
+
+    MAX_ENTRIES = 512
+
+    _cache = OrderedDict()
+    hits = 0
+    misses = 0
+
+    @staticmethod
+    def render(font, text, antialias, color, background=None):
+        # Same arguments as Font.render. Returned surfaces are shared, so
+        # callers must not draw on them or change their alpha.
+        key = (
+            font,
+            text,
+            bool(antialias),
+            tuple(color),
+            tuple(background) if background is not None else None,
+        )
+        surface = TextCache._cache.get(key)
+        if surface is not None:
+            TextCache._cache.move_to_end(key)
+            TextCache.hits += 1
+            return surface
+
+        TextCache.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+
+        TextCache._cache[key] = surface
+        if len(TextCache._cache) > TextCache.MAX_ENTRIES:
+            TextCache._cache.popitem(last=False)
+        return surface
+
+    @staticmethod
+    def clear():
+        TextCache._cache.clear()
+        Logger.debug("TextCache.clear", "Text cache cleared", hits=TextCache.hits, misses=TextCache.misses)
+
+    @staticmethod
+    def stats():
+        return {
+            "entries": len(TextCache._cache),
+            "hits": TextCache.hits,
+            "misses": TextCache.misses,
+        }
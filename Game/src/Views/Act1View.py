@@ -18,10 +18,12 @@ from Views.PauseMenuView import PauseMenuView
 from Views.CaracterView import CaracterView
 from Utils.Logger import Logger
 from Utils.AssetManager import AssetManager
+from Utils.InputStamper import InputStamper
 from Controllers.GameState import GameState
 from Songs.SevenNationArmy import load_seven_nation_army
 from Songs.AnotherOneBitesTheDust import load_another_one
 from Songs.TheFinalCountdown import load_final_countdown
+from Utils.FontRegistry import FontRegistry
 
 
 
@@ -351,12 +353,24 @@ class ActView:
         try:
             clock = pygame.time.Clock()
             running = True
+
+            # Like maps, acts have no transition screen to preload behind.
+            if self.sequence_controller and self.screen:
+                self.sequence_controller.preload_next_stage(self.screen.get_size())
+
             Logger.debug("ActView.run", f"Act {self.act_config.get('act_num')} main loop started")
             
             while running:
                 try:
-                   
-                    for event in pygame.event.get():
+                    # The rhythm phase judges key presses at their
+                    # InputStamper timestamp; the other phases keep the plain
+                    # queue and Clock.tick.
+                    if self.phase == "rhythm":
+                        events = InputStamper.get_events()
+                    else:
+                        events = pygame.event.get()
+
+                    for event in events:
                         if event.type == pygame.QUIT:
                             Logger.debug("ActView.run", "QUIT event received")
                             return GameState.QUIT.value
@@ -645,7 +659,10 @@ class ActView:
                         Logger.error("ActView.run", e)
                     
                     pygame.display.flip()
-                    clock.tick(60)
+                    if self.phase == "rhythm":
+                        InputStamper.wait_frame(clock, 60)
+                    else:
+                        clock.tick(60)
                     
                 except Exception as e:
                     Logger.error("ActView.run", e)
@@ -726,6 +743,7 @@ class ActView:
             
            
             self.phase = "rhythm"
+            InputStamper.reset()
             
             Logger.debug("ActView._init_rhythm_phase", "Rhythm phase initialized")
             
@@ -746,7 +764,7 @@ class ActView:
                 return True
             
            
-            active_notes = [n for n in self.rhythm_model.getNotes() if n.get("active", False)]
+            active_notes = [n for n in self.rhythm_model.getNotes() if n.active]
             
           
             if self.lola.getHealth() <= 0:
@@ -778,15 +796,15 @@ class ActView:
             
             
             try:
-                title_font = pygame.font.SysFont("Arial", int(self.screen_height * 0.0462), bold=True)
-                text_font = pygame.font.SysFont("Arial", int(self.screen_height * 0.0348))
-                small_font = pygame.font.SysFont("Arial", int(self.screen_height * 0.0139))
+                title_font = FontRegistry.get_sys_font("Arial", int(self.screen_height * 0.0462), bold=True)
+                text_font = FontRegistry.get_sys_font("Arial", int(self.screen_height * 0.0348))
+                small_font = FontRegistry.get_sys_font("Arial", int(self.screen_height * 0.0139))
             except Exception as e:
                 Logger.error("ActView._draw_intro", e)
 
-                title_font = pygame.font.Font(None, 48)
-                text_font = pygame.font.Font(None, 36)  
-                small_font = pygame.font.Font(None, 14)
+                title_font = FontRegistry.get_font(None, 48)
+                text_font = FontRegistry.get_font(None, 36)  
+                small_font = FontRegistry.get_font(None, 14)
             
           
 
@@ -881,7 +899,7 @@ class ActView:
         try:
             import pygame
             
-            font = pygame.font.Font(None, 36)
+            font = FontRegistry.get_font(None, 36)
             
           
             level = self.lola.getLevel() if hasattr(self.lola, 'getLevel') else 1
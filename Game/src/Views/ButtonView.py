@@ -1,14 +1,36 @@
 
 
 import pygame
+from collections import OrderedDict
 from Utils.Logger import Logger
+from Utils.AssetManager import AssetManager
+from Utils.SpriteAtlas import SpriteAtlas
 
 
 
 class ButtonView:
-   
-    
-    
+
+    # Packed buttons scaled to window sizes, keyed by (path, size). Menus
+    # rebuild their buttons on every resize and page switch.
+    MAX_SCALED = 32
+
+    _scaled = OrderedDict()
+
+    @staticmethod
+    def _scaled_packed(image_path, packed, size):
+        key = (image_path, (int(size[0]), int(size[1])))
+        cached = ButtonView._scaled.get(key)
+        # The atlas hands out the same sub-surface until it is rebuilt.
+        if cached is not None and cached[0] is packed:
+            ButtonView._scaled.move_to_end(key)
+            return cached[1]
+
+        image = pygame.transform.scale(packed, key[1])
+        ButtonView._scaled[key] = (packed, image)
+        ButtonView._scaled.move_to_end(key)
+        if len(ButtonView._scaled) > ButtonView.MAX_SCALED:
+            ButtonView._scaled.popitem(last=False)
+        return image
     
     def __init__(self, image_path, position, size=(200, 80)):
    
@@ -16,9 +38,11 @@ class ButtonView:
         try:
            
             try:
-                self.image = pygame.image.load(image_path)
-               
-                self.image = pygame.transform.scale(self.image, size)
+                packed = SpriteAtlas.get(image_path)
+                if packed is not None:
+                    self.image = ButtonView._scaled_packed(image_path, packed, size)
+                else:
+                    self.image = AssetManager.load_surface(image_path, size)
                 Logger.debug("ButtonView.__init__", "Button image loaded", path=image_path, size=size)
             except FileNotFoundError as e:
                 Logger.error("ButtonView.__init__", e)
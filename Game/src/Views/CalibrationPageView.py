@@ -0,0 +1,204 @@
+import time
+import pygame
+from Views.PageView import PageView
+from Controllers.GameState import GameState
+from Utils.Logger import Logger
+from Utils.FontRegistry import FontRegistry
+from Utils.TextCache import TextCache
+from Utils.InputStamper import InputStamper
+from Utils.LatencyCalibration import LatencyCalibration
+
+
+class CalibrationPageView(PageView):
+
+    FPS = 240
+    BEAT_INTERVAL_MS = 500
+    LEAD_IN_BEATS = 4
+    MEASURED_BEATS = 16
+    FLASH_MS = 100
+
+    # (step, title, instruction) shown while waiting for the player.
+    READY_TEXT = {
+        "audio_ready": ("Test audio", "Tapez ESPACE sur chaque clic, sans regarder l'écran. ESPACE pour commencer."),
+        "visual_ready": ("Test visuel", "Tapez ESPACE à chaque flash, sans le son. ESPACE pour commencer."),
+    }
+
+    def __init__(self, screen):
+        try:
+            super().__init__("Calibration", screen.get_width(), screen.get_height(), pygame.RESIZABLE, None)
+            self.screen = screen
+
+            self.click = LatencyCalibration.make_click()
+            self.step = "audio_ready"
+            self.results = {"audio": None, "visual": None}
+
+            self.beat_times = []
+            self.tap_times = []
+            self.beats_played = 0
+            self.next_beat_ns = 0
+            self.flash_until_ns = 0
+            self.flash_started = False
+
+            Logger.debug("CalibrationPageView.__init__", "Calibration view created", has_click=self.click is not None)
+        except Exception as e:
+            Logger.error("CalibrationPageView.__init__", e)
+            raise
+
+    def _start_phase(self, step):
+        self.step = step
+        self.beat_times = []
+        self.tap_times = []
+        self.beats_played = 0
+        self.flash_until_ns = 0
+        self.flash_started = False
+        # One beat of silence before the first click or flash.
+        self.next_beat_ns = time.perf_counter_ns() + self.BEAT_INTERVAL_MS * 1_000_000
+        Logger.debug("CalibrationPageView._start_phase", "Calibration phase started", step=step)
+
+    def _finish_phase(self):
+        offset = LatencyCalibration.estimate(self.beat_times, self.tap_times, self.BEAT_INTERVAL_MS)
+        self.results[self.step] = offset
+        Logger.debug("CalibrationPageView._finish_phase", "Calibration phase measured",
+                     step=self.step, offset_ms=offset, taps=len(self.tap_times))
+        self.step = "visual_ready" if self.step == "audio" else "result"
+
+    def _measured(self):
+        return self.results["audio"] is not None and self.results["visual"] is not None
+
+    def handle_events(self, events):
+        # True to keep running, False to leave without saving, a dict of
+        # offsets to save, or GameState.QUIT.value.
+        try:
+            for event in events:
+                if event.type == pygame.QUIT:
+                    return GameState.QUIT.value
+
+                if event.type != pygame.KEYDOWN:
+                    continue
+
+                if event.key == pygame.K_ESCAPE:
+                    Logger.debug("CalibrationPageView.handle_events", "Calibration cancelled")
+                    return False
+
+                if self.step in ("audio", "visual"):
+                    if event.key == pygame.K_SPACE:
+                        self.tap_times.append(getattr(event, "timestamp_ns", time.perf_counter_ns()))
+                elif self.step == "audio_ready" and event.key in (pygame.K_SPACE, pygame.K_RETURN):
+                    if self.click is None:
+                        # No usable mixer: the audio offset stays as it was.
+                        self.results["audio"] = LatencyCalibration.audio_offset_ms
+                        self.step = "visual_ready"
+                    else:
+                        self._start_phase("audio")
+                elif self.step == "visual_ready" and event.key in (pygame.K_SPACE, pygame.K_RETURN):
+                    self._start_phase("visual")
+                elif self.step == "result":
+                    if event.key == pygame.K_r:
+                        self.results = {"audio": None, "visual": None}
+                        self.step = "audio_ready"
+                    elif event.key == pygame.K_RETURN and self._measured():
+                        return {
+                            "audio_offset_ms": self.results["audio"],
+                            "visual_offset_ms": self.results["visual"],
+                        }
+            return True
+        except Exception as e:
+            Logger.error("CalibrationPageView.handle_events", e)
+            return True
+
+    def update(self):
+        try:
+            if self.step not in ("audio", "visual"):
+                return None
+
+            now_ns = time.perf_counter_ns()
+            total_beats = self.LEAD_IN_BEATS + self.MEASURED_BEATS
+            if self.beats_played < total_beats and now_ns >= self.next_beat_ns:
+                measured = self.beats_played >= self.LEAD_IN_BEATS
+                if self.step == "audio":
+                    channel = self.click.play()
+                    if channel is not None:
+                        # Channel volumes outlive the clips played on them.
+                        channel.set_volume(1.0)
+                    # The click leaves now, whatever frame it was scheduled on.
+                    if measured:
+                        self.beat_times.append(time.perf_counter_ns())
+                else:
+                    self.flash_until_ns = now_ns + self.FLASH_MS * 1_000_000
+                    # run() stamps the beat once the flash frame is flipped.
+                    self.flash_started = measured
+                self.beats_played += 1
+                self.next_beat_ns += self.BEAT_INTERVAL_MS * 1_000_000
+
+            # Half a beat after the last one for late taps.
+            if self.beats_played >= total_beats and now_ns >= self.next_beat_ns - self.BEAT_INTERVAL_MS * 500_000:
+                self._finish_phase()
+        except Exception as e:
+            Logger.error("CalibrationPageView.update", e)
+        return None
+
+    def _blit_centered(self, font, text, color, y):
+        surface = TextCache.render(font, text, True, color)
+        self.screen.blit(surface, surface.get_rect(center=(self.screen.get_width() // 2, y)))
+
+    def render(self):
+        try:
+            width, height = self.screen.get_size()
+            self.screen.fill((20, 20, 30))
+            title_font = FontRegistry.get_sys_font("Arial", 48, bold=True)
+            text_font = FontRegistry.get_sys_font("Arial", 24)
+            hint_font = FontRegistry.get_sys_font("Arial", 18)
+
+            self._blit_centered(title_font, "Calibration", (255, 215, 0), height // 6)
+
+            if self.step in self.READY_TEXT:
+                title, instruction = self.READY_TEXT[self.step]
+                self._blit_centered(text_font, title, (255, 255, 255), height // 2 - 40)
+                self._blit_centered(hint_font, instruction, (200, 200, 255), height // 2 + 10)
+            elif self.step == "audio":
+                # Nothing on screen moves with the beat, so only the ear is measured.
+                self._blit_centered(text_font, "Écoutez... ESPACE sur chaque clic", (255, 255, 255), height // 2)
+            elif self.step == "visual":
+                if time.perf_counter_ns() < self.flash_until_ns:
+                    size = min(width, height) // 5
+                    pygame.draw.rect(self.screen, (255, 255, 255),
+                                     pygame.Rect(width // 2 - size // 2, height // 2 - size // 2, size, size))
+                self._blit_centered(hint_font, "ESPACE à chaque flash", (200, 200, 255), height - 80)
+            elif self.step == "result":
+                for i, (label, key) in enumerate((("Audio", "audio"), ("Vidéo", "visual"))):
+                    value = self.results[key]
+                    text = f"{label} : {value:+.0f} ms" if value is not None else f"{label} : pas assez de frappes"
+                    self._blit_centered(text_font, text, (255, 255, 255), height // 2 - 30 + i * 40)
+                hint = "ENTRÉE pour enregistrer, R pour recommencer" if self._measured() else "R pour recommencer"
+                self._blit_centered(hint_font, hint, (200, 200, 255), height // 2 + 80)
+
+            self._blit_centered(hint_font, "ÉCHAP pour annuler", (150, 150, 150), height - 40)
+        except Exception as e:
+            Logger.error("CalibrationPageView.render", e)
+
+    def run(self):
+        try:
+            clock = pygame.time.Clock()
+            InputStamper.reset()
+            Logger.debug("CalibrationPageView.run", "Calibration loop started")
+
+            while True:
+                result = self.handle_events(InputStamper.get_events())
+                if result is not True:
+                    if self.click is not None:
+                        self.click.stop()
+                    if result is False:
+                        return None
+                    return result
+
+                self.update()
+                self.render()
+                pygame.display.flip()
+                if self.flash_started:
+                    self.beat_times.append(time.perf_counter_ns())
+                    self.flash_started = False
+
+                InputStamper.wait_frame(clock, self.FPS)
+        except Exception as e:
+            Logger.error("CalibrationPageView.run", e)
+            return None
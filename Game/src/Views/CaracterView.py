@@ -2,15 +2,59 @@
 import pygame
 from Utils.Logger import Logger
 from Models.PlayerModel import PlayerModel
+from Utils.FontRegistry import FontRegistry
+from Utils.AssetManager import AssetManager
+from Utils.SpriteAtlas import SpriteAtlas
 
 
 
 
 class CaracterView:
-   
-    
-   
-    
+
+    BOSS_NAMES = {
+        "agent": "Security Agent",
+        "manager": "Manager Corrompu",
+        "motard": "Gros Bill",
+        "gros_bill": "Gros Bill"
+    }
+
+    DEFAULT_ACTIONS = {
+        "lola": {
+            "idle": "Game/Assets/lola.png",
+            "drinking": "Game/Assets/lolaquiboit (1).png",
+            "attacking": "Game/Assets/lolaquilancesabasse (1).png",
+            "dodging": "Game/Assets/lolaquisebaisse (2).png",
+            "moving_left": [
+                "Game/Assets/lolacoursgauche.png",
+                "Game/Assets/lolagaucheframe1.png"
+            ],
+            "moving_right": [
+                "Game/Assets/lolacoursdroite.png",
+                "Game/Assets/lola.png"
+            ],
+            "musique": [
+                "Game/Assets/lolamusique1.png",
+                "Game/Assets/lolamusique2.png",
+                "Game/Assets/lolamusique3.png"
+            ]
+        },
+        "agent": {
+            "idle": "Game/Assets/Agentdesecurité.png",
+            "attacking": "Game/Assets/agentdesecuritquitape (1).png",
+            "dodging": "Game/Assets/agentdesecuritequisebaisse (1).png"
+        },
+        "manager": {
+            "idle": "Game/Assets/ManagerCorrompu.png",
+            "attacking": "Game/Assets/managerquitape (1).png",
+            "dodging": "Game/Assets/managercorrompuquisebaisse (1).png"
+        },
+        "motard": {
+            "idle": "Game/Assets/chefdesmotards.png",
+            "attacking": "Game/Assets/motardquidonnedescoupsdepieds (1).png",
+            "dodging": "Game/Assets/motardquisebaisse (1).png"
+        }
+    }
+
     def __init__(self, image_path, base_name="", sprite_size=None, character_config=None, game_mode="combat"):
        
         try:
@@ -31,7 +75,8 @@ class CaracterView:
             else:
                 self.sprite_size = sprite_size or (200, 200) 
             self.sprite = None
-            self.action_sprites = {} 
+            self.base_sprite = None
+            self.action_frames = {}
             
 
             self.animation_frame = 0 
@@ -40,21 +85,23 @@ class CaracterView:
     
     
             self._loadSprite(image_path)
+            self.base_sprite = self.sprite
+            self._buildActionFrames()
             
           
           
             try:
-                self.font = pygame.font.SysFont(None, 36)
-                self.small_font = pygame.font.SysFont(None, 18)  
+                self.font = FontRegistry.get_sys_font(None, 36)
+                self.small_font = FontRegistry.get_sys_font(None, 18)  
 
-                self.big_font = pygame.font.SysFont(None, 32) 
+                self.big_font = FontRegistry.get_sys_font(None, 32) 
                 Logger.debug("CaracterView.__init__", "Fonts initialized")
             except Exception as e:
                 Logger.error("CaracterView.__init__", e)
                
                
-                self.font = pygame.font.Font(None, 36)
-                self.small_font = pygame.font.Font(None, 18)
+                self.font = FontRegistry.get_font(None, 36)
+                self.small_font = FontRegistry.get_font(None, 18)
                 
         except Exception as e:
             Logger.error("CaracterView.__init__", e)
@@ -68,9 +115,7 @@ class CaracterView:
     def _loadSprite(self, image_path):
         
         try:
-            original_image = pygame.image.load(image_path).convert_alpha()
-            
-            self.sprite = pygame.transform.scale(original_image, self.sprite_size)
+            self.sprite = self._loadFrame(image_path)
             Logger.debug("CaracterView._loadSprite", "Character image loaded", image_path=image_path, size=self.sprite_size)
 
 
@@ -87,12 +132,7 @@ class CaracterView:
     def resetToBaseSprite(self):
        
         try:
-           
-            self.action_sprites = {}
-          
-
-
-            self._loadSprite(self.base_image_path)
+            self.sprite = self.base_sprite
             Logger.debug("CaracterView.resetToBaseSprite", "Sprite reset to base image", base=self.base_image_path)
         except Exception as e:
             Logger.error("CaracterView.resetToBaseSprite", e)
@@ -106,164 +146,99 @@ class CaracterView:
             actions_config = self.character_config['actions']
             if action in actions_config:
                 image_path = actions_config[action]
-                Logger.debug("CaracterView._getActionImagePath", 
-                            f"Loaded from JSON config: {base_name}.{action} = {image_path}")
+                Logger.trace("CaracterView._getActionImagePath", 
+                            "Loaded from JSON config: %s.%s = %s", base_name, action, image_path)
                 return image_path
             else:
-                Logger.debug("CaracterView._getActionImagePath",
-                            f"Action '{action}' not found in JSON config for {base_name}")
+                Logger.trace("CaracterView._getActionImagePath",
+                            "Action '%s' not found in JSON config for %s", action, base_name)
         else:
-            Logger.debug("CaracterView._getActionImagePath",
-                        f"No character_config available for {base_name} (config is {'None' if not self.character_config else 'missing actions'})")
+            Logger.trace("CaracterView._getActionImagePath",
+                        "No character_config available for %s (config is %s)", base_name, 'None' if not self.character_config else 'missing actions')
         
       
       
-        try:
-            from Utils.AssetManager import AssetManager
-            
-          
-            if base_name in ["agent", "manager", "motard", "gros_bill"]:
-                asset_manager = AssetManager()
-                
-             
-                boss_names = {
-                    "agent": "Security Agent",
-                    "manager": "Manager Corrompu",
-                    "motard": "Gros Bill",
-                    "gros_bill": "Gros Bill"
-                }
-                
-                boss_name = boss_names.get(base_name, base_name)
-                try:
-                    boss_config = asset_manager.get_boss_by_name(boss_name)
-                    if boss_config and 'actions' in boss_config:
-                        if action in boss_config['actions']:
-                            image_path = boss_config['actions'][action]
-                            Logger.debug("CaracterView._getActionImagePath",
-                                        f"Loaded from boss config: {boss_name}.{action} = {image_path}")
-                            return image_path
-                except Exception as e:
-                    Logger.debug("CaracterView._getActionImagePath",
-                                f"Failed to load from boss config: {e}")
-        except ImportError as e:
-            Logger.debug("CaracterView._getActionImagePath",
-                        f"AssetManager not available: {e}")
-        
-       
-        action_map = {
-         
-            "lola": {
-                "idle": "Game/Assets/lola.png",
-                "drinking": "Game/Assets/lolaquiboit (1).png",
-                "attacking": "Game/Assets/lolaquilancesabasse (1).png",
-                "dodging": "Game/Assets/lolaquisebaisse (2).png",
-               
-                "moving_left": [
-                    "Game/Assets/lolacoursgauche.png",
-                    "Game/Assets/lolagaucheframe1.png"
-                ],
-               
-                "moving_right": [
-                    "Game/Assets/lolacoursdroite.png",
-                    "Game/Assets/lola.png"
-                ],
-               
+        boss_actions = self._getBossActions(base_name)
+        if action in boss_actions:
+            image_path = boss_actions[action]
+            Logger.trace("CaracterView._getActionImagePath",
+                        "Loaded from boss config: %s.%s = %s", base_name, action, image_path)
+            return image_path
 
-               
-                "musique": [
-                    "Game/Assets/lolamusique1.png",
-                    "Game/Assets/lolamusique2.png",
-                    "Game/Assets/lolamusique3.png"
-                ]
-            },
-           
-            "agent": {
-                "idle": "Game/Assets/Agentdesecurité.png",
-                "attacking": "Game/Assets/agentdesecuritquitape (1).png",
-                "dodging": "Game/Assets/agentdesecuritequisebaisse (1).png"
-            },
-           
-            "manager": {
-                "idle": "Game/Assets/ManagerCorrompu.png",
-                "attacking": "Game/Assets/managerquitape (1).png",
-                "dodging": "Game/Assets/managercorrompuquisebaisse (1).png"
-            },
-           
-            "motard": {
-                "idle": "Game/Assets/chefdesmotards.png",
-                "attacking": "Game/Assets/motardquidonnedescoupsdepieds (1).png",
-                "dodging": "Game/Assets/motardquisebaisse (1).png"
-            }
-        }
-        
-        if base_name in action_map and action in action_map[base_name]:
-            return action_map[base_name][action]
-        return None
+        default_actions = self.DEFAULT_ACTIONS.get(base_name, {})
+        return default_actions.get(action)
 
 
 
 
-    def updateCharacterSprite(self, character):
-       
-        if not self.base_name:
-            return  
-        
-        action = character.getCurrentAction()
-        
-      
-        action_paths = self._getActionImagePath(self.base_name, action)
-        if not action_paths:
-           
-            self.sprite = self._loadSpriteForPath(self.base_image_path)
-            return
-        
-       
+    def _getBossActions(self, base_name):
 
+        if base_name not in self.BOSS_NAMES:
+            return {}
+        try:
+            boss_config = AssetManager.shared().get_boss_by_name(self.BOSS_NAMES[base_name])
+            if boss_config and 'actions' in boss_config:
+                return boss_config['actions']
+        except Exception as e:
+            Logger.debug("CaracterView._getBossActions",
+                        "Failed to load from boss config: %s", e)
+        return {}
 
-        if isinstance(action_paths, list):
-           
-            frame_index = (self.animation_frame // self.animation_speed) % len(action_paths)
-            action_path = action_paths[frame_index]
-            cache_key = f"{self.base_name}_{action}_{frame_index}"
-        else:
-          
+    def _loadFrame(self, path):
 
+        sprite = SpriteAtlas.get(path, self.sprite_size)
+        if sprite is None:
+            sprite = AssetManager.load_surface(path, self.sprite_size, "alpha")
+        return sprite
 
-            action_path = action_paths
-            cache_key = f"{self.base_name}_{action}"
-        
-     
-        if cache_key in self.action_sprites:
+    def _resolveActionFrames(self, action):
 
-            self.sprite = self.action_sprites[cache_key]
-            return
-        
-       
-        if action_path:
+        action_paths = self._getActionImagePath(self.base_name, action)
+        if not action_paths:
+            return (self.base_sprite,)
+        if not isinstance(action_paths, list):
+            action_paths = [action_paths]
+
+        frames = []
+        for action_path in action_paths:
             try:
-                original_image = pygame.image.load(action_path).convert_alpha()
-                sprite = pygame.transform.scale(original_image, self.sprite_size)
-                self.action_sprites[cache_key] = sprite  
-                self.sprite = sprite
-                Logger.debug("CaracterView.updateCharacterSprite", 
-                           f"Sprite updated for action: {action}", base_name=self.base_name)
+                frames.append(self._loadFrame(action_path))
             except Exception as e:
-                Logger.error("CaracterView.updateCharacterSprite", e)
-        else:
-           
-            self.sprite = self._loadSpriteForPath(self.base_image_path)
+                Logger.error("CaracterView._resolveActionFrames", e)
+                frames.append(self.base_sprite)
+        return tuple(frames)
 
-    def _loadSpriteForPath(self, path):
-      
-        try:
-            original_image = pygame.image.load(path).convert_alpha()
-            return pygame.transform.scale(original_image, self.sprite_size)
-        except Exception as e:
-            Logger.error("CaracterView._loadSpriteForPath", e)
-            sprite = pygame.Surface(self.sprite_size)
-            sprite.fill((255, 0, 255))
-            return sprite
+    def _buildActionFrames(self):
+
+        # Every action the character can play, resolved once to its
+        # pre-scaled frames; updateCharacterSprite only indexes into this.
+        self.action_frames = {}
+        if not self.base_name:
+            return
+
+        actions = set(self.DEFAULT_ACTIONS.get(self.base_name, {}))
+        actions.update(self._getBossActions(self.base_name))
+        if self.character_config and 'actions' in self.character_config:
+            actions.update(self.character_config['actions'])
+
+        for action in actions:
+            self.action_frames[action] = self._resolveActionFrames(action)
+        Logger.debug("CaracterView._buildActionFrames", "Action frames resolved",
+                     base_name=self.base_name, actions=len(self.action_frames))
+
+    def updateCharacterSprite(self, character):
+       
+        if not self.base_name:
+            return  
+        
+        action = character.getCurrentAction()
+        frames = self.action_frames.get(action)
+        if frames is None:
+            # Action missing from every config: resolve it once and keep it.
+            frames = self._resolveActionFrames(action)
+            self.action_frames[action] = frames
 
+        self.sprite = frames[(self.animation_frame // self.animation_speed) % len(frames)]
 
     def drawCaracter(self, screen, caracter, offset=(0, 0), is_map=False):
       
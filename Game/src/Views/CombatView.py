@@ -1,7 +1,10 @@
 import pygame
 import math
 from Utils.Logger import Logger
+from Utils.TextCache import TextCache
 from Views.InventoryView import InventoryView
+from Utils.FontRegistry import FontRegistry
+from Utils.AssetManager import AssetManager
 
 
 class CombatView:
@@ -15,19 +18,19 @@ class CombatView:
                         width=screen_width, height=screen_height)
             
             try:
-                self.title_font = pygame.font.SysFont("Arial", max(20, int(screen_height * 0.0254)), bold=True)
-                self.font = pygame.font.SysFont("Arial", max(15, int(screen_height * 0.0153)), bold=True)
+                self.title_font = FontRegistry.get_sys_font("Arial", max(20, int(screen_height * 0.0254)), bold=True)
+                self.font = FontRegistry.get_sys_font("Arial", max(15, int(screen_height * 0.0153)), bold=True)
 
-                self.small_font = pygame.font.SysFont("Arial", max(12, int(screen_height * 0.0141)))
-                self.log_font = pygame.font.SysFont("Courier New", max(13, int(screen_height * 0.0128)))
+                self.small_font = FontRegistry.get_sys_font("Arial", max(12, int(screen_height * 0.0141)))
+                self.log_font = FontRegistry.get_sys_font("Courier New", max(13, int(screen_height * 0.0128)))
                 Logger.debug("CombatView.__init__", "Fonts initialized")
             except Exception as e:
 
                 Logger.error("CombatView.__init__", e)
-                self.title_font = pygame.font.Font(None, 40)
-                self.font = pygame.font.Font(None, 20)
-                self.small_font = pygame.font.Font(None, 18)
-                self.log_font = pygame.font.Font(None, 16)
+                self.title_font = FontRegistry.get_font(None, 40)
+                self.font = FontRegistry.get_font(None, 20)
+                self.small_font = FontRegistry.get_font(None, 18)
+                self.log_font = FontRegistry.get_font(None, 16)
             
             self.bg_color = (20, 15, 30)
             self.panel_color = (40, 30, 50)
@@ -45,8 +48,7 @@ class CombatView:
             self.background_image = None
             try:
 
-                bg_img = pygame.image.load(background_image_path).convert()
-                self.background_image = pygame.transform.scale(bg_img, (screen_width, screen_height))
+                self.background_image = AssetManager.load_surface(background_image_path, (screen_width, screen_height), "convert")
                 Logger.debug("CombatView.__init__", "Background image loaded", path=background_image_path)
             except FileNotFoundError:
                 Logger.debug("CombatView.__init__", "Background image not found, using gradient", path=background_image_path)
@@ -165,8 +167,8 @@ class CombatView:
     def drawTitle(self, screen, combat_model):
 
         title_text = "COMBAT"
-        title_surf = self.title_font.render(title_text, True, self.gold_color)
-        title_shadow = self.title_font.render(title_text, True, (0, 0, 0))
+        title_surf = TextCache.render(self.title_font, title_text, True, self.gold_color)
+        title_shadow = TextCache.render(self.title_font, title_text, True, (0, 0, 0))
         
         title_x = self.screen_width // 2 - title_surf.get_width() // 2
         title_y = 10
@@ -175,7 +177,7 @@ class CombatView:
         screen.blit(title_surf, (title_x, title_y))
         
         turn_text = f"Turn {combat_model.getTurn()}"
-        turn_surf = self.font.render(turn_text, True, (200, 200, 200))
+        turn_surf = TextCache.render(self.font, turn_text, True, (200, 200, 200))
         screen.blit(turn_surf, (self.screen_width // 2 - turn_surf.get_width() // 2, title_y + title_surf.get_height() + 5))
 
 
@@ -223,7 +225,7 @@ class CombatView:
         content_height = name_h + spacing + hp_h + spacing + drunk_h + spacing + stats_h + spacing + effects_h
         start_y = panel_y + (panel_height - content_height) // 2
 
-        name_surf = self.title_font.render(player.getName(), True, self.player_color)
+        name_surf = TextCache.render(self.title_font, player.getName(), True, self.player_color)
         screen.blit(name_surf, (panel_x + 16, start_y))
 
         hp_y = start_y + name_h + spacing
@@ -241,7 +243,7 @@ class CombatView:
         stats_text = f"Damage: {player.getDamage()} | Accuracy: {int(player.getAccuracy() * 100)}%"
 
 
-        stats_surf = self.small_font.render(stats_text, True, (200, 200, 200))
+        stats_surf = TextCache.render(self.small_font, stats_text, True, (200, 200, 200))
         screen.blit(stats_surf, (panel_x + 16, stats_y))
 
         self.drawStatusEffects(screen, panel_x + 16, stats_y + stats_h + spacing, combat_model, is_player=True)
@@ -266,7 +268,7 @@ class CombatView:
 
 
 
-        enemy_name_surf = self.title_font.render(enemy.getName(), True, self.enemy_color)
+        enemy_name_surf = TextCache.render(self.title_font, enemy.getName(), True, self.enemy_color)
         screen.blit(enemy_name_surf, (enemy_panel_x + panel_width - enemy_name_surf.get_width() - 16, start_y))
 
         enemy_hp_y = start_y + name_h + spacing
@@ -275,7 +277,7 @@ class CombatView:
 
         enemy_stats_y = enemy_hp_y + hp_h + spacing
         enemy_stats_text = f"Damage: {enemy.getDamage()} | Accuracy: {int(enemy.getAccuracy() * 100)}%"
-        enemy_stats_surf = self.small_font.render(enemy_stats_text, True, (200, 200, 200))
+        enemy_stats_surf = TextCache.render(self.small_font, enemy_stats_text, True, (200, 200, 200))
         screen.blit(enemy_stats_surf, (enemy_panel_x + 16, enemy_stats_y))
 
         self.drawStatusEffects(screen, enemy_panel_x + 16, enemy_stats_y + stats_h + spacing, combat_model, is_player=False)
@@ -289,7 +291,7 @@ class CombatView:
         pygame.draw.rect(screen, color, (x, y, filled_width, height), border_radius=8)
         pygame.draw.rect(screen, (100, 100, 100), (x, y, width, height), 2, border_radius=8)
         hp_text = f"{label}: {current}/{maximum}"
-        text_surf = self.font.render(hp_text, True, (255, 255, 255))
+        text_surf = TextCache.render(self.font, hp_text, True, (255, 255, 255))
         text_x = x + width // 2 - text_surf.get_width() // 2
         text_y = y + height // 2 - text_surf.get_height() // 2
 
@@ -306,7 +308,7 @@ class CombatView:
         filled_width = int(width * ratio)
         pygame.draw.rect(screen, color, (x, y, filled_width, height), border_radius=6)
         pygame.draw.rect(screen, (80, 80, 80), (x, y, width, height), 2, border_radius=6)
-        text_surf = self.small_font.render(label, True, (255, 255, 255))
+        text_surf = TextCache.render(self.small_font, label, True, (255, 255, 255))
         text_x = x + width // 2 - text_surf.get_width() // 2
         text_y = y + height // 2 - text_surf.get_height() // 2
         screen.blit(text_surf, (text_x, text_y))
@@ -335,7 +337,7 @@ class CombatView:
                 status_effects.append(f"Disgusted ({combat_model.getEnemyStatus('disgusted')})")
         
         for i, effect in enumerate(status_effects):
-            effect_surf = self.small_font.render(effect, True, (255, 200, 0))
+            effect_surf = TextCache.render(self.small_font, effect, True, (255, 200, 0))
             screen.blit(effect_surf, (x, y + i * 25))
 
 
@@ -352,7 +354,7 @@ class CombatView:
 
         self.drawPanel(screen, log_x, log_y, log_width, log_height, (100, 150, 100))
 
-        title_surf = self.font.render("Battle Log", True, (150, 255, 150))
+        title_surf = TextCache.render(self.font, "Battle Log", True, (150, 255, 150))
         screen.blit(title_surf, (log_x + 15, log_y + 8))
 
         messages = combat_model.getCombatLog() or []
@@ -388,7 +390,7 @@ class CombatView:
                 else:
                     text_color = (220, 220, 220)
 
-                msg_surf = self.log_font.render(line, True, text_color)
+                msg_surf = TextCache.render(self.log_font, line, True, text_color)
                 screen.blit(msg_surf, (inner_rect.x, start_y - msg_surf.get_height()))
                 start_y -= line_height
             except Exception as e:
@@ -407,7 +409,7 @@ class CombatView:
 
             for word in words:
                 test_line = current_line + (" " if current_line else "") + word
-                test_surf = self.log_font.render(test_line, True, (255, 255, 255))
+                test_surf = TextCache.render(self.log_font, test_line, True, (255, 255, 255))
 
                 if test_surf.get_width() <= max_width:
                     current_line = test_line
@@ -436,7 +438,7 @@ class CombatView:
 
         self.drawPanel(screen, menu_x, menu_y, menu_width, menu_height, (100, 255, 100))
 
-        title_surf = self.font.render("ACTIONS", True, (150, 255, 150))
+        title_surf = TextCache.render(self.font, "ACTIONS", True, (150, 255, 150))
         screen.blit(title_surf, (menu_x + 20, menu_y + 10))
 
         pygame.draw.line(
@@ -461,13 +463,13 @@ class CombatView:
 
         action_y = menu_y + 50
         for key, name, desc, key_color in actions:
-            key_surf = self.font.render(f"[{key}]", True, key_color)
+            key_surf = TextCache.render(self.font, f"[{key}]", True, key_color)
             screen.blit(key_surf, (menu_x + 15, action_y))
 
-            name_surf = self.small_font.render(name, True, (255, 255, 255))
+            name_surf = TextCache.render(self.small_font, name, True, (255, 255, 255))
             screen.blit(name_surf, (menu_x + 45, action_y))
 
-            desc_surf = self.log_font.render(desc, True, (200, 200, 200))
+            desc_surf = TextCache.render(self.log_font, desc, True, (200, 200, 200))
             screen.blit(desc_surf, (menu_x + 45, action_y + 18))
 
             pygame.draw.line(
@@ -481,7 +483,7 @@ class CombatView:
             action_y += 55
 
         if combat_model.isPlayerTurn():
-            hint_surf = self.font.render("Press KEY to act", True, (150, 200, 150))
+            hint_surf = TextCache.render(self.font, "Press KEY to act", True, (150, 200, 150))
             hint_x = menu_x + menu_width // 2 - hint_surf.get_width() // 2
             screen.blit(hint_surf, (hint_x, menu_y + menu_height + 15))
 
@@ -502,7 +504,7 @@ class CombatView:
 
         scale = 1 + math.sin(self.time * 0.1) * 0.1
 
-        indicator_surf = self.title_font.render(text, True, color)
+        indicator_surf = TextCache.render(self.title_font, text, True, color)
         scaled_width = int(indicator_surf.get_width() * scale)
         scaled_height = int(indicator_surf.get_height() * scale)
         indicator_surf = pygame.transform.scale(indicator_surf, (scaled_width, scaled_height))
@@ -510,7 +512,7 @@ class CombatView:
         indicator_x = self.screen_width // 2 - scaled_width // 2
         indicator_y = 150
 
-        shadow_surf = self.title_font.render(text, True, (0, 0, 0))
+        shadow_surf = TextCache.render(self.title_font, text, True, (0, 0, 0))
         shadow_surf = pygame.transform.scale(shadow_surf, (scaled_width, scaled_height))
         screen.blit(shadow_surf, (indicator_x + 3, indicator_y + 3))
 
@@ -546,8 +548,8 @@ class CombatView:
 
 
             try:
-                msg_surf = self.title_font.render(message, True, color)
-                msg_shadow = self.title_font.render(message, True, (0, 0, 0))
+                msg_surf = TextCache.render(self.title_font, message, True, color)
+                msg_shadow = TextCache.render(self.title_font, message, True, (0, 0, 0))
 
                 msg_x = self.screen_width // 2 - msg_surf.get_width() // 2
                 msg_y = self.screen_height // 2 - 100
@@ -559,7 +561,7 @@ class CombatView:
 
             try:
                 if sub_message:
-                    sub_surf = self.font.render(sub_message, True, (255, 255, 255))
+                    sub_surf = TextCache.render(self.font, sub_message, True, (255, 255, 255))
                     sub_x = self.screen_width // 2 - sub_surf.get_width() // 2
                     screen.blit(sub_surf, (sub_x, msg_y + 80))
             except Exception as e:
@@ -569,7 +571,7 @@ class CombatView:
 
             try:
                 instruction = "Press SPACE to continue"
-                inst_surf = self.small_font.render(instruction, True, (200, 200, 200))
+                inst_surf = TextCache.render(self.small_font, instruction, True, (200, 200, 200))
                 inst_x = self.screen_width // 2 - inst_surf.get_width() // 2
                 screen.blit(inst_surf, (inst_x, msg_y + 150))
             except Exception as e:
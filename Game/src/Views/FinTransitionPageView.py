@@ -2,11 +2,12 @@ import pygame
 from Views.PageView import PageView
 from Controllers.GameState import GameState
 from Utils.Logger import Logger
+from Utils.FontRegistry import FontRegistry
 
 
 class FinTransitionPageView(PageView):
     
-    def __init__(self, screen, message="Stage Complete!", next_stage_name="Next Stage", duration_seconds=5):
+    def __init__(self, screen, message="Stage Complete!", next_stage_name="Next Stage", duration_seconds=5, sequence_controller=None):
         try:
             screen_width = screen.get_width()
             screen_height = screen.get_height()
@@ -16,6 +17,7 @@ class FinTransitionPageView(PageView):
             self.screen = screen
             self.message = message
             self.next_stage_name = next_stage_name
+            self.sequence_controller = sequence_controller
 
 
             self.duration_seconds = duration_seconds
@@ -40,6 +42,10 @@ class FinTransitionPageView(PageView):
             clock = pygame.time.Clock()
             running = True
 
+            # The screen only waits, so use it to load the next stage.
+            if self.sequence_controller and self.screen:
+                self.sequence_controller.preload_next_stage(self.screen.get_size())
+
             Logger.debug(
                 "FinTransitionPageView.run",
                 "Transition loop started",
@@ -123,9 +129,9 @@ class FinTransitionPageView(PageView):
 
                             try:
 
-                                font_main = pygame.font.SysFont("Arial", 60, bold=True)
+                                font_main = FontRegistry.get_sys_font("Arial", 60, bold=True)
                             except Exception:
-                                font_main = pygame.font.Font(None, 60)
+                                font_main = FontRegistry.get_font(None, 60)
 
                             text_main = font_main.render(
                                 self.message, True, (100, 255, 100)
@@ -141,9 +147,9 @@ class FinTransitionPageView(PageView):
                             self.screen.blit(text_main, text_rect)
 
                             try:
-                                font_sub = pygame.font.SysFont("Arial", 32)
+                                font_sub = FontRegistry.get_sys_font("Arial", 32)
                             except Exception:
-                                font_sub = pygame.font.Font(None, 32)
+                                font_sub = FontRegistry.get_font(None, 32)
 
                             text_sub = font_sub.render(
                                 f"Next: {self.next_stage_name}",
@@ -163,9 +169,9 @@ class FinTransitionPageView(PageView):
                             self.screen.blit(text_sub, sub_rect)
 
                             try:
-                                font_hint = pygame.font.SysFont("Arial", 18)
+                                font_hint = FontRegistry.get_sys_font("Arial", 18)
                             except Exception:
-                                font_hint = pygame.font.Font(None, 18)
+                                font_hint = FontRegistry.get_font(None, 18)
 
 
                             time_remaining = max(
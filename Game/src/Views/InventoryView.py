@@ -1,4 +1,6 @@
 import pygame
+from Utils.TextCache import TextCache
+from Utils.FontRegistry import FontRegistry
 
 
 class InventoryView:
@@ -7,8 +9,8 @@ class InventoryView:
         self.screen_width = screen_width
         self.screen_height = screen_height
 
-        self.font = pygame.font.SysFont("Arial", int(screen_height * 0.015), bold=True)
-        self.big_font = pygame.font.SysFont("Arial", int(screen_height * 0.022), bold=True)
+        self.font = FontRegistry.get_sys_font("Arial", int(screen_height * 0.015), bold=True)
+        self.big_font = FontRegistry.get_sys_font("Arial", int(screen_height * 0.022), bold=True)
 
 
 
@@ -61,22 +63,24 @@ class InventoryView:
                 border_radius=8,
             )
 
-            title_surf = self.big_font.render("INVENTORY", True, (200, 200, 255))
+            title_surf = TextCache.render(self.big_font, "INVENTORY", True, (200, 200, 255))
             screen.blit(title_surf, (x - title_surf.get_width() // 2, y + 5))
 
             count_text = f"{bottle_name} x{bottle_count}"
-            name_surf = self.big_font.render(count_text, True, (255, 215, 0))
+            name_surf = TextCache.render(self.big_font, count_text, True, (255, 215, 0))
             screen.blit(name_surf, (x - name_surf.get_width() // 2, y + 25))
 
 
-            alcohol_txt = self.font.render(
+            alcohol_txt = TextCache.render(
+                self.font,
                 f"Alc: {bottle_alcohol}% | Dmg: +{bottle_damage}",
                 True,
                 (200, 200, 200),
             )
             screen.blit(alcohol_txt, (x - alcohol_txt.get_width() // 2, y + 48))
 
-            nav_txt = self.font.render(
+            nav_txt = TextCache.render(
+                self.font,
                 f"<- {selected_index + 1}/{len(unique_bottles)} ->",
                 True,
                 (200, 200, 200),
@@ -96,10 +100,10 @@ class InventoryView:
             if not unique_bottles:
                 return
 
-            small_font = pygame.font.SysFont(
+            small_font = FontRegistry.get_sys_font(
                 "Arial", int(self.screen_height * 0.018), bold=True
             )
-            small_title_font = pygame.font.SysFont(
+            small_title_font = FontRegistry.get_sys_font(
                 "Arial", int(self.screen_height * 0.022), bold=True
 
             )
@@ -125,7 +129,8 @@ class InventoryView:
                 border_radius=10,
             )
 
-            title_surf = small_title_font.render(
+            title_surf = TextCache.render(
+                small_title_font,
 
                 "INVENTORY", True, (200, 200, 255)
             )
@@ -138,7 +143,8 @@ class InventoryView:
                 bottle_name = bottle_info["name"]
                 count = bottle_info["count"]
 
-                text_surf = small_font.render(
+                text_surf = TextCache.render(
+                    small_font,
                     f"{bottle_name}: x{count}", True, (255, 215, 0)
                 )
                 screen.blit(text_surf, (adjusted_x + 12, current_y))
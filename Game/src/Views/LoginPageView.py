@@ -6,6 +6,7 @@ from Models.LoginModel import LoginModel
 from Views.PageView import PageView
 from Views.ButtonView import ButtonView
 from Controllers.ButtonController import ButtonController
+from Utils.FontRegistry import FontRegistry
 
 
 class LoginPageView(PageView):
@@ -39,9 +40,9 @@ class LoginPageView(PageView):
             self.buttons = {}
             self.setup_buttons()
             
-            self.font_large = pygame.font.Font(None, 36)
-            self.font_medium = pygame.font.Font(None, 24)
-            self.font_small = pygame.font.Font(None, 18)
+            self.font_large = FontRegistry.get_font(None, 36)
+            self.font_medium = FontRegistry.get_font(None, 24)
+            self.font_small = FontRegistry.get_font(None, 18)
             
             self.color_text = (255, 255, 255)
             self.color_input_bg = (40, 40, 40)
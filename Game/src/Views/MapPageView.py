@@ -15,6 +15,9 @@ from Models.TileModel import TileModel
 from Models.BottleModel import BottleModel
 from Utils.Logger import Logger
 from Utils.AssetManager import AssetManager
+from Utils.AssetPreloader import AssetPreloader
+from Utils.TextCache import TextCache
+from Utils.FontRegistry import FontRegistry
 from Controllers.GameState import GameState
 import random
 
@@ -51,7 +54,8 @@ class MapPageView(PageView):
             try:
                 tmx_path = "Game/Assets/maps/map.tmx"
                 try:
-                    self.map = MapModel(tmx_path, [], None)
+                    # The preloader only parses; tilesets are converted here.
+                    self.map = MapModel(tmx_path, [], None, AssetPreloader.take(("map", tmx_path)))
                     Logger.debug("MapPageView.__init__", "TMX Map loaded", path=tmx_path)
                 except Exception as e:
                     Logger.error("MapPageView.__init__", e)
@@ -73,11 +77,10 @@ class MapPageView(PageView):
             try:
                 player_config = None
                 try:
-                    asset_manager = AssetManager()
-                    player_config = asset_manager.load_player_config()
-                    Logger.debug("MapPageView.__init__", f"Successfully loaded player_config with {len(player_config.get('actions', {}))} actions")
+                    player_config = AssetManager.shared().load_player_config()
+                    Logger.debug("MapPageView.__init__", "Successfully loaded player_config with %d actions", len(player_config.get('actions', {})))
                 except Exception as e:
-                    Logger.debug("MapPageView.__init__", f"Failed to load player_config: {e}")
+                    Logger.debug("MapPageView.__init__", "Failed to load player_config: %s", e)
 
 
                     player_config = None
@@ -95,10 +98,10 @@ class MapPageView(PageView):
                         spawn_x = chosen_spawn.get('x', 0) + chosen_spawn.get('width', 0) // 2
                         spawn_y = chosen_spawn.get('y', 0) + chosen_spawn.get('height', 0) // 2
                         Logger.debug("MapPageView.__init__", 
-                                   f"Using spawn point from TMX: ({spawn_x}, {spawn_y})", 
+                                   "Using spawn point from TMX: (%s, %s)", spawn_x, spawn_y, 
                                    spawn_name=chosen_spawn.get('name', 'unnamed'))
                 except Exception as e:
-                    Logger.debug("MapPageView.__init__", f"No valid spawn points in TMX: {e}")
+                    Logger.debug("MapPageView.__init__", "No valid spawn points in TMX: %s", e)
                     spawn_x, spawn_y = None, None
                 
                 if spawn_x is None or spawn_y is None:
@@ -113,16 +116,16 @@ class MapPageView(PageView):
 
                             spawn_y = int(map_height * v_offset / 100)
                             Logger.debug("MapPageView.__init__", 
-                                       f"Using player_config fallback position: ({spawn_x}, {spawn_y})")
+                                       "Using player_config fallback position: (%s, %s)", spawn_x, spawn_y)
                         else:
                             spawn_x = map_width // 2
                             spawn_y = map_height // 2
                             Logger.debug("MapPageView.__init__", 
-                                       f"No spawn config found, using map center: ({spawn_x}, {spawn_y})")
+                                       "No spawn config found, using map center: (%s, %s)", spawn_x, spawn_y)
                     except Exception as e:
                         spawn_x = map_width // 2
                         spawn_y = map_height // 2
-                        Logger.debug("MapPageView.__init__", f"Error getting spawn position: {e}")
+                        Logger.debug("MapPageView.__init__", "Error getting spawn position: %s", e)
 
 
                 
@@ -160,13 +163,12 @@ class MapPageView(PageView):
                 raise
             
             try:
-                try:
-                    asset_manager = AssetManager()
-                    player_config = asset_manager.load_player_config()
-                    Logger.debug("MapPageView.__init__", f"Successfully loaded player_config with {len(player_config.get('actions', {}))} actions")
-                except Exception as e:
-                    Logger.error("MapPageView.__init__", f"Failed to load player_config: {e}")
-                    player_config = None
+                if player_config is None:
+                    try:
+                        player_config = AssetManager.shared().load_player_config()
+                    except Exception as e:
+                        Logger.error("MapPageView.__init__", f"Failed to load player_config: {e}")
+                        player_config = None
                 self.player_view = CaracterView("Game/Assets/lola.png", base_name="lola", 
                                                sprite_size=(64, 64),
 
@@ -486,6 +488,12 @@ class MapPageView(PageView):
             clock = pygame.time.Clock()
             running = True
             transition_triggered = False
+
+            # Maps hand over to the next stage without a transition screen,
+            # so its assets are queued while the map is played.
+            if self.sequence_controller and self.screen:
+                self.sequence_controller.preload_next_stage(self.screen.get_size())
+
             Logger.debug("MapPageView.run", "Map page loop started", current_act=self.current_act)
             
             while running:
@@ -838,9 +846,9 @@ class MapPageView(PageView):
                                     if -50 < shop_center[0] < screen_w + 50 and -50 < shop_center[1] < screen_h + 50:
                                         try:
                                             try:
-                                                font = pygame.font.SysFont('Arial', 12, bold=True)
+                                                font = FontRegistry.get_sys_font('Arial', 12, bold=True)
                                             except Exception:
-                                                font = pygame.font.Font(None, 12)
+                                                font = FontRegistry.get_font(None, 12)
                                             if is_drink:
                                                 label_text = 'OPEN'
                                                 label_color = (100, 255, 100)
@@ -859,7 +867,7 @@ class MapPageView(PageView):
                                 except Exception as e:
                                     Logger.error("MapPageView.run.shop_marker", e)
                             
-                            Logger.debug("MapPageView.run", "Shop markers drawn", total_shops=len(self.shops))
+                            Logger.trace("MapPageView.run", "Shop markers drawn", total_shops=len(self.shops))
                         except Exception as e:
                             Logger.error("MapPageView.debugPositions", e)
 
@@ -882,9 +890,9 @@ class MapPageView(PageView):
 
                             if getattr(self, 'show_debug_overlay', False):
                                 try:
-                                    font = pygame.font.SysFont('Consolas', 14)
+                                    font = FontRegistry.get_sys_font('Consolas', 14)
                                 except Exception:
-                                    font = pygame.font.Font(None, 14)
+                                    font = FontRegistry.get_font(None, 14)
                                 lines = []
                                 lines.append(f'tile_size={self.map.tile_size} map={getattr(self.map, "width",None)}x{getattr(self.map,"height",None)}')
                                 lines.append(f'map_pixels={len(self.map.tiles[0])*self.map.tile_size}x{len(self.map.tiles)*self.map.tile_size}')
@@ -952,15 +960,15 @@ class MapPageView(PageView):
     def drawTransitionPrompt(self):
         try:
             try:
-                font = pygame.font.SysFont("Arial", 24, bold=True)
-                small_font = pygame.font.SysFont("Arial", 18)
+                font = FontRegistry.get_sys_font("Arial", 24, bold=True)
+                small_font = FontRegistry.get_sys_font("Arial", 18)
             except Exception as e:
 
 
 
                 Logger.error("MapPageView.drawTransitionPrompt", e)
-                font = pygame.font.Font(None, 24)
-                small_font = pygame.font.Font(None, 18)
+                font = FontRegistry.get_font(None, 24)
+                small_font = FontRegistry.get_font(None, 18)
             
 
             if self.current_act == 1:
@@ -1015,12 +1023,12 @@ class MapPageView(PageView):
     def drawShopPrompt(self):
         try:
             try:
-                font = pygame.font.SysFont("Arial", 24, bold=True)
-                small_font = pygame.font.SysFont("Arial", 18)
+                font = FontRegistry.get_sys_font("Arial", 24, bold=True)
+                small_font = FontRegistry.get_sys_font("Arial", 18)
             except Exception as e:
                 Logger.error("MapPageView.drawShopPrompt", e)
-                font = pygame.font.Font(None, 24)
-                small_font = pygame.font.Font(None, 18)
+                font = FontRegistry.get_font(None, 24)
+                small_font = FontRegistry.get_font(None, 18)
 
             prompt_width = 300
             prompt_height = 80
@@ -1114,7 +1122,7 @@ class MapPageView(PageView):
                 except Exception:
                     pass
                 try:
-                    door_font = pygame.font.SysFont("Arial", 12)
+                    door_font = FontRegistry.get_sys_font("Arial", 12)
                     door_text = door_font.render("E", True, (255, 255, 255))
                     self.screen.blit(door_text, (door_rect_screen.x + (door_rect_screen.width - door_text.get_width())//2, door_rect_screen.y - door_text.get_height() - 2))
                 except Exception:
@@ -1127,10 +1135,10 @@ class MapPageView(PageView):
     def _drawLevelDisplay(self):
         try:
             level = self.lola.getLevel() if hasattr(self.lola, 'getLevel') else 1
-            font = pygame.font.Font(None, 36)
+            font = FontRegistry.get_font(None, 36)
 
 
-            level_text = font.render(f"LEVEL {level}", True, (0, 255, 0))
+            level_text = TextCache.render(font, f"LEVEL {level}", True, (0, 255, 0))
             text_x = 20
             text_y = self.screen.get_height() - 50
 
@@ -1140,7 +1148,7 @@ class MapPageView(PageView):
             self.screen.blit(level_text, (text_x, text_y))
             try:
                 alcohol = self.lola.getDrunkenness() if hasattr(self.lola, 'getDrunkenness') else 0
-                alcohol_text = font.render(f"Alcohol: {alcohol}%", True, (0, 255, 0))
+                alcohol_text = TextCache.render(font, f"Alcohol: {alcohol}%", True, (0, 255, 0))
 
 
 
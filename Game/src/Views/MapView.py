@@ -1,9 +1,14 @@
 import pygame
+from collections import OrderedDict
 from Utils.Logger import Logger
+from Models.TileLayerModel import TileLayerModel
 
 
 class MapView:
 
+    CHUNK_SIZE = 512
+    MAX_CACHED_CHUNKS = 48
+
     def __init__(self, map):
         try:
 
@@ -15,6 +20,10 @@ class MapView:
                 tile_count=len(map.tiles) if hasattr(map, "tiles") else 0,
             )
             self._scaled_tile_cache = {}
+            self._chunk_cache = OrderedDict()
+            self._chunk_revision = None
+            self._chunks_enabled = True
+            self._prebakeChunks()
         except Exception as e:
             Logger.error("MapView.__init__", e)
 
@@ -25,181 +34,314 @@ class MapView:
 
 
 
-    def draw(self, screen, offset=(0, 0)):
+    def _layersToDraw(self):
+        if hasattr(self.map, "layer_ordered") and isinstance(
+            self.map.layer_ordered, list
+
+        ):
+            return [
+                layer_matrix for _name, layer_matrix in self.map.layer_ordered
+            ]
+        elif hasattr(self.map, "layers") and isinstance(
+            self.map.layers, dict
+        ):
+            return [self.map.tiles]
+
+
+
+
+        else:
+            return [self.map.tiles]
+
+    def _layerSize(self, layer):
+        if isinstance(layer, TileLayerModel):
+            return layer.getHeight(), layer.getWidth()
+        return len(layer), max((len(row) for row in layer), default=0)
+
+    def _mapPixelSize(self):
+        tile_size = max(1, int(self.map.tile_size))
+        tiles = self.map.tiles if hasattr(self.map, "tiles") else []
+        rows, cols = self._layerSize(tiles)
+        return cols * tile_size, rows * tile_size
+
+    def _getScaledTile(self, tile, tile_size, flip_flags):
+        image = self.map.tile_kinds[tile].image
+
+
+        if not isinstance(image, pygame.Surface):
+            raise TypeError("tile image not a Surface")
+
+        cache_key = (id(image), tile_size, flip_flags)
+        scaled = self._scaled_tile_cache.get(cache_key)
+
+        if scaled is None:
+            try:
+
+
+                w, h = image.get_size()
+                if (w, h) != (tile_size, tile_size):
+                    scaled = pygame.transform.scale(image, (tile_size, tile_size))
+                else:
+
+                    scaled = image
+
+                flip_h = bool(flip_flags & 1)
+                flip_v = bool(flip_flags & 2)
+
+                if flip_h or flip_v:
+                    scaled = pygame.transform.flip(scaled, flip_h, flip_v)
+            except Exception:
+                scaled = image
+
+            self._scaled_tile_cache[cache_key] = scaled
+
+        return scaled
+
+    def _drawPlaceholder(self, target, tile, location, tile_size, x, y):
         try:
-            offset_x, offset_y = offset
+            if not hasattr(self, "_unknown_gids"):
+                self._unknown_gids = set()
+
+            if tile not in self._unknown_gids:
+                self._unknown_gids.add(tile)
+                Logger.debug(
+                    "MapView.draw",
+                    "Unknown tile type, drawing placeholder",
+                    tile=tile,
+
+
+                    position=(x, y),
+                )
+
+            if isinstance(tile, int):
+                color = (
+                    (tile * 37) % 256,
+                    (tile * 61) % 256,
+                    (tile * 97) % 256,
+                )
+            else:
+                color = (150, 0, 150)
+
+            pygame.draw.rect(
+                target,
+                color,
+                (location[0], location[1], tile_size, tile_size),
+            )
+
+        except Exception as e:
+            Logger.error("MapView.draw.placeholder", e)
 
+    def _drawTile(self, target, tile, x, y, location, tile_size):
+        flip_flags = 0
+        if isinstance(tile, int):
+            flip_flags = TileLayerModel.decodeFlipFlags(tile)
+            tile = tile & TileLayerModel.GID_MASK
+
+        if tile in self.map.tile_kinds:
             try:
-                if hasattr(self.map, "layer_ordered") and isinstance(
-                    self.map.layer_ordered, list
+                scaled = self._getScaledTile(tile, tile_size, flip_flags)
+                target.blit(scaled, location)
 
-                ):
-                    layers_to_draw = [
-                        layer_matrix for _name, layer_matrix in self.map.layer_ordered
-                    ]
-                elif hasattr(self.map, "layers") and isinstance(
-                    self.map.layers, dict
-                ):
-                    layers_to_draw = [self.map.tiles]
+            except Exception as e:
+                Logger.error("MapView.draw.blit", e)
+                pygame.draw.rect(
+                    target,
+                    (120, 0, 120),
+                    (location[0], location[1], tile_size, tile_size),
+                )
 
 
 
 
-                else:
-                    layers_to_draw = [self.map.tiles]
+        else:
+            self._drawPlaceholder(target, tile, location, tile_size, x, y)
+
+    def _visibleTileRange(self, screen, offset, layer):
+        try:
+            offset_x, offset_y = offset
+            tile_size = max(1, int(self.map.tile_size))
+            rows, cols = self._layerSize(layer)
+
+            screen_w, screen_h = screen.get_size()
+
+            col_start = max(0, int(-offset_x) // tile_size)
+            row_start = max(0, int(-offset_y) // tile_size)
+            col_end = min(cols, (int(-offset_x) + screen_w) // tile_size + 1)
+            row_end = min(rows, (int(-offset_y) + screen_h) // tile_size + 1)
+
+            return row_start, max(row_start, row_end), col_start, max(col_start, col_end)
+        except Exception as e:
+            Logger.error("MapView._visibleTileRange", e)
+            rows, cols = self._layerSize(layer) if layer else (0, 0)
+            return 0, rows, 0, cols
 
-                for layer in layers_to_draw:
-                    for y, row in enumerate(layer):
-                        for x, tile in enumerate(row):
-                            try:
-                                if not tile:
-                                    continue
+    def _visibleChunkRange(self, screen, offset):
+        offset_x, offset_y = offset
+        map_w, map_h = self._mapPixelSize()
+        screen_w, screen_h = screen.get_size()
+        chunk = self.CHUNK_SIZE
 
-                                location = (
-                                    x * self.map.tile_size + offset_x,
+        chunks_x = (map_w + chunk - 1) // chunk
+        chunks_y = (map_h + chunk - 1) // chunk
 
-                                    y * self.map.tile_size + offset_y,
-                                )
-                                tile_size = self.map.tile_size
+        cx_start = max(0, int(-offset_x) // chunk)
+        cy_start = max(0, int(-offset_y) // chunk)
+        cx_end = min(chunks_x, (int(-offset_x) + screen_w) // chunk + 1)
+        cy_end = min(chunks_y, (int(-offset_y) + screen_h) // chunk + 1)
 
-                                flip_flags = 0
-                                if hasattr(self.map, "tile_flips"):
-                                    try:
-                                        flip_flags = self.map.tile_flips[y][x]
-                                    except (IndexError, TypeError):
-                                        flip_flags = 0
+        return cx_start, cx_end, cy_start, cy_end
 
+    def _currentRevision(self):
+        return (getattr(self.map, "revision", 0), self.map.tile_size)
 
+    def invalidateChunks(self):
+        try:
+            self._chunk_cache.clear()
+            self._scaled_tile_cache.clear()
+            self._chunk_revision = self._currentRevision()
+            Logger.debug("MapView.invalidateChunks", "Chunk cache cleared", revision=self._chunk_revision)
+        except Exception as e:
+            Logger.error("MapView.invalidateChunks", e)
 
+    def _renderChunk(self, cx, cy):
+        chunk = self.CHUNK_SIZE
+        tile_size = max(1, int(self.map.tile_size))
+        chunk_left = cx * chunk
+        chunk_top = cy * chunk
 
+        surface = pygame.Surface((chunk, chunk), pygame.SRCALPHA, 32)
+        try:
+            surface = surface.convert_alpha()
+        except Exception:
+            pass
+        surface.fill((0, 0, 0, 0))
+
+        col_start = chunk_left // tile_size
+        row_start = chunk_top // tile_size
+        col_end = (chunk_left + chunk + tile_size - 1) // tile_size
+        row_end = (chunk_top + chunk + tile_size - 1) // tile_size
+
+        for layer in self._layersToDraw():
+            for y in range(row_start, min(row_end, len(layer))):
+                row = layer[y]
+                for x in range(col_start, min(col_end, len(row))):
+                    try:
+                        tile = row[x]
+                        if not tile:
+                            continue
+                        location = (
+                            x * tile_size - chunk_left,
+                            y * tile_size - chunk_top,
+                        )
+                        self._drawTile(surface, tile, x, y, location, tile_size)
+                    except Exception as e:
+                        Logger.error("MapView._renderChunk.tile", e)
+                        continue
+
+        return surface
+
+    def _getChunk(self, cx, cy):
+        key = (cx, cy)
+        surface = self._chunk_cache.get(key)
+        if surface is not None:
+            self._chunk_cache.move_to_end(key)
+            return surface
+
+        surface = self._renderChunk(cx, cy)
+        self._chunk_cache[key] = surface
+        while len(self._chunk_cache) > self.MAX_CACHED_CHUNKS:
+            self._chunk_cache.popitem(last=False)
+        return surface
+
+    def _prebakeChunks(self):
+        try:
+            self._chunk_revision = self._currentRevision()
+            map_w, map_h = self._mapPixelSize()
+            chunk = self.CHUNK_SIZE
+            chunks_x = (map_w + chunk - 1) // chunk
+            chunks_y = (map_h + chunk - 1) // chunk
+
+            baked = 0
+            for cy in range(chunks_y):
+                for cx in range(chunks_x):
+                    if baked >= self.MAX_CACHED_CHUNKS:
+                        break
+                    self._getChunk(cx, cy)
+                    baked += 1
 
-                                if tile in self.map.tile_kinds:
-                                    image = self.map.tile_kinds[tile].image
-                                    try:
+            Logger.debug(
+                "MapView._prebakeChunks",
+                "Static map layers baked into chunks",
+                chunks=baked,
+                grid=(chunks_x, chunks_y),
+                chunk_size=chunk,
+            )
+        except Exception as e:
+            Logger.error("MapView._prebakeChunks", e)
+            self._chunk_cache.clear()
+            self._chunks_enabled = False
+
+    def _drawChunks(self, screen, offset):
+        if self._chunk_revision != self._currentRevision():
+            self.invalidateChunks()
+
+        offset_x, offset_y = offset
+        chunk = self.CHUNK_SIZE
+        cx_start, cx_end, cy_start, cy_end = self._visibleChunkRange(screen, offset)
+
+        blits = []
+        for cy in range(cy_start, cy_end):
+            for cx in range(cx_start, cx_end):
+                blits.append(
+                    (
+                        self._getChunk(cx, cy),
+                        (cx * chunk + offset_x, cy * chunk + offset_y),
+                    )
+                )
+        screen.blits(blits, doreturn=False)
+
+    def _drawTiles(self, screen, offset):
+        offset_x, offset_y = offset
+
+        for layer in self._layersToDraw():
+            row_start, row_end, col_start, col_end = self._visibleTileRange(
+                screen, offset, layer
+            )
+            tile_size = self.map.tile_size
+            for y in range(row_start, row_end):
+                row = layer[y]
+                for x in range(col_start, min(col_end, len(row))):
+                    try:
+                        tile = row[x]
+                        if not tile:
+                            continue
+
+                        location = (
+                            x * tile_size + offset_x,
+
+                            y * tile_size + offset_y,
+                        )
+                        self._drawTile(screen, tile, x, y, location, tile_size)
+
+                    except Exception as e:
+                        Logger.error(
+                            "MapView.draw.tile", e
+                        )
+                        continue
 
+    def draw(self, screen, offset=(0, 0)):
+        try:
+            if self._chunks_enabled:
+                try:
+                    self._drawChunks(screen, offset)
+                    return
+                except Exception as e:
+                    Logger.error("MapView.draw.chunks", e)
+                    self._chunks_enabled = False
+                    self._chunk_cache.clear()
 
-                                        if not isinstance(image, pygame.Surface):
-                                            raise TypeError(
-                                                "tile image not a Surface"
-                                            )
-
-                                        cache_key = (
-                                            id(image),
-                                            tile_size,
-                                            flip_flags,
-                                        )
-                                        scaled = self._scaled_tile_cache.get(
-                                            cache_key
-                                        )
-
-                                        if scaled is None:
-                                            try:
-
-
-                                                w, h = image.get_size()
-                                                if (w, h) != (
-                                                    tile_size,
-                                                    tile_size,
-                                                ):
-                                                    scaled = pygame.transform.scale(
-                                                        image,
-                                                        (tile_size, tile_size),
-                                                    )
-                                                else:
-
-                                                    scaled = image
-
-                                                flip_h = bool(flip_flags & 1)
-                                                flip_v = bool(flip_flags & 2)
-
-                                                if flip_h or flip_v:
-                                                    scaled = pygame.transform.flip(
-                                                        scaled,
-
-
-                                                        flip_h,
-                                                        flip_v,
-                                                    )
-                                            except Exception:
-                                                scaled = image
-
-                                            self._scaled_tile_cache[
-                                                cache_key
-                                            ] = scaled
-
-                                        screen.blit(scaled, location)
-
-                                    except Exception as e:
-                                        Logger.error(
-                                            "MapView.draw.blit", e
-                                        )
-                                        rect = (
-                                            location[0],
-                                            location[1],
-                                            tile_size,
-                                            tile_size,
-                                        )
-                                        pygame.draw.rect(
-                                            screen,
-                                            (120, 0, 120),
-                                            rect,
-                                        )
-
-
-
-
-                                else:
-                                    try:
-                                        if not hasattr(
-                                            self, "_unknown_gids"
-                                        ):
-                                            self._unknown_gids = set()
-
-                                        if tile not in self._unknown_gids:
-                                            self._unknown_gids.add(tile)
-                                            Logger.debug(
-                                                "MapView.draw",
-                                                "Unknown tile type, drawing placeholder",
-                                                tile=tile,
-
-
-                                                position=(x, y),
-                                            )
-
-                                        if isinstance(tile, int):
-                                            color = (
-                                                (tile * 37) % 256,
-                                                (tile * 61) % 256,
-                                                (tile * 97) % 256,
-                                            )
-                                        else:
-                                            color = (150, 0, 150)
-
-                                        rect = (
-                                            location[0],
-                                            location[1],
-                                            tile_size,
-                                            
-                                            tile_size,
-                                        )
-                                        pygame.draw.rect(
-                                            screen,
-                                            color,
-                                            rect,
-                                        )
-
-                                    except Exception as e:
-                                        Logger.error(
-                                            "MapView.draw.placeholder",
-                                            e,
-                                        )
-
-                            except Exception as e:
-                                Logger.error(
-                                    "MapView.draw.tile", e
-                                )
-                                continue
-
+            try:
+                self._drawTiles(screen, offset)
             except Exception as e:
                 Logger.error("MapView.draw", e)
 
@@ -1,6 +1,7 @@
 import pygame
 import os
 from Utils.Logger import Logger
+from Utils.AssetManager import AssetManager
 
 
 class PageView:
@@ -36,7 +37,7 @@ class PageView:
             self.height = height
             self.resizable = RESIZABLE if RESIZABLE else pygame.RESIZABLE
             self.backgroud_image = backgroud_image
-            self._original_background = None
+            self._has_background_image = False
 
             try:
                 existing = pygame.display.get_surface()
@@ -83,10 +84,12 @@ class PageView:
                 ):
                     
                     try:
-                        self._original_background = pygame.image.load(self.backgroud_image)
-                        self.background = pygame.transform.scale(
-                            self._original_background, (self.width, self.height)
+                        self.background = AssetManager.load_surface(
+                            self.backgroud_image, (self.width, self.height)
                         )
+                        # Only the scaled variant is loaded: it can come from the
+                        # disk cache, so a cold start skips the PNG decode.
+                        self._has_background_image = True
                         Logger.debug(
                             "PageView.__init__",
 
@@ -95,7 +98,7 @@ class PageView:
                         )
                     except Exception as e:
                         Logger.error("PageView.__init__", e)
-                        self._original_background = None
+                        self._has_background_image = False
                         self.background = pygame.Surface((self.width, self.height))
 
 
@@ -105,7 +108,7 @@ class PageView:
                             "Using default black background due to load failure",
                         )
                 else:
-                    self._original_background = None
+                    self._has_background_image = False
                     self.background = pygame.Surface((self.width, self.height))
 
                     self.background.fill((0, 0, 0))
@@ -118,7 +121,7 @@ class PageView:
 
             except Exception as e:
                 Logger.error("PageView.__init__", e)
-                self._original_background = None
+                self._has_background_image = False
                 self.background = pygame.Surface((self.width, self.height))
                 self.background.fill((0, 0, 0))
 
@@ -135,9 +138,11 @@ class PageView:
             self.height = new_height
 
 
-            if self._original_background is not None:
-                self.background = pygame.transform.scale(
-                    self._original_background, (new_width, new_height)
+            if self._has_background_image:
+                # Same cache as __init__: going back to a window size seen
+                # before (fullscreen toggles, page switches) skips the scale.
+                self.background = AssetManager.load_surface(
+                    self.backgroud_image, (new_width, new_height)
                 )
                 Logger.debug(
 
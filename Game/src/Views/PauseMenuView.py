@@ -4,6 +4,7 @@ from Controllers.ButtonController import ButtonController
 from Controllers.PauseMenuController import PauseMenuController
 from Controllers.GameState import GameState
 from Views.ButtonView import ButtonView
+from Utils.FontRegistry import FontRegistry
 
 
 class PauseMenuView:
@@ -139,16 +140,16 @@ class PauseMenuView:
                 self.logout_button = None
 
             try:
-                self.title_font = pygame.font.SysFont(
+                self.title_font = FontRegistry.get_sys_font(
                     "Arial", 72, bold=True
                 )
-                self.button_font = pygame.font.SysFont(
+                self.button_font = FontRegistry.get_sys_font(
                     "Arial", 36, bold=True
                 )
             except Exception as e:
                 Logger.error("PauseMenuView.__init__", e)
-                self.title_font = pygame.font.Font(None, 72)
-                self.button_font = pygame.font.Font(None, 36)
+                self.title_font = FontRegistry.get_font(None, 72)
+                self.button_font = FontRegistry.get_font(None, 36)
 
             try:
                 self.controller = PauseMenuController(
@@ -352,7 +353,7 @@ class PauseMenuView:
 
 
 
-                    font = pygame.font.SysFont("Arial", 18)
+                    font = FontRegistry.get_sys_font("Arial", 18)
                     text_surf = font.render(
                         self.logout_button_text,
                         True,
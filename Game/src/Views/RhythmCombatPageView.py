@@ -6,6 +6,7 @@ from Controllers.GameState import GameState
 from Controllers.GameSequenceController import GameSequenceController
 from Models.RhythmModel import RhythmModel
 from Utils.Logger import Logger
+from Utils.InputStamper import InputStamper
 from Utils.AssetManager import AssetManager
 from Songs.TheFinalCountdown import load_final_countdown
 
@@ -160,13 +161,14 @@ class RhythmCombatPageView:
     def run(self):
         try:
             clock = pygame.time.Clock()
+            InputStamper.reset()
             running = True
 
             Logger.debug("RhythmCombatPageView.run", "Rhythm combat loop started")
 
             while running:
                 try:
-                    for event in pygame.event.get():
+                    for event in InputStamper.get_events():
                         if event.type == pygame.QUIT:
                             return GameState.QUIT.value
 
@@ -249,7 +251,7 @@ class RhythmCombatPageView:
                     except Exception as e:
                         Logger.error("RhythmCombatPageView.run", e)
 
-                    clock.tick(60)
+                    InputStamper.wait_frame(clock, 60)
 
                 except Exception as e:
                     Logger.error("RhythmCombatPageView.run", e)
@@ -286,6 +288,7 @@ class RhythmCombatPageView:
                         message="Stage Complete!",
                         next_stage_name="Continued Adventure",
                         duration_seconds=5,
+                        sequence_controller=self.sequence_controller,
                     )
                     transition.run()
 
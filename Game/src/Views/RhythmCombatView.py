@@ -2,6 +2,10 @@ import pygame
 import math
 from Views.CaracterView import CaracterView
 from Utils.AssetManager import AssetManager
+from Utils.NoteSpriteAtlas import NoteSpriteAtlas
+from Utils.ParticleSystem import ParticleSystem
+from Utils.TextCache import TextCache
+from Utils.FontRegistry import FontRegistry
 
 
 class RhythmCombatView:
@@ -27,8 +31,7 @@ class RhythmCombatView:
 
         image_path = background_image_path
         try:
-            loaded_img = pygame.image.load(image_path).convert()
-            self.background_image = pygame.transform.scale(loaded_img, (screen_width, screen_height))
+            self.background_image = AssetManager.load_surface(image_path, (screen_width, screen_height), "convert")
 
             self.overlay = pygame.Surface((screen_width, screen_height))
             self.overlay.fill((0, 0, 0))
@@ -36,16 +39,16 @@ class RhythmCombatView:
         except FileNotFoundError:
             pass
 
-        self.font = pygame.font.SysFont("Arial", int(self.game_height * 0.0158), bold=True)
-        self.big_font = pygame.font.SysFont("Arial", int(self.game_height * 0.047), bold=True)
-        self.combo_font = pygame.font.SysFont("Arial", int(self.game_height * 0.0315), bold=True)
+        self.font = FontRegistry.get_sys_font("Arial", int(self.game_height * 0.0158), bold=True)
+        self.big_font = FontRegistry.get_sys_font("Arial", int(self.game_height * 0.047), bold=True)
+        self.combo_font = FontRegistry.get_sys_font("Arial", int(self.game_height * 0.0315), bold=True)
 
 
-        self.title_font = pygame.font.SysFont("Arial", int(self.game_height * 0.021), bold=True)
-        self.huge_font = pygame.font.SysFont("Arial", int(self.game_height * 0.21), bold=True)
+        self.title_font = FontRegistry.get_sys_font("Arial", int(self.game_height * 0.021), bold=True)
+        self.huge_font = FontRegistry.get_sys_font("Arial", int(self.game_height * 0.21), bold=True)
 
         try:
-            asset_manager = AssetManager()
+            asset_manager = AssetManager.shared()
             player_config = asset_manager.load_player_config()
         except Exception:
             player_config = None
@@ -84,38 +87,24 @@ class RhythmCombatView:
         self.guitar_start = self.game_offset_x + int(guitar_start)
         self.guitar_width = int(guitar_width)
 
-        self.particles = []
+        self.particles = ParticleSystem()
         self.time = 0
 
+        self._playfield = None
+        self._playfield_key = None
+        self._hud_bg = None
+        self._countdown_overlay = None
 
 
 
 
 
-    def create_particles(self, x, y, color):
-        for i in range(12):
-            angle = pygame.math.Vector2(1, 0).rotate(i * 30)
-            self.particles.append({
-                "x": x,
-                "y": y,
-                "vx": angle.x * 4,
-                "vy": angle.y * 4,
-                "life": 25,
-                "color": color,
-            })
-
-
-
 
+    def create_particles(self, x, y, color):
+        self.particles.emit(x, y, color)
 
     def update_particles(self):
-        for particle in self.particles[:]:
-            particle["x"] += particle["vx"]
-            particle["y"] += particle["vy"]
-            particle["vy"] += 0.3
-            particle["life"] -= 1
-            if particle["life"] <= 0:
-                self.particles.remove(particle)
+        self.particles.update()
 
 
 
@@ -147,10 +136,10 @@ class RhythmCombatView:
 
         pygame.draw.rect(screen, (100, 100, 100), (x, y, width, height), 2, border_radius=6)
 
-        label_surf = self.font.render(label, True, (255, 255, 255))
+        label_surf = TextCache.render(self.font, label, True, (255, 255, 255))
         screen.blit(label_surf, (x, y - 20))
 
-        hp_text = self.font.render(f"{int(current)}/{int(maximum)}", True, (255, 255, 255))
+        hp_text = TextCache.render(self.font, f"{int(current)}/{int(maximum)}", True, (255, 255, 255))
 
         screen.blit(
             hp_text,
@@ -158,19 +147,21 @@ class RhythmCombatView:
              y + height // 2 - hp_text.get_height() // 2),
         )
 
-    def draw(self, screen, rhythm_model, player_model, boss_model, note_speed=0.5, countdown_val=0):
-        self.time += 1
-
-
+    def _build_playfield(self, hit_line_y):
+        surface = pygame.Surface((self.screen_width, self.screen_height))
+        try:
+            surface = surface.convert()
+        except pygame.error:
+            pass
 
         if self.background_image:
-            screen.blit(self.background_image, (0, 0))
-            screen.blit(self.overlay, (0, 0))
+            surface.blit(self.background_image, (0, 0))
+            surface.blit(self.overlay, (0, 0))
         else:
             for y in range(self.screen_height):
                 shade = int(20 + y * 0.02)
                 pygame.draw.line(
-                    screen,
+                    surface,
                     (shade, shade // 2, shade // 3),
                     (0, y),
                     (self.screen_width, y),
@@ -204,14 +195,13 @@ class RhythmCombatView:
                 (i, guitar_rect.height),
             )
 
-        screen.blit(guitar_surf, guitar_rect)
-        pygame.draw.rect(screen, (80, 120, 180), guitar_rect, 2, border_radius=10)
+        surface.blit(guitar_surf, guitar_rect)
+        pygame.draw.rect(surface, (80, 120, 180), guitar_rect, 2, border_radius=10)
 
 
-        hit_line_y = rhythm_model.hit_line_y
 
         pygame.draw.line(
-            screen,
+            surface,
             (200, 200, 200),
             (self.guitar_start - 15, hit_line_y),
             (self.guitar_start + self.guitar_width + 15, hit_line_y),
@@ -228,68 +218,70 @@ class RhythmCombatView:
 
 
             pygame.draw.line(
-                screen,
+                surface,
                 (color[0] // 3, color[1] // 3, color[2] // 3),
                 (x, self.game_offset_y),
                 (x, self.game_offset_y + self.game_height),
                 2,
             )
 
-            pygame.draw.circle(screen, (0, 0, 0), (x, hit_line_y), 32)
-            pygame.draw.circle(screen, color, (x, hit_line_y), 30, 4)
+            pygame.draw.circle(surface, (0, 0, 0), (x, hit_line_y), 32)
+            pygame.draw.circle(surface, color, (x, hit_line_y), 30, 4)
 
 
 
-            pygame.draw.circle(screen, (255, 255, 0), (x, hit_line_y), 18, 2)
-            pygame.draw.circle(screen, (255, 255, 255), (x, hit_line_y), 5)
+            pygame.draw.circle(surface, (255, 255, 0), (x, hit_line_y), 18, 2)
+            pygame.draw.circle(surface, (255, 255, 255), (x, hit_line_y), 5)
+
+        return surface
+
+    def _get_playfield(self, hit_line_y):
+        key = (self.screen_width, self.screen_height, hit_line_y)
+        if self._playfield is None or self._playfield_key != key:
+            self._playfield = self._build_playfield(hit_line_y)
+            self._playfield_key = key
+        return self._playfield
+
+    def draw(self, screen, rhythm_model, player_model, boss_model, note_speed=0.5, countdown_val=0):
+        self.time += 1
 
-        for note in rhythm_model.notes:
-            if note["active"]:
-                lane_index = rhythm_model.lanes.index(note["lane"])
-                x_pos = self.lane_x[lane_index]
-                color = self.lane_colors[lane_index]
-                y_pos = int(note["y"])
 
-                duration = note.get("duration", 0)
 
+        hit_line_y = rhythm_model.hit_line_y
+        screen.blit(self._get_playfield(hit_line_y), (0, 0))
+
+        note_atlas = NoteSpriteAtlas.get(self.lane_colors, self.screen_height + 200)
+        note_blits = []
+        for note in rhythm_model.get_visible_notes():
+            if note.active:
+                lane_index = note.lane_index
+                x_pos = self.lane_x[lane_index]
+                y_pos = int(note.y)
 
+                duration = note.duration
                 tail_len = 20 + int(note_speed * 10)
                 if duration > 0:
                     tail_len = int(duration * note_speed)
 
-                tail_surf = pygame.Surface((14, tail_len), pygame.SRCALPHA)
-                tail_surf.fill((*color, 150))
-                screen.blit(tail_surf, (x_pos - 7, y_pos - tail_len))
+                note_blits.append(note_atlas.tail(lane_index, x_pos, y_pos, tail_len))
+                note_blits.append(note_atlas.head(lane_index, x_pos, y_pos))
+        screen.blits(note_blits, doreturn=False)
 
-                pygame.draw.circle(screen, (255, 255, 255), (x_pos, y_pos), 26)
-                pygame.draw.circle(screen, color, (x_pos, y_pos), 22)
-                pygame.draw.circle(screen, (0, 0, 0), (x_pos, y_pos), 10)
 
 
-
-        for particle in self.particles:
-            size = int(particle["life"] / 3)
-            if size > 0:
-                surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(
-                    surf,
-                    (*particle["color"], 200),
-                    (size, size),
-                    size,
-                )
-                screen.blit(surf, (particle["x"] - size, particle["y"] - size))
-
+        self.particles.draw(screen)
         self.update_particles()
 
 
 
         hud_h = int(self.screen_height * 0.10)
-        hud_bg = pygame.Surface((self.screen_width, hud_h), pygame.SRCALPHA)
-        hud_bg.fill((10, 10, 20, 220))
-        screen.blit(hud_bg, (0, 0))
+        if self._hud_bg is None or self._hud_bg.get_height() != hud_h:
+            self._hud_bg = pygame.Surface((self.screen_width, hud_h), pygame.SRCALPHA)
+            self._hud_bg.fill((10, 10, 20, 220))
+        screen.blit(self._hud_bg, (0, 0))
         pygame.draw.line(screen, (255, 50, 50), (0, hud_h), (self.screen_width, hud_h), 3)
 
-        combat_title = self.title_font.render("COMBAT RHYTHM", True, (255, 215, 0))
+        combat_title = TextCache.render(self.title_font, "COMBAT RHYTHM", True, (255, 215, 0))
         screen.blit(combat_title, (self.screen_width // 2 - combat_title.get_width() // 2, 5))
 
        
@@ -301,7 +293,7 @@ class RhythmCombatView:
             total_hits = getattr(rhythm_model, 'total_hits', 0)
             base_hit_cash = total_hits * 2  
             display_cash = base_hit_cash * (level + 1)
-            cash_text = self.font.render(f"CASH: ${display_cash}", True, (100, 200, 255))
+            cash_text = TextCache.render(self.font, f"CASH: ${display_cash}", True, (100, 200, 255))
             screen.blit(cash_text, (self.screen_width//2 - cash_text.get_width()//2, int(hud_h * 0.5)))
         except Exception as e:
             pass
@@ -374,8 +366,8 @@ class RhythmCombatView:
             elif "DMG" in rhythm_model.feedback:
                 fb_col = (255, 100, 100)
             
-            fb_surf = self.big_font.render(rhythm_model.feedback, True, fb_col)
-            fb_shadow = self.big_font.render(rhythm_model.feedback, True, (0, 0, 0))
+            fb_surf = TextCache.render(self.big_font, rhythm_model.feedback, True, fb_col)
+            fb_shadow = TextCache.render(self.big_font, rhythm_model.feedback, True, (0, 0, 0))
             
             fb_x = self.screen_width//2 - fb_surf.get_width()//2
             fb_y = self.screen_height//2
@@ -385,8 +377,8 @@ class RhythmCombatView:
             
            
             if rhythm_model.combo > 1:
-                combo_surf = self.combo_font.render(f"COMBO x{rhythm_model.combo}", True, (255, 100, 255))
-                combo_shadow = self.combo_font.render(f"COMBO x{rhythm_model.combo}", True, (100, 0, 100))
+                combo_surf = TextCache.render(self.combo_font, f"COMBO x{rhythm_model.combo}", True, (255, 100, 255))
+                combo_shadow = TextCache.render(self.combo_font, f"COMBO x{rhythm_model.combo}", True, (100, 0, 100))
                 
                 combo_x = self.screen_width//2 - combo_surf.get_width()//2
                 combo_y = fb_y + 80
@@ -398,8 +390,8 @@ class RhythmCombatView:
         
         keys = ["C", "V", "B", "N"]
         for i, x in enumerate(self.lane_x):
-            txt = self.title_font.render(keys[i], True, self.lane_colors[i])
-            shadow = self.title_font.render(keys[i], True, (0, 0, 0))
+            txt = TextCache.render(self.title_font, keys[i], True, self.lane_colors[i])
+            shadow = TextCache.render(self.title_font, keys[i], True, (0, 0, 0))
             
             txt_x = x - txt.get_width()//2
             txt_y = self.screen_height - 40
@@ -425,7 +417,7 @@ class RhythmCombatView:
 
 
                 try:
-                    asset_manager = AssetManager()
+                    asset_manager = AssetManager.shared()
                     boss_config = asset_manager.get_boss_by_name("Manager Corrompu")
                     print(f"[INFO] RhythmCombatView: Successfully loaded boss_config for Manager Corrompu")
                 except Exception as e:
@@ -452,7 +444,7 @@ class RhythmCombatView:
          
            
             level = player_model.getLevel() if hasattr(player_model, 'getLevel') else 1
-            level_text = self.font.render(f"LEVEL {level}", True, (100, 255, 100))
+            level_text = TextCache.render(self.font, f"LEVEL {level}", True, (100, 255, 100))
             screen.blit(level_text, (20, self.screen_height - 50))
             
 
@@ -460,27 +452,28 @@ class RhythmCombatView:
          
             alcohol = player_model.getDrunkenness() if hasattr(player_model, 'getDrunkenness') else 0
             alcohol_color = (255, 100, 100) if alcohol > 60 else (100, 255, 100)
-            alcohol_text = self.font.render(f"ALCOHOL: {alcohol}%", True, alcohol_color)
+            alcohol_text = TextCache.render(self.font, f"ALCOHOL: {alcohol}%", True, alcohol_color)
             screen.blit(alcohol_text, (self.screen_width - alcohol_text.get_width() - 20, self.screen_height - 50))
         except Exception as e:
             pass
 
 
         if countdown_val > 0:
-            over = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            over.fill((0, 0, 0, 150))
-            screen.blit(over, (0, 0))
+            if self._countdown_overlay is None:
+                self._countdown_overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+                self._countdown_overlay.fill((0, 0, 0, 150))
+            screen.blit(self._countdown_overlay, (0, 0))
             
             col = (100, 255, 100) if countdown_val > 3 else ((255, 200, 0) if countdown_val > 1 else (255, 50, 50))
             
-            ready = self.title_font.render("PRÊT POUR LE COMBAT ?", True, (255, 255, 255))
+            ready = TextCache.render(self.title_font, "PRÊT POUR LE COMBAT ?", True, (255, 255, 255))
             screen.blit(ready, (self.screen_width//2 - ready.get_width()//2, self.screen_height//2 - 150))
             
 
 
 
-            nb = self.huge_font.render(str(countdown_val), True, col)
-            nb_shadow = self.huge_font.render(str(countdown_val), True, (0, 0, 0))
+            nb = TextCache.render(self.huge_font, str(countdown_val), True, col)
+            nb_shadow = TextCache.render(self.huge_font, str(countdown_val), True, (0, 0, 0))
             
             nb_x = self.screen_width//2 - nb.get_width()//2
             nb_y = self.screen_height//2 - nb.get_height()//2
@@ -9,10 +9,12 @@ from Views.CaracterView import CaracterView
 from Views.PauseMenuView import PauseMenuView
 from Views.FinTransitionPageView import FinTransitionPageView
 from Utils.Logger import Logger
+from Utils.InputStamper import InputStamper
 from Utils.AssetManager import AssetManager
 from Controllers.GameSequenceController import GameSequenceController
 from Songs.SevenNationArmy import load_seven_nation_army
 from Songs.AnotherOneBitesTheDust import load_another_one
+from Utils.FontRegistry import FontRegistry
 
 class RhythmPageView:
     
@@ -71,10 +73,10 @@ class RhythmPageView:
             
             try:
                 self.rhythm_model = RhythmModel()
-                asset_manager = AssetManager()
+                asset_manager = AssetManager.shared()
                 try:
                     player_config = asset_manager.load_player_config()
-                    Logger.debug("RhythmPageView.__init__", f"Successfully loaded player_config with {len(player_config.get('actions', {}))} actions")
+                    Logger.debug("RhythmPageView.__init__", "Successfully loaded player_config with %d actions", len(player_config.get('actions', {})))
                 except Exception as e:
                     Logger.error("RhythmPageView.__init__", f"Failed to load player_config: {e}")
                     player_config = None
@@ -130,13 +132,14 @@ class RhythmPageView:
     def run(self):
         try:
             clock = pygame.time.Clock()
+            InputStamper.reset()
             running = True
             Logger.debug("RhythmPageView.run", "Rhythm page loop started")
             
             while running:
 
                 try:
-                    for event in pygame.event.get():
+                    for event in InputStamper.get_events():
                         if event.type == pygame.QUIT:
                             Logger.debug("RhythmPageView.run", "QUIT event received")
                             return GameState.QUIT.value
@@ -337,7 +340,7 @@ class RhythmPageView:
                         Logger.error("RhythmPageView.run", e)
                     
                     pygame.display.flip()
-                    clock.tick(60)
+                    InputStamper.wait_frame(clock, 60)
                     
                 except Exception as e:
                     Logger.error("RhythmPageView.run", e)
@@ -359,7 +362,7 @@ class RhythmPageView:
 
 
                                total_notes=len(self.rhythm_model.notes),
-                               active_notes=len([n for n in self.rhythm_model.notes if n.get("active", False)]))
+                               active_notes=len([n for n in self.rhythm_model.notes if n.active]))
                     
                     if is_victory:
                         Logger.debug("RhythmPageView.run", "Rhythm sequence won - showing transition")
@@ -373,7 +376,8 @@ class RhythmPageView:
                             next_stage_name="Next Chapter",
 
 
-                            duration_seconds=5
+                            duration_seconds=5,
+                            sequence_controller=self.sequence_controller
                         )
                         
                         Logger.debug("RhythmPageView.run", "FinTransitionPageView created, calling run()")
@@ -447,7 +451,7 @@ class RhythmPageView:
             if not self.rhythm_model:
                 return True
             
-            active_notes = [n for n in self.rhythm_model.notes if n.get("active", False)]
+            active_notes = [n for n in self.rhythm_model.notes if n.active]
 
             if self.rhythm_model.crowd_satisfaction <= 0:
                 Logger.debug("RhythmPageView.isRhythmComplete", "Game over - crowd satisfaction too low", 
@@ -485,10 +489,10 @@ class RhythmPageView:
                     font_size = int(self.screen_height * 0.105)
                 else:
                     font_size = int(self.screen_height * 0.126)
-                countdown_font = pygame.font.SysFont("Arial", font_size, bold=True)
+                countdown_font = FontRegistry.get_sys_font("Arial", font_size, bold=True)
             except Exception as e:
                 Logger.error("RhythmPageView.drawCountdown", e)
-                countdown_font = pygame.font.Font(None, 100)
+                countdown_font = FontRegistry.get_font(None, 100)
             try:
                 countdown_surf = countdown_font.render(countdown_text, True, (255, 215, 0))
                 countdown_shadow = countdown_font.render(countdown_text, True, (100, 80, 0))
@@ -511,14 +515,14 @@ class RhythmPageView:
                 Logger.error("RhythmPageView.draw_intro", e)
             
             try:
-                title_font = pygame.font.SysFont("Arial", int(self.screen_height * 0.0462), bold=True)
-                text_font = pygame.font.SysFont("Arial", int(self.screen_height * 0.0348))
-                small_font = pygame.font.SysFont("Arial", int(self.screen_height * 0.0139))
+                title_font = FontRegistry.get_sys_font("Arial", int(self.screen_height * 0.0462), bold=True)
+                text_font = FontRegistry.get_sys_font("Arial", int(self.screen_height * 0.0348))
+                small_font = FontRegistry.get_sys_font("Arial", int(self.screen_height * 0.0139))
             except Exception as e:
                 Logger.error("RhythmPageView.draw_intro", e)
-                title_font = pygame.font.Font(None, 48)
-                text_font = pygame.font.Font(None, 36)
-                small_font = pygame.font.Font(None, 14)
+                title_font = FontRegistry.get_font(None, 48)
+                text_font = FontRegistry.get_font(None, 36)
+                small_font = FontRegistry.get_font(None, 14)
             
             try:
                 title_text = "FINAL RHYTHM SEQUENCE"
@@ -2,6 +2,8 @@
 import pygame
 from Utils.Logger import Logger
 from Views.InventoryView import InventoryView
+from Utils.FontRegistry import FontRegistry
+from Utils.AssetManager import AssetManager
 
 
 
@@ -21,8 +23,7 @@ class ShopPageView:
                         width=self.screen_width, height=self.screen_height)
             
             try:
-                self.background = pygame.image.load('Game/Assets/Shop.png')
-                self.background = pygame.transform.scale(self.background, (self.screen_width, self.screen_height))
+                self.background = AssetManager.load_surface('Game/Assets/Shop.png', (self.screen_width, self.screen_height))
                 Logger.debug("ShopPageView.__init__", "Background image loaded")
             except FileNotFoundError as e:
                 Logger.error("ShopPageView.__init__", e)
@@ -34,14 +35,14 @@ class ShopPageView:
                 raise
             
             try:
-                self.title_font = pygame.font.SysFont("Arial", 48, bold=True)
-                self.item_font = pygame.font.SysFont("Arial", 24)
-                self.small_font = pygame.font.SysFont("Arial", 18)
+                self.title_font = FontRegistry.get_sys_font("Arial", 48, bold=True)
+                self.item_font = FontRegistry.get_sys_font("Arial", 24)
+                self.small_font = FontRegistry.get_sys_font("Arial", 18)
             except Exception as e:
                 Logger.error("ShopPageView.__init__", e)
-                self.title_font = pygame.font.Font(None, 48)
-                self.item_font = pygame.font.Font(None, 24)
-                self.small_font = pygame.font.Font(None, 18)
+                self.title_font = FontRegistry.get_font(None, 48)
+                self.item_font = FontRegistry.get_font(None, 24)
+                self.small_font = FontRegistry.get_font(None, 18)
             
             try:
                 self.inventory_view = InventoryView(self.screen_width, self.screen_height)
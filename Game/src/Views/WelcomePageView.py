@@ -18,6 +18,10 @@ from Views.Act1View import Act1View
 from Views.Act2View import Act2View
 from Views.RhythmPageView import RhythmPageView
 from Views.RhythmCombatPageView import RhythmCombatPageView
+from Views.CalibrationPageView import CalibrationPageView
+from Utils.FontRegistry import FontRegistry
+from Utils.AssetPreloader import AssetPreloader
+from Utils.LatencyCalibration import LatencyCalibration
 
 
 class WelcomPageView(PageView):
@@ -100,14 +104,24 @@ class WelcomPageView(PageView):
             except Exception as e:
                 Logger.error("WelcomPageView.__init__", e)
                 raise
+
+            try:
+                calibration_y = logout_y + logout_size[1] + 5
+                self.calibration_button = pygame.Rect(logout_x - logout_size[0]//2, calibration_y - logout_size[1]//2, logout_size[0], logout_size[1])
+                self.calibration_button_text = "Calibration"
+                Logger.debug("WelcomPageView.__init__", "Calibration button created as simple rectangle")
+            except Exception as e:
+                Logger.error("WelcomPageView.__init__", e)
+                raise
             
             self.selected_stage = 1  
             Logger.debug("WelcomPageView.__init__", "Stage selector initialized", default_stage=self.selected_stage)
             
             self.music_playing = False
+            self.music_path = "Game/Assets/Sounds/Fake Youth - What's Left Demo 11.01.25.mp3"
             try:
                 pygame.mixer.init()
-                music_path = "Game/Assets/Sounds/Fake Youth - What's Left Demo 11.01.25.mp3"
+                music_path = self.music_path
                 pygame.mixer.music.load(music_path)
                 pygame.mixer.music.set_volume(0.6)  
                 Logger.debug("WelcomPageView.__init__", "Welcome music loaded successfully from", path=music_path)
@@ -142,6 +156,8 @@ class WelcomPageView(PageView):
             logout_x = int(self.width * 0.82)
             logout_y = quit_y + quit_size[1] // 2 + 5 + logout_size[1] // 2
             self.logout_button = pygame.Rect(logout_x - logout_size[0]//2, logout_y - logout_size[1]//2, logout_size[0], logout_size[1])
+            calibration_y = logout_y + logout_size[1] + 5
+            self.calibration_button = pygame.Rect(logout_x - logout_size[0]//2, calibration_y - logout_size[1]//2, logout_size[0], logout_size[1])
             
             Logger.debug("WelcomPageView._update_button_positions", "Button positions updated")
         except Exception as e:
@@ -186,6 +202,7 @@ class WelcomPageView(PageView):
         try:
             clock = pygame.time.Clock()
             running = True
+            LatencyCalibration.load(self.user_progression)
             Logger.debug("WelcomPageView.run", "Welcome page loop started")
             
             while running:
@@ -306,6 +323,14 @@ class WelcomPageView(PageView):
                                 "Logout button clicked - returning to login"
                             )
                             return GameState.LOGOUT.value
+                        if self.calibration_button.collidepoint(mouse_pos):
+                            Logger.debug(
+                                "WelcomPageView.handle_events",
+                                "Calibration button clicked"
+                            )
+                            if self._run_calibration() is False:
+                                return False
+                            continue
                 
                
                 for button_controller in self.buttons_controllers:
@@ -353,14 +378,24 @@ class WelcomPageView(PageView):
 
 
 
+    def _play_menu_music(self):
+        # The rhythm scenes stream their backing stem through
+        # pygame.mixer.music, so the menu track is loaded again each time.
+        pygame.mixer.music.load(self.music_path)
+        pygame.mixer.music.set_volume(0.6)
+        pygame.mixer.music.play(-1)
+        self.music_playing = True
+
+
+
+
     def update(self):
 
         try:
             
             if not self.music_playing:
                 try:
-                    pygame.mixer.music.play(-1) 
-                    self.music_playing = True
+                    self._play_menu_music()
                     Logger.debug("WelcomPageView.update", "Welcome music started playing")
                 except Exception as e:
                     Logger.error("WelcomPageView.update", f"Failed to play welcome music: {e}")
@@ -386,24 +421,26 @@ class WelcomPageView(PageView):
                 
                 
                 mouse_pos = pygame.mouse.get_pos()
-                if self.logout_button.collidepoint(mouse_pos):
-                    pygame.draw.rect(self.screen, logout_hover_color, self.logout_button, border_radius=5)
-                else:
-                    pygame.draw.rect(self.screen, logout_color, self.logout_button, border_radius=5)
-                
-                
-                pygame.draw.rect(self.screen, (255, 255, 255), self.logout_button, 2, border_radius=5)
-                
-               
-                font = pygame.font.SysFont("Arial", 20)
-                text_surf = font.render(self.logout_button_text, True, (255, 255, 255))
-                text_rect = text_surf.get_rect(center=self.logout_button.center)
-                self.screen.blit(text_surf, text_rect)
+                font = FontRegistry.get_sys_font("Arial", 20)
+                for rect, label in ((self.logout_button, self.logout_button_text),
+                                    (self.calibration_button, self.calibration_button_text)):
+                    if rect.collidepoint(mouse_pos):
+                        pygame.draw.rect(self.screen, logout_hover_color, rect, border_radius=5)
+                    else:
+                        pygame.draw.rect(self.screen, logout_color, rect, border_radius=5)
+                    
+                    
+                    pygame.draw.rect(self.screen, (255, 255, 255), rect, 2, border_radius=5)
+                    
+                   
+                    text_surf = font.render(label, True, (255, 255, 255))
+                    text_rect = text_surf.get_rect(center=rect.center)
+                    self.screen.blit(text_surf, text_rect)
             except Exception as e:
                 Logger.error("WelcomPageView.render - logout button", e)
             
             try:
-                small_font = pygame.font.SysFont("Arial", int(self.height * 0.02), italic=True)
+                small_font = FontRegistry.get_sys_font("Arial", int(self.height * 0.02), italic=True)
                 warning_text = "L'abus d'alcool est dangereux pour la santé"
                 warning_surf = small_font.render(warning_text, True, (200, 100, 100))
                 warning_x = self.width // 2 - warning_surf.get_width() // 2
@@ -413,7 +450,7 @@ class WelcomPageView(PageView):
                 Logger.error("WelcomPageView.render - warning text", e)
             
             try:
-                tiny_font = pygame.font.SysFont("Arial", int(self.height * 0.015))
+                tiny_font = FontRegistry.get_sys_font("Arial", int(self.height * 0.015))
                 login_text = f"Connecté: {self.current_user}"
                 if self.is_admin:
                     login_text += " (Admin - Cheats: 1-8, P)"
@@ -535,6 +572,7 @@ class WelcomPageView(PageView):
                 "completed_acts": [],
                 "completed_rhythms": []
             }
+            LatencyCalibration.store(progression)
             
             from Utils.UserManager import UserManager
             user_manager = UserManager()
@@ -560,6 +598,44 @@ class WelcomPageView(PageView):
 
 
 
+    def _run_calibration(self):
+        # Returns False when the window was closed during calibration.
+        try:
+            if self.music_playing:
+                # The audio test needs silence; update() restarts the music.
+                pygame.mixer.music.stop()
+                self.music_playing = False
+
+            result = CalibrationPageView(self.screen).run()
+            if result == GameState.QUIT.value:
+                return False
+            if not isinstance(result, dict):
+                return True
+
+            LatencyCalibration.set_offsets(result["audio_offset_ms"], result["visual_offset_ms"])
+            Logger.info("WelcomPageView._run_calibration", "Latency offsets calibrated",
+                        username=self.current_user, **result)
+
+            if self.current_user:
+                from Utils.UserManager import UserManager
+                user_manager = UserManager()
+                # Saved on top of what is on disk: self.user_progression is
+                # only the login snapshot.
+                progression = user_manager.load_progression(self.current_user) or self.user_progression or {}
+                LatencyCalibration.store(progression)
+                if user_manager.save_progression(self.current_user, progression):
+                    self.user_progression = progression
+            return True
+        except Exception as e:
+            Logger.error("WelcomPageView._run_calibration", e)
+            return True
+
+
+
+
+
+
+
     def _startGameFlow(self, starting_stage=0):
 
         try:
@@ -881,6 +957,8 @@ class WelcomPageView(PageView):
             raise
         finally:
             
+            AssetPreloader.clear()
+
             try:
                 if self.current_user:
                     self._save_player_progression(player, sequence_controller)
@@ -891,8 +969,7 @@ class WelcomPageView(PageView):
             try:
                 if not self.music_playing:
                     try:
-                        pygame.mixer.music.play(-1) 
-                        self.music_playing = True
+                        self._play_menu_music()
                         Logger.debug("WelcomPageView._startGameFlow", "Welcome music resumed on return to menu")
                     except Exception as e:
                         Logger.error("WelcomPageView._startGameFlow", f"Failed to resume welcome music: {e}")
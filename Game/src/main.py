@@ -3,6 +3,7 @@ import pygame
 from Views.LoginPageView import LoginPageView
 from Views.WelcomePageView import WelcomPageView
 from Utils.Logger import Logger
+from Utils.FontRegistry import FontRegistry
 from Controllers.GameState import GameState
 
 
@@ -19,6 +20,7 @@ def main():
             if not pygame.get_init():
                 pygame.init()
                 Logger.debug("main.main", "Pygame initialized")
+            FontRegistry.preload()
         except Exception as e:
             Logger.error("main.main", e)
             raise